@@ -8,8 +8,12 @@ from livekit.agents.types import AgentTranscriptionOptions
 import asyncio
 import re
 import logging
+from typing import Set
 from tools import execute_mcp_tool, MONDAY_BOARD_ID
 
+# Background MCP requests still running; kept so they aren't garbage collected mid-call
+_background_tasks: Set[asyncio.Task] = set()
+
 # Background MCP processor
 class MCPProcessor:
     @staticmethod
@@ -42,7 +46,9 @@ class MCPProcessor:
 async def process_user_input(session, user_input):
     """Process user input and trigger background MCP operations"""
     # Start background MCP processing (non-blocking)
-    asyncio.create_task(MCPProcessor.process_request_in_background(user_input))
+    task = asyncio.create_task(MCPProcessor.process_request_in_background(user_input))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
 
 load_dotenv()
 
@@ -5,41 +5,52 @@ from livekit.agents import AgentSession, Agent, RoomInputOptions
 from livekit.plugins import (
     noise_cancellation,
 )
-from livekit.plugins import google
 from prompts import AGENT_INSTRUCTION, SESSION_INSTRUCTION
-from tools import get_weather, search_web, send_email, create_monday_task, create_crm_task, list_monday_boards
+from tool_registry import get_tools, start_tool_prewarm
+from session_warmup import start_session_warmup
+from worker_prewarm import prewarm_process, realtime_model, record_job_ready
+from tracing import instrument_session
+import time
 import logging
 
 # Enable debug logging for agents
 logging.basicConfig(level=logging.DEBUG)
 load_dotenv()
 
+# Resolved through the tool registry, so their modules load only when the agent is built
+TOOL_NAMES = [
+    "get_weather",
+    "search_web",
+    "send_email",
+    "create_monday_task",
+    "create_crm_task",
+    "list_monday_boards",
+]
+
 
 class Assistant(Agent):
-    def __init__(self) -> None:
+    def __init__(self, llm) -> None:
         super().__init__(
             instructions=AGENT_INSTRUCTION,
-            llm=google.beta.realtime.RealtimeModel(
-                voice="Aoede",
-                temperature=0.8,
-            ),
-            tools=[
-                get_weather,
-                search_web,
-                send_email,
-                create_monday_task,
-                create_crm_task,
-                list_monday_boards
-            ],
+            llm=llm,
+            tools=get_tools(TOOL_NAMES),
         )
         
 
 
+def prewarm(proc: agents.JobProcess):
+    # Shared, loop-independent state for every job this process will run
+    prewarm_process(proc, TOOL_NAMES)
+
+
 async def entrypoint(ctx: agents.JobContext):
+    started = time.perf_counter()
+    # Import the search backend off the loop while the room connects
+    start_tool_prewarm(TOOL_NAMES)
     await ctx.connect()
     
     # Create the assistant instance
-    assistant = Assistant()
+    assistant = Assistant(realtime_model(ctx))
     
     # Create session with the LLM from the assistant
     session = AgentSession(
@@ -57,6 +68,12 @@ async def entrypoint(ctx: agents.JobContext):
             noise_cancellation=noise_cancellation.BVC(),
         ),
     )
+    record_job_ready(ctx, started)
+
+    # Record per-turn latency and serve /metrics if METRICS_PORT is set
+    instrument_session(session)
+    # Warm up the MCP session and board caches while the greeting is spoken
+    start_session_warmup()
 
     # Generate initial greeting and start listening
     await session.generate_reply(
@@ -65,4 +82,4 @@ async def entrypoint(ctx: agents.JobContext):
 
 
 if __name__ == "__main__":
-    agents.cli.run_app(agents.WorkerOptions(entrypoint_fnc=entrypoint))
\ No newline at end of file
+    agents.cli.run_app(agents.WorkerOptions(entrypoint_fnc=entrypoint, prewarm_fnc=prewarm))
\ No newline at end of file
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Cold-start benchmark: how long does importing each entrypoint module take?
+
+Each import runs in a fresh interpreter with `python -X importtime`, so
+nothing is already loaded. The script reports the median cumulative import
+time per module and the direct imports that cost the most. A worker pays
+this before it can accept a job. With --baseline, the same modules are also
+timed at a git revision (its Python files are exported to a temp dir), which
+shows what a change did to cold start.
+
+    python benchmarks/bench_import_time.py
+    python benchmarks/bench_import_time.py --baseline HEAD~1 --repeat 9
+    python benchmarks/bench_import_time.py --modules tools,agent --top 10 --json imports.json
+"""
+
+import os
+import re
+import sys
+import json
+import shutil
+import argparse
+import tempfile
+import statistics
+import subprocess
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_MODULES = [
+    "tool_registry",
+    "tools",
+    "session_warmup",
+    "agent",
+    "mvp_agent",
+    "perfect_agent",
+    "working_agent",
+    "final_mvp_agent",
+    "monday_backend.web_server",
+]
+
+# "import time:       self [us] |  cumulative | imported package"
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int, int]]:
+    """(module, depth, self us, cumulative us) for every line -X importtime printed"""
+    entries = []
+    for line in stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            entries.append((name, (len(indent) - 1) // 2, int(self_us), int(cumulative_us)))
+    return entries
+
+
+def import_once(module: str, root: Path) -> Dict[str, Any]:
+    env = dict(os.environ, PYTHONPATH=str(root), TRACE_EXPORTER="none")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=root, env=env, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        missing = re.search(r"No module named '([^']+)'", result.stderr)
+        last_line = result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "import failed"
+        return {"error": f"{missing.group(1)} not installed" if missing else last_line}
+
+    entries = parse_importtime(result.stderr)
+    # The module's own line comes last among its imports and carries the total
+    own = [entry for entry in entries if entry[0] == module]
+    if not own:
+        return {"error": "no importtime output"}
+    _, depth, _, total_us = own[-1]
+    # Its imports are the deeper lines printed just before it
+    end = start = entries.index(own[-1])
+    while start > 0 and entries[start - 1][1] > depth:
+        start -= 1
+    children = [entry for entry in entries[start:end] if entry[1] == depth + 1]
+    return {"ms": total_us / 1000, "children": [(name, cumulative / 1000) for name, _, _, cumulative in children]}
+
+
+def time_module(module: str, root: Path, repeat: int, top: int) -> Dict[str, Any]:
+    # The first run writes bytecode caches; it isn't counted
+    first = import_once(module, root)
+    if "error" in first:
+        return {"module": module, "error": first["error"]}
+    runs = [import_once(module, root) for _ in range(repeat)]
+    runs = [run for run in runs if "error" not in run]
+    if not runs:
+        return {"module": module, "error": "every run failed"}
+
+    median_ms = statistics.median(run["ms"] for run in runs)
+    child_ms: Dict[str, List[float]] = {}
+    for run in runs:
+        for name, ms in run["children"]:
+            child_ms.setdefault(name, []).append(ms)
+    heaviest = sorted(((name, statistics.median(samples)) for name, samples in child_ms.items()), key=lambda item: -item[1])
+    return {
+        "module": module,
+        "median_ms": round(median_ms, 1),
+        "min_ms": round(min(run["ms"] for run in runs), 1),
+        "heaviest": [{"module": name, "ms": round(ms, 1)} for name, ms in heaviest[:top]],
+    }
+
+
+def export_revision(revision: str) -> Path:
+    """Copy the Python sources at a git revision into a temp dir"""
+    target = Path(tempfile.mkdtemp(prefix="friday-imports-"))
+    archive = subprocess.run(
+        ["git", "archive", "--format=tar", revision, "--", ":(glob)*.py", ":(glob)monday_backend/*.py"],
+        cwd=REPO_ROOT, capture_output=True, check=True,
+    )
+    subprocess.run(["tar", "-x", "-C", str(target)], input=archive.stdout, check=True)
+    return target
+
+
+def print_report(results: List[Dict[str, Any]], baseline: Optional[Dict[str, Dict[str, Any]]], revision: Optional[str]) -> None:
+    header = f"{'module':<28} {'median ms':>10} {'min ms':>8}"
+    if baseline is not None:
+        header += f" {revision[:12]:>12} {'change':>8}"
+    print(header)
+    print("-" * len(header))
+    for result in results:
+        if "error" in result:
+            print(f"{result['module']:<28} {'skipped: ' + result['error']}")
+            continue
+        line = f"{result['module']:<28} {result['median_ms']:>10.1f} {result['min_ms']:>8.1f}"
+        if baseline is not None:
+            before = baseline.get(result["module"], {})
+            if "median_ms" in before:
+                change = (result["median_ms"] - before["median_ms"]) / before["median_ms"] * 100 if before["median_ms"] else 0.0
+                line += f" {before['median_ms']:>12.1f} {change:>+7.0f}%"
+            else:
+                line += f" {'-':>12} {'':>8}"
+        print(line)
+
+    for result in results:
+        if result.get("heaviest"):
+            print(f"\n{result['module']}: heaviest direct imports")
+            for child in result["heaviest"]:
+                print(f"    {child['module']:<40} {child['ms']:>8.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Cold import time of the agent and server entrypoints")
+    parser.add_argument("--modules", help="Comma-separated modules to import (default: every entrypoint)")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed fresh-interpreter imports per module")
+    parser.add_argument("--top", type=int, default=5, help="Heaviest direct imports to list per module")
+    parser.add_argument("--baseline", help="Git revision to compare against, e.g. HEAD~1")
+    parser.add_argument("--json", help="Also write the results to this file")
+    args = parser.parse_args()
+
+    modules = [name.strip() for name in args.modules.split(",") if name.strip()] if args.modules else DEFAULT_MODULES
+    results = [time_module(module, REPO_ROOT, args.repeat, args.top) for module in modules]
+
+    baseline = None
+    if args.baseline:
+        root = export_revision(args.baseline)
+        try:
+            baseline = {module: time_module(module, root, args.repeat, args.top) for module in modules}
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+
+    print_report(results, baseline, args.baseline)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"python": sys.version.split()[0], "baseline": args.baseline, "results": results,
+                       "baseline_results": list(baseline.values()) if baseline else None}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for the web intent router.
+
+Routes the same messages through Friday's intents padded with N synthetic
+intents, and through the old chain of `any(word in message)` scans padded
+the same way. The router should stay flat as N grows; the scan should not.
+
+    python benchmarks/bench_intent_router.py [--repeat 2000]
+"""
+
+import sys
+import argparse
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from monday_backend.intent_router import Intent, IntentRouter, FRIDAY_INTENTS
+
+MESSAGES = [
+    "What's the weather in New York today?",
+    "Please add task named quarterly paid media review",
+    "Find the task called Q3 budget",
+    "search for the best pizza in Rome",
+    "send an email to bob@example.com",
+    "thanks Friday",
+    "I was wondering whether you could help me plan the week",
+    "this sentence matches nothing at all",
+]
+SIZES = [0, 10, 100, 1000, 5000]
+
+
+def padded_intents(extra: int):
+    filler = [Intent(f"synthetic_{i}", [f"keyword{i}", f"phrase number{i}"]) for i in range(extra)]
+    # Filler goes first so the scan below pays for it on every message
+    return filler + FRIDAY_INTENTS
+
+
+def keyword_scan(intents):
+    """The routing process_message used to do: test each intent's words in order"""
+    table = [(intent.name, [" ".join(trigger) for trigger in intent.triggers]) for intent in intents]
+
+    def route(message: str):
+        message_lower = message.lower()
+        for name, words in table:
+            if any(word in message_lower for word in words):
+                return name
+        return None
+
+    return route
+
+
+def per_route_us(route, repeat: int) -> float:
+    seconds = min(timeit.repeat(lambda: [route(m) for m in MESSAGES], number=repeat, repeat=3))
+    return seconds / (repeat * len(MESSAGES)) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{'intents':>8}  {'router µs':>10}  {'scan µs':>10}")
+    for extra in SIZES:
+        intents = padded_intents(extra)
+        router = IntentRouter(intents).compile()
+        print(
+            f"{len(intents):>8}  "
+            f"{per_route_us(router.route, args.repeat):>10.2f}  "
+            f"{per_route_us(keyword_scan(intents), max(1, args.repeat // max(1, extra // 10))):>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
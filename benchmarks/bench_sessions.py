@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Load generator: how many voice sessions can one worker process carry?
+
+Runs N simulated sessions on one event loop, as a LiveKit worker does with
+one job per room. Each session has a mocked realtime model that takes turns:
+the user speaks (think time), the model calls a tool, then speaks the reply.
+Tools go through the repo's function tools with a fake RunContext and
+session (late replies from @latency_budget land in session.generate_reply).
+Without livekit installed, the same Monday.com and MCP client paths are
+driven directly. Backends are the local stand-ins from fake_services.py.
+
+For each N it reports event-loop lag, tool latency, throughput and memory
+per session, and the largest N that stayed within the latency budgets.
+
+    python benchmarks/bench_sessions.py --sessions 1,10,50,100,200 --duration 20 --latency 0.05
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import asyncio
+import logging
+import contextlib
+import argparse
+import tempfile
+import tracemalloc
+import multiprocessing
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Tuple, Callable, Awaitable
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from fake_services import run_in_process, add_config_arguments, config_from_arguments
+from harness import percentile
+from bench_tools import point_clients_at
+
+# How often the lag probe wakes up; lag is how late it wakes
+LAG_PROBE_INTERVAL = 0.01
+TERMS = ["budget", "campaign", "report", "launch", "audit"]
+
+ToolCall = Callable[[Any], Awaitable[Any]]
+
+
+class FakeSession:
+    """Stands in for AgentSession: records what the agent would have said"""
+
+    def __init__(self):
+        self.replies: List[str] = []
+        self.late_replies = 0
+
+    async def generate_reply(self, instructions: str = "", **kwargs: Any) -> None:
+        self.late_replies += 1
+        self.replies.append(instructions)
+
+
+class FakeRunContext:
+    def __init__(self, session: FakeSession):
+        self.session = session
+
+
+class FakeRealtimeModel:
+    """
+    Turn-taking stand-in for the realtime model. Keeps a growing chat
+    history like the real one, so memory per session is representative.
+    """
+
+    def __init__(self, tools: List[Tuple[str, ToolCall]], think_time: float, speak_time: float, rng: random.Random):
+        self.tools = tools
+        self.think_time = think_time
+        self.speak_time = speak_time
+        self.rng = rng
+        self.history: List[Dict[str, Any]] = []
+
+    async def run(self, context: FakeRunContext, deadline: float, samples: "LoadSample") -> None:
+        # Stagger session starts so N sessions don't all speak at once
+        await asyncio.sleep(self.rng.uniform(0, self.think_time))
+        while time.perf_counter() < deadline:
+            name, call = self.rng.choice(self.tools)
+            self.history.append({"role": "user", "content": f"Please run {name} for me"})
+            started = time.perf_counter()
+            try:
+                reply = await call(context)
+                failed = False
+            except Exception as e:
+                reply, failed = f"error: {e}", True
+            samples.record(name, (time.perf_counter() - started) * 1000, failed)
+            self.history.append({"role": "assistant", "tool": name, "content": str(reply)[:500]})
+            await asyncio.sleep(self.speak_time + self.rng.expovariate(1 / self.think_time))
+
+
+class LoadSample:
+    def __init__(self):
+        self.tool_ms: Dict[str, List[float]] = {}
+        self.errors = 0
+        self.lag_ms: List[float] = []
+
+    def record(self, tool: str, elapsed_ms: float, failed: bool) -> None:
+        self.tool_ms.setdefault(tool, []).append(elapsed_ms)
+        self.errors += failed
+
+    def all_tool_ms(self) -> List[float]:
+        return sorted(ms for samples in self.tool_ms.values() for ms in samples)
+
+
+async def probe_loop_lag(samples: LoadSample, stop: asyncio.Event) -> None:
+    """Sleep in short steps and record how late each wake-up is"""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + LAG_PROBE_INTERVAL
+        await asyncio.sleep(LAG_PROBE_INTERVAL)
+        samples.lag_ms.append(max(0.0, (loop.time() - expected) * 1000))
+
+
+def rss_kb() -> Optional[float]:
+    """Resident set size of this process, where /proc is available"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def build_tool_mix(rng: random.Random) -> Tuple[str, List[Tuple[str, ToolCall]]]:
+    """The agent's function tools if livekit is importable, else the client paths under them"""
+    try:
+        from monday_backend.monday_tools import search_monday_tasks, list_monday_boards, create_monday_task
+        from tools import execute_mcp_tool
+    except ImportError as e:
+        missing = e.name
+    else:
+        return "function tools", [
+            ("search_monday_tasks", lambda context: search_monday_tasks(context, None, rng.choice(TERMS))),
+            ("list_monday_boards", lambda context: list_monday_boards(context)),
+            ("create_monday_task", lambda context: create_monday_task(context, "Load test task")),
+            ("execute_mcp_tool", lambda context: execute_mcp_tool("monday_create_item", {"itemTitle": "Load test task"})),
+        ]
+
+    from mcp_session import get_mcp_session
+    from monday_backend.monday_integration import get_monday_client
+
+    async def mcp_create_item(context: Any) -> Dict[str, Any]:
+        message = await get_mcp_session().call_tool("monday_create_item", {"itemTitle": "Load test task"})
+        if "error" in message:
+            raise RuntimeError(message["error"])
+        return message
+
+    return f"client paths ({missing} not installed)", [
+        ("search_tasks", lambda context: get_monday_client().search_tasks(rng.choice(TERMS), limit=11)),
+        ("get_boards", lambda context: get_monday_client().get_boards()),
+        ("create_task", lambda context: get_monday_client().create_task("Load test task")),
+        ("mcp.call_tool", mcp_create_item),
+    ]
+
+
+async def run_level(sessions: int, args: argparse.Namespace, rng: random.Random) -> Dict[str, Any]:
+    mode, tools = build_tool_mix(rng)
+    samples = LoadSample()
+    stop = asyncio.Event()
+    baseline_rss = rss_kb()
+    if args.tracemalloc:
+        tracemalloc.start()
+    probe = asyncio.create_task(probe_loop_lag(samples, stop))
+
+    fake_sessions = [FakeSession() for _ in range(sessions)]
+    models = [FakeRealtimeModel(tools, args.think_time, args.speak_time, random.Random(rng.random())) for _ in range(sessions)]
+    deadline = time.perf_counter() + args.duration
+    started = time.perf_counter()
+    # Sample memory mid-run, while every session is live
+    peak_rss = baseline_rss
+    runs = asyncio.gather(*(model.run(FakeRunContext(session), deadline, samples) for model, session in zip(models, fake_sessions)))
+    while not runs.done():
+        await asyncio.wait({runs}, timeout=1.0)
+        current = rss_kb()
+        if current is not None and peak_rss is not None:
+            peak_rss = max(peak_rss, current)
+    await runs
+    elapsed = time.perf_counter() - started
+
+    traced_kb = None
+    if args.tracemalloc:
+        traced_kb = tracemalloc.get_traced_memory()[1] / 1024
+        tracemalloc.stop()
+    stop.set()
+    await probe
+
+    tool_ms = samples.all_tool_ms()
+    lag = sorted(samples.lag_ms)
+    return {
+        "mode": mode,
+        "sessions": sessions,
+        "tool_calls": len(tool_ms),
+        "calls_per_sec": round(len(tool_ms) / elapsed, 1),
+        "errors": samples.errors,
+        "late_replies": sum(session.late_replies for session in fake_sessions),
+        "tool_p50_ms": round(percentile(tool_ms, 0.50), 1),
+        "tool_p95_ms": round(percentile(tool_ms, 0.95), 1),
+        "tool_p99_ms": round(percentile(tool_ms, 0.99), 1),
+        "per_tool_p99_ms": {name: round(percentile(sorted(ms), 0.99), 1) for name, ms in samples.tool_ms.items()},
+        "lag_p50_ms": round(percentile(lag, 0.50), 2),
+        "lag_p99_ms": round(percentile(lag, 0.99), 2),
+        "lag_max_ms": round(lag[-1], 2) if lag else 0.0,
+        "kb_per_session": round((peak_rss - baseline_rss) / sessions, 1) if peak_rss is not None and baseline_rss is not None else None,
+        "traced_kb_per_session": round(traced_kb / sessions, 1) if traced_kb is not None else None,
+    }
+
+
+async def run(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    rng = random.Random(args.seed)
+    # One call per tool first, so imports, pools and sessions aren't billed to the first level
+    with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+        _, tools = build_tool_mix(rng)
+        context = FakeRunContext(FakeSession())
+        for _, call in tools:
+            with contextlib.suppress(Exception):
+                await call(context)
+    levels = []
+    for sessions in args.sessions:
+        # The clients print every response; a devnull sink keeps that out of the table (and the RSS)
+        with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+            level = await run_level(sessions, args, rng)
+        levels.append(level)
+        print(
+            f"{level['sessions']:>8} {level['calls_per_sec']:>9.1f} {level['tool_p50_ms']:>9.1f} {level['tool_p99_ms']:>9.1f} "
+            f"{level['lag_p99_ms']:>9.2f} {level['lag_max_ms']:>9.2f} {level['errors']:>7} {level['late_replies']:>6} "
+            f"{level['kb_per_session'] if level['kb_per_session'] is not None else '-':>9}",
+            flush=True,
+        )
+    return levels
+
+
+def parse_sessions(value: str) -> List[int]:
+    return sorted({int(part) for part in value.split(",") if part.strip()})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Simulate many concurrent voice sessions in one worker")
+    parser.add_argument("--sessions", type=parse_sessions, default=parse_sessions("1,10,50,100"), help="Comma-separated session counts")
+    parser.add_argument("--duration", type=float, default=15.0, help="Seconds to run each session count")
+    parser.add_argument("--think-time", type=float, default=2.0, help="Mean seconds between a reply and the next request")
+    parser.add_argument("--speak-time", type=float, default=1.0, help="Seconds the model spends speaking each reply")
+    parser.add_argument("--p99-budget", type=float, default=1500.0, help="Tool p99 (ms) a session count must stay under")
+    parser.add_argument("--lag-budget", type=float, default=50.0, help="Event-loop lag p99 (ms) a session count must stay under")
+    parser.add_argument("--tracemalloc", action="store_true", help="Also trace Python allocations (slows the run)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="Also write the results to this file")
+    add_config_arguments(parser)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    # Keep the board index and job queue of this run out of the working tree
+    scratch = tempfile.mkdtemp(prefix="friday-load-")
+    os.environ.setdefault("MONDAY_INDEX_PATH", os.path.join(scratch, "monday_index.db"))
+    os.environ.setdefault("JOB_QUEUE_PATH", os.path.join(scratch, "job_queue.db"))
+
+    ready = multiprocessing.Queue()
+    services = multiprocessing.Process(target=run_in_process, args=(config_from_arguments(args), ready), daemon=True)
+    services.start()
+    try:
+        point_clients_at(ready.get(timeout=10))
+        print(f"{'sessions':>8} {'calls/s':>9} {'p50 ms':>9} {'p99 ms':>9} {'lag p99':>9} {'lag max':>9} {'errors':>7} {'late':>6} {'KB/sess':>9}")
+        levels = asyncio.run(run(args))
+    finally:
+        services.terminate()
+        services.join()
+
+    print(f"Tools driven through: {levels[0]['mode']}")
+    within = [
+        level["sessions"] for level in levels
+        if level["tool_p99_ms"] <= args.p99_budget and level["lag_p99_ms"] <= args.lag_budget
+    ]
+    if within:
+        print(f"✅ Largest session count within budgets (tool p99 ≤ {args.p99_budget:g} ms, lag p99 ≤ {args.lag_budget:g} ms): {max(within)}")
+    else:
+        print("❌ No session count stayed within the latency budgets")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"settings": {k: v for k, v in vars(args).items() if k != "json"}, "levels": levels}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark for every tool path, against local MCP and Monday.com stand-ins.
+
+Starts benchmarks/fake_services.py in a child process, points the real
+clients at it and reports requests/sec, p50/p99 latency and tracemalloc
+memory per path. Nothing here touches a live service.
+
+    python benchmarks/bench_tools.py --requests 500 --concurrency 20 --latency 0.02
+    python benchmarks/bench_tools.py --only monday --board-size 5000 --json bench.json
+"""
+
+import os
+import sys
+import asyncio
+import logging
+import argparse
+import multiprocessing
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from fake_services import StandInConfig, run_in_process, add_config_arguments, config_from_arguments
+from harness import ScenarioResult, run_scenario, skipped, print_report, write_json
+
+BOARD_ID = "1234567890"
+
+
+def point_clients_at(urls: dict) -> None:
+    """Configure the repo's clients through their usual env vars (read at import time)"""
+    os.environ["MCP_SERVER_URL"] = urls["mcp"]
+    os.environ["MONDAY_API_URL"] = urls["monday"]
+    os.environ["MONDAY_BOARD_ID"] = BOARD_ID
+    os.environ["MONDAY_API_KEY"] = "benchmark"
+    os.environ["TRACE_EXPORTER"] = "none"
+
+
+async def mcp_scenarios(args: argparse.Namespace) -> List[ScenarioResult]:
+    from mcp_session import get_mcp_session, close_mcp_session
+
+    session = get_mcp_session()
+    progress_events = []
+
+    async def call_tool() -> None:
+        message = await session.call_tool("monday_create_item", {"boardId": BOARD_ID, "itemTitle": "Benchmark"})
+        if "error" in message:
+            raise RuntimeError(message["error"])
+
+    async def call_tool_with_progress() -> None:
+        message = await session.call_tool("monday_create_item", {"boardId": BOARD_ID, "itemTitle": "Benchmark"}, progress_events.append)
+        if "error" in message:
+            raise RuntimeError(message["error"])
+
+    results = [
+        await run_scenario("mcp.call_tool", call_tool, args.requests, args.concurrency),
+        await run_scenario("mcp.call_tool (progress)", call_tool_with_progress, args.requests, args.concurrency),
+    ]
+
+    try:
+        from tools import execute_mcp_tool
+    except ImportError as e:
+        # tools.py pulls in livekit and mcp; the session-level paths above still ran
+        results.append(skipped("tools.execute_mcp_tool", f"{e.name} not installed"))
+    else:
+        async def create_item() -> None:
+            result = await execute_mcp_tool("monday_create_item", {"itemTitle": "Benchmark"})
+            if "error" in result:
+                raise RuntimeError(result["error"])
+
+        async def board_groups() -> None:
+            result = await execute_mcp_tool("monday_get_board_groups", {})
+            if "error" in result:
+                raise RuntimeError(result["error"])
+
+        results.append(await run_scenario("tools.execute_mcp_tool create_item", create_item, args.requests, args.concurrency))
+        results.append(await run_scenario("tools.execute_mcp_tool board_groups (cached)", board_groups, args.requests, args.concurrency))
+
+    await close_mcp_session()
+    return results
+
+
+async def monday_scenarios(args: argparse.Namespace) -> List[ScenarioResult]:
+    from tool_cache import get_tool_cache
+    from monday_backend.monday_integration import get_monday_client
+
+    client = get_monday_client()
+    cache = get_tool_cache()
+
+    async def boards_uncached() -> None:
+        cache.invalidate(["get_boards"])
+        await client.get_boards()
+
+    async def boards_cached() -> None:
+        await client.get_boards()
+
+    async def create_task() -> None:
+        await client.create_task("Benchmark task")
+
+    async def create_tasks_batched() -> None:
+        results = await client.create_tasks([f"Benchmark task {i}" for i in range(10)])
+        if not all(result["ok"] for result in results):
+            raise RuntimeError("batch had failures")
+
+    async def search_all_pages() -> None:
+        await client.search_tasks("budget")
+
+    async def search_first_page() -> None:
+        await client.search_tasks("budget", limit=11)
+
+    async def count_tasks() -> None:
+        await client.count_tasks()
+
+    scenarios = [
+        ("monday.get_boards", boards_uncached),
+        ("monday.get_boards (cached)", boards_cached),
+        ("monday.create_task", create_task),
+        ("monday.create_tasks x10 (batched)", create_tasks_batched),
+        ("monday.search_tasks (all pages)", search_all_pages),
+        ("monday.search_tasks (limit=11)", search_first_page),
+        ("monday.count_tasks", count_tasks),
+    ]
+    results = [await run_scenario(name, call, args.requests, args.concurrency) for name, call in scenarios]
+    await client.aclose()
+    return results
+
+
+async def run(args: argparse.Namespace) -> List[ScenarioResult]:
+    results: List[ScenarioResult] = []
+    if args.only in (None, "mcp"):
+        results += await mcp_scenarios(args)
+    if args.only in (None, "monday"):
+        results += await monday_scenarios(args)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Offline tool-path benchmark")
+    parser.add_argument("--requests", type=int, default=200, help="Timed calls per path")
+    parser.add_argument("--concurrency", type=int, default=10, help="Calls in flight at once")
+    parser.add_argument("--only", choices=["mcp", "monday"], help="Run one group of paths")
+    parser.add_argument("--json", help="Also write the results to this file")
+    add_config_arguments(parser)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    ready = multiprocessing.Queue()
+    services = multiprocessing.Process(target=run_in_process, args=(config_from_arguments(args), ready), daemon=True)
+    services.start()
+    try:
+        point_clients_at(ready.get(timeout=10))
+        results = asyncio.run(run(args))
+    finally:
+        services.terminate()
+        services.join()
+
+    print_report(results)
+    if args.json:
+        write_json(results, args.json, {key: value for key, value in vars(args).items() if key != "json"})
+
+
+if __name__ == "__main__":
+    main()
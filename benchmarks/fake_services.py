@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+Local stand-ins for the MCP server and the Monday.com GraphQL API.
+
+Both are plain asyncio HTTP/1.1 servers with keep-alive, so the real
+clients (MCPSession, MondayClient) talk to them exactly as they would to
+production: StreamableHTTP with chunked SSE replies and mcp-session-id for
+MCP, JSON GraphQL with complexity data, 429s and cursors for Monday.com.
+
+    python benchmarks/fake_services.py --mcp-port 8765 --monday-port 8766 --latency 0.05
+"""
+
+import re
+import json
+import uuid
+import base64
+import random
+import asyncio
+import argparse
+from typing import Optional, Dict, Any, List, Tuple
+
+WORDS = ["campaign", "budget", "report", "creative", "launch", "audit", "invoice", "review"]
+
+
+class StandInConfig:
+    """Behaviour knobs shared by both stand-ins"""
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        board_size: int = 500,
+        progress_steps: int = 0,
+        expire_after: int = 0,
+        seed: int = 0,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.board_size = board_size
+        self.progress_steps = progress_steps
+        # Drop the MCP session after this many tool calls (0 = never)
+        self.expire_after = expire_after
+        self.random = random.Random(seed)
+
+    def delay(self) -> float:
+        return self.latency + (self.random.uniform(0, self.jitter) if self.jitter else 0.0)
+
+    def roll(self, rate: float) -> bool:
+        return rate > 0 and self.random.random() < rate
+
+
+class HTTPStandIn:
+    """Minimal keep-alive HTTP/1.1 server; subclasses implement handle()"""
+
+    def __init__(self, config: StandInConfig):
+        self.config = config
+        self.requests = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        self._server = await asyncio.start_server(self._serve, host, port)
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}/"
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method = request_line.decode("latin-1").split(" ", 1)[0]
+                headers: Dict[str, str] = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", "0"))
+                body = await reader.readexactly(length) if length else b""
+                self.requests += 1
+                await self.handle(method, headers, body, writer)
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def handle(self, method: str, headers: Dict[str, str], body: bytes, writer: asyncio.StreamWriter) -> None:
+        raise NotImplementedError
+
+    @staticmethod
+    async def respond(
+        writer: asyncio.StreamWriter,
+        status: int,
+        body: bytes = b"",
+        content_type: str = "application/json",
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        lines = [f"HTTP/1.1 {status} {_REASONS.get(status, 'OK')}", f"Content-Type: {content_type}", f"Content-Length: {len(body)}"]
+        lines += [f"{name}: {value}" for name, value in (headers or {}).items()]
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+        await writer.drain()
+
+
+_REASONS = {200: "OK", 202: "Accepted", 404: "Not Found", 429: "Too Many Requests", 500: "Internal Server Error"}
+
+
+class FakeMCPServer(HTTPStandIn):
+    """
+    StreamableHTTP MCP server with the tools the agents call.
+
+    initialize hands out an mcp-session-id; tools/call answers over SSE, with
+    config.progress_steps notifications/progress events first when the
+    request carried a progressToken. Unknown (or expired) sessions get 404.
+    """
+
+    TOOLS = ["monday_create_item", "monday_get_board_groups", "monday_get_board_columns", "monday_list_items_in_groups"]
+
+    def __init__(self, config: StandInConfig):
+        super().__init__(config)
+        self.sessions: Dict[str, int] = {}
+        self.tool_calls = 0
+        self._items = 0
+
+    async def handle(self, method: str, headers: Dict[str, str], body: bytes, writer: asyncio.StreamWriter) -> None:
+        session_id = headers.get("mcp-session-id")
+        if method == "DELETE":
+            self.sessions.pop(session_id, None)
+            await self.respond(writer, 200)
+            return
+
+        message = json.loads(body or b"{}")
+        rpc_method = message.get("method")
+        if rpc_method == "initialize":
+            session_id = uuid.uuid4().hex
+            self.sessions[session_id] = 0
+            result = {
+                "protocolVersion": message["params"]["protocolVersion"],
+                "capabilities": {"tools": {}},
+                "serverInfo": {"name": "fake-mcp", "version": "0.0.0"},
+            }
+            await asyncio.sleep(self.config.delay())
+            await self._stream(writer, [_rpc_result(message["id"], result)], headers={"mcp-session-id": session_id})
+            return
+
+        if session_id not in self.sessions:
+            await self.respond(writer, 404, b'{"error": "Unknown session"}')
+            return
+        if "id" not in message:
+            # notifications/initialized and friends
+            await self.respond(writer, 202)
+            return
+
+        if rpc_method == "tools/list":
+            tools = [{"name": name, "inputSchema": {"type": "object"}} for name in self.TOOLS]
+            await self._stream(writer, [_rpc_result(message["id"], {"tools": tools})], self.config.delay())
+            return
+        if rpc_method != "tools/call":
+            await self._stream(writer, [_rpc_error(message["id"], -32601, f"Method not found: {rpc_method}")])
+            return
+
+        self.tool_calls += 1
+        self.sessions[session_id] += 1
+        if self.config.expire_after and self.sessions[session_id] >= self.config.expire_after:
+            del self.sessions[session_id]
+
+        params = message.get("params") or {}
+        events: List[Dict[str, Any]] = []
+        token = (params.get("_meta") or {}).get("progressToken")
+        if token is not None:
+            for step in range(1, self.config.progress_steps + 1):
+                events.append({
+                    "jsonrpc": "2.0",
+                    "method": "notifications/progress",
+                    "params": {"progressToken": token, "progress": step, "total": self.config.progress_steps},
+                })
+        if self.config.roll(self.config.error_rate):
+            events.append(_rpc_error(message["id"], -32000, "Simulated tool failure"))
+        else:
+            content = json.dumps(self._tool_result(params.get("name"), params.get("arguments") or {}))
+            events.append(_rpc_result(message["id"], {"content": [{"type": "text", "text": content}]}))
+        await self._stream(writer, events, self.config.delay())
+
+    def _tool_result(self, name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        if name == "monday_create_item":
+            self._items += 1
+            return {"id": str(10_000 + self._items), "name": arguments.get("itemTitle") or arguments.get("name"), "board_id": arguments.get("boardId")}
+        if name == "monday_get_board_groups":
+            return {"groups": [{"id": f"group_{i}", "title": f"Group {i}"} for i in range(5)]}
+        if name == "monday_get_board_columns":
+            return {"columns": [{"id": "name", "title": "Name", "type": "name"}, {"id": "status", "title": "Status", "type": "status"}]}
+        return {"tool": name, "arguments": arguments}
+
+    async def _stream(
+        self,
+        writer: asyncio.StreamWriter,
+        events: List[Dict[str, Any]],
+        delay: float = 0.0,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """Send events as a chunked text/event-stream, spread evenly over delay seconds"""
+        lines = ["HTTP/1.1 200 OK", "Content-Type: text/event-stream", "Cache-Control: no-cache", "Transfer-Encoding: chunked"]
+        lines += [f"{name}: {value}" for name, value in (headers or {}).items()]
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        await writer.drain()
+        for event in events:
+            if delay:
+                await asyncio.sleep(delay / len(events))
+            data = f"event: message\ndata: {json.dumps(event)}\n\n".encode("utf-8")
+            writer.write(b"%x\r\n%s\r\n" % (len(data), data))
+            await writer.drain()
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+
+class FakeMondayAPI(HTTPStandIn):
+    """
+    Monday.com GraphQL endpoint over a generated board of config.board_size items.
+
+    Understands the documents MondayClient sends (boards, groups, columns,
+    items_page / next_items_page with name filters, items_count, create_item,
+    create_update, change_column_value and aliased batches) and reports a
+    complexity cost. config.throttle_rate answers 429s, config.error_rate
+    GraphQL errors.
+    """
+
+    def __init__(self, config: StandInConfig, board_id: str = "1234567890"):
+        super().__init__(config)
+        self.board_id = board_id
+        self.items = [_item(i) for i in range(config.board_size)]
+
+    async def handle(self, method: str, headers: Dict[str, str], body: bytes, writer: asyncio.StreamWriter) -> None:
+        await asyncio.sleep(self.config.delay())
+        if self.config.roll(self.config.throttle_rate):
+            await self.respond(writer, 429, b'{"error_message": "Rate limit exceeded"}', headers={"Retry-After": "0"})
+            return
+        if self.config.roll(self.config.error_rate):
+            await self.respond(writer, 200, b'{"errors": [{"message": "Simulated Monday.com error"}]}')
+            return
+
+        payload = json.loads(body or b"{}")
+        query: str = payload.get("query", "")
+        data = self._resolve(query, payload.get("variables") or {})
+        if "complexity" in query:
+            data["complexity"] = {"before": 10_000_000, "after": 9_990_000, "query": 10_000, "reset_in_x_seconds": 60}
+        await self.respond(writer, 200, json.dumps({"data": data}).encode("utf-8"))
+
+    def _resolve(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        if "next_items_page" in query:
+            offset, term = _decode_cursor(variables["cursor"])
+            return {"next_items_page": self._page(term, offset, variables["limit"])}
+        if "items_page" in query:
+            rules = (variables.get("query_params") or {}).get("rules") or []
+            term = next((rule["compare_value"][0] for rule in rules if rule.get("column_id") == "name"), "")
+            return {"boards": [{"items_page": self._page(term, 0, variables["limit"])}]}
+        if "items_count" in query:
+            return {"boards": [{"items_count": len(self.items)}]}
+        if query.lstrip().startswith("mutation"):
+            return self._mutate(query, variables)
+        if "groups" in query:
+            return {"boards": [{"groups": [{"id": f"group_{i}", "title": f"Group {i}", "color": "#037f4c"} for i in range(5)]}]}
+        if "columns" in query:
+            return {"boards": [{"columns": [{"id": "name", "title": "Name", "type": "name"}, {"id": "status", "title": "Status", "type": "status"}]}]}
+        return {"boards": [
+            {"id": self.board_id, "name": "Paid Media CRM", "description": None, "state": "active", "updated_at": "2025-01-01T00:00:00Z"},
+            {"id": "2", "name": "Marketing", "description": None, "state": "active", "updated_at": "2025-01-01T00:00:00Z"},
+        ]}
+
+    def _page(self, term: str, offset: int, limit: int) -> Dict[str, Any]:
+        matches = [item for item in self.items if term.lower() in item["name"].lower()] if term else self.items
+        page = matches[offset:offset + limit]
+        next_offset = offset + len(page)
+        return {"cursor": _encode_cursor(next_offset, term) if next_offset < len(matches) else None, "items": page}
+
+    def _mutate(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        aliased = re.findall(r"(op\d+): (\w+)\(", query)
+        if aliased:
+            return {alias: self._mutation(operation, {k[len(alias) + 1:]: v for k, v in variables.items() if k.startswith(alias + "_")}) for alias, operation in aliased}
+        for operation in ("create_item", "create_update", "change_column_value"):
+            if operation in query:
+                return {operation: self._mutation(operation, variables)}
+        return {}
+
+    def _mutation(self, operation: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        if operation in ("create_item", "create_subitem"):
+            item = _item(len(self.items), variables.get("item_name"))
+            self.items.append(item)
+            return {key: item[key] for key in ("id", "name", "created_at", "url")}
+        if operation == "create_update":
+            return {"id": uuid.uuid4().hex[:10], "body": variables.get("body"), "created_at": "2025-01-01T00:00:00Z"}
+        return {"id": str(variables.get("item_id")), "name": "updated"}
+
+
+def _item(index: int, name: Optional[str] = None) -> Dict[str, Any]:
+    name = name or f"Task {index} {WORDS[index % len(WORDS)]} {WORDS[(index // len(WORDS)) % len(WORDS)]}"
+    return {
+        "id": str(100_000 + index),
+        "name": name,
+        "created_at": "2025-01-01T00:00:00Z",
+        "url": f"https://example.monday.com/items/{100_000 + index}",
+        "state": "active",
+        "updated_at": "2025-01-01T00:00:00Z",
+        "creator": {"name": "Benchmark"},
+        "group": {"id": f"group_{index % 5}", "title": f"Group {index % 5}"},
+    }
+
+
+def _encode_cursor(offset: int, term: str) -> str:
+    return base64.urlsafe_b64encode(json.dumps([offset, term]).encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[int, str]:
+    offset, term = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    return offset, term
+
+
+def _rpc_result(request_id: Any, result: Dict[str, Any]) -> Dict[str, Any]:
+    return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+
+def _rpc_error(request_id: Any, code: int, message: str) -> Dict[str, Any]:
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+
+async def serve(config: StandInConfig, mcp_port: int = 0, monday_port: int = 0, ready=None) -> None:
+    """Run both stand-ins until cancelled; ready (a multiprocessing queue) gets their URLs"""
+    mcp = FakeMCPServer(config)
+    monday = FakeMondayAPI(config)
+    urls = {"mcp": await mcp.start(port=mcp_port), "monday": await monday.start(port=monday_port)}
+    if ready is not None:
+        ready.put(urls)
+    else:
+        print(f"🧪 Fake MCP server:   {urls['mcp']}")
+        print(f"🧪 Fake Monday.com:   {urls['monday']}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await mcp.close()
+        await monday.close()
+
+
+def run_in_process(config: StandInConfig, ready) -> None:
+    """multiprocessing target: keeps the stand-ins' work out of the measured process"""
+    try:
+        asyncio.run(serve(config, ready=ready))
+    except KeyboardInterrupt:
+        pass
+
+
+def add_config_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds each request takes server-side")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random latency, up to this many seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests that fail")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Share of Monday.com requests answered with 429")
+    parser.add_argument("--board-size", type=int, default=500, help="Items on the fake Monday.com board")
+    parser.add_argument("--progress-steps", type=int, default=0, help="Progress notifications before each MCP tool result")
+    parser.add_argument("--expire-after", type=int, default=0, help="Expire MCP sessions after this many tool calls")
+
+
+def config_from_arguments(args: argparse.Namespace) -> StandInConfig:
+    return StandInConfig(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        board_size=args.board_size,
+        progress_steps=args.progress_steps,
+        expire_after=args.expire_after,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local MCP and Monday.com stand-ins")
+    parser.add_argument("--mcp-port", type=int, default=8765)
+    parser.add_argument("--monday-port", type=int, default=8766)
+    add_config_arguments(parser)
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(config_from_arguments(args), args.mcp_port, args.monday_port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+# harness.py
+
+import io
+import json
+import math
+import time
+import asyncio
+import tracemalloc
+import contextlib
+from typing import Optional, Dict, Any, List, Callable, Awaitable
+
+Call = Callable[[], Awaitable[Any]]
+
+
+def percentile(ordered: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not ordered:
+        return 0.0
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+class ScenarioResult:
+    """Throughput, latency and memory for one benchmarked path"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.latencies_ms: List[float] = []
+        self.errors = 0
+        self.seconds = 0.0
+        self.peak_kb = 0.0
+        self.retained_kb = 0.0
+        self.skipped: Optional[str] = None
+
+    @property
+    def requests(self) -> int:
+        return len(self.latencies_ms)
+
+    @property
+    def rps(self) -> float:
+        return self.requests / self.seconds if self.seconds else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        ordered = sorted(self.latencies_ms)
+        return {
+            "name": self.name,
+            "requests": self.requests,
+            "errors": self.errors,
+            "rps": round(self.rps, 1),
+            "p50_ms": round(percentile(ordered, 0.50), 2),
+            "p99_ms": round(percentile(ordered, 0.99), 2),
+            "peak_kb_per_request": round(self.peak_kb, 2),
+            "retained_kb": round(self.retained_kb, 1),
+            "skipped": self.skipped,
+        }
+
+
+async def _drive(call: Call, requests: int, concurrency: int, result: Optional[ScenarioResult]) -> None:
+    remaining = iter(range(requests))
+
+    async def worker() -> None:
+        for _ in remaining:
+            started = time.perf_counter()
+            try:
+                await call()
+                failed = False
+            except Exception:
+                failed = True
+            if result is not None:
+                result.latencies_ms.append((time.perf_counter() - started) * 1000)
+                result.errors += failed
+
+    await asyncio.gather(*(worker() for _ in range(max(1, min(concurrency, requests)))))
+
+
+async def run_scenario(
+    name: str,
+    call: Call,
+    requests: int = 200,
+    concurrency: int = 10,
+    warmup: int = 5,
+    memory_requests: int = 50,
+) -> ScenarioResult:
+    """
+    Warm the path up, time `requests` calls at `concurrency`, then repeat a
+    shorter run under tracemalloc (which slows everything down, so it is
+    kept out of the timings). A call counts as an error if it raises.
+    """
+    result = ScenarioResult(name)
+    # The repo's clients print liberally; keep that out of the report
+    with contextlib.redirect_stdout(io.StringIO()):
+        await _drive(call, warmup, concurrency, None)
+
+        started = time.perf_counter()
+        await _drive(call, requests, concurrency, result)
+        result.seconds = time.perf_counter() - started
+
+        tracemalloc.start()
+        try:
+            baseline, _ = tracemalloc.get_traced_memory()
+            await _drive(call, memory_requests, concurrency, None)
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    result.peak_kb = (peak - baseline) / 1024 / max(1, min(concurrency, memory_requests))
+    result.retained_kb = (current - baseline) / 1024
+    return result
+
+
+def skipped(name: str, reason: str) -> ScenarioResult:
+    result = ScenarioResult(name)
+    result.skipped = reason
+    return result
+
+
+def print_report(results: List[ScenarioResult]) -> None:
+    print(f"{'path':<44} {'req/s':>9} {'p50 ms':>9} {'p99 ms':>9} {'errors':>7} {'peak KB/req':>12} {'retained KB':>12}")
+    for result in results:
+        if result.skipped:
+            print(f"{result.name:<44} skipped: {result.skipped}")
+            continue
+        row = result.to_dict()
+        print(
+            f"{row['name']:<44} {row['rps']:>9.1f} {row['p50_ms']:>9.2f} {row['p99_ms']:>9.2f} "
+            f"{row['errors']:>7} {row['peak_kb_per_request']:>12.2f} {row['retained_kb']:>12.1f}"
+        )
+
+
+def write_json(results: List[ScenarioResult], path: str, settings: Dict[str, Any]) -> None:
+    with open(path, "w") as f:
+        json.dump({"settings": settings, "results": [result.to_dict() for result in results]}, f, indent=2)
@@ -8,6 +8,8 @@ import sys
 import subprocess
 from pathlib import Path
 
+from monday_backend.static_assets import precompress_build, MANIFEST_NAME
+
 def run_command(command, cwd=None):
     """Run a shell command and return success status"""
     try:
@@ -53,6 +55,13 @@ def main():
         print("❌ Failed to build React app")
         return False
     
+    # Precompress assets and record content hashes for the web server
+    print("🗜️  Precompressing build assets...")
+    manifest = precompress_build(react_dir / "build")
+    raw = sum(entry["size"] for entry in manifest.values())
+    gzipped = sum(entry["encodings"].get("gzip", entry["size"]) for entry in manifest.values())
+    print(f"   {len(manifest)} files, {raw // 1024} KB -> {gzipped // 1024} KB gzipped ({MANIFEST_NAME})")
+    
     print("✅ React build completed successfully!")
     print("🌐 You can now run: python start_web.py")
     print("📱 The React interface will be available at: http://localhost:5000")
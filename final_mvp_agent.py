@@ -3,10 +3,16 @@
 from dotenv import load_dotenv
 from livekit import agents
 from livekit.agents import AgentSession, Agent, function_tool, RunContext
-from livekit.plugins import google
 import asyncio
+import time
 import logging
-from tools import execute_mcp_tool, MONDAY_BOARD_ID
+from typing import Set
+from tool_registry import register_tool, get_tools, start_tool_prewarm, BACKGROUND, MCP_TOOL_BACKEND
+from job_queue import get_job_queue, enqueue_mcp_tool
+from tool_runtime import deliver_to_session
+from session_warmup import start_session_warmup
+from worker_prewarm import prewarm_process, realtime_model, record_job_ready
+from tracing import traced, instrument_session
 
 # Enable detailed logging
 logging.basicConfig(level=logging.INFO)
@@ -14,60 +20,67 @@ logger = logging.getLogger(__name__)
 
 load_dotenv()
 
+# Background lookups still running; kept so they aren't garbage collected mid-call
+_background_tasks: Set[asyncio.Task] = set()
+
 # Ultra-fast MCP functions using Google's NON_BLOCKING approach
+@register_tool(BACKGROUND, **MCP_TOOL_BACKEND)
 @function_tool()
+@traced()
 async def create_monday_task_real(context: RunContext, task_name: str) -> str:
     """Create a task in Monday.com - using NON_BLOCKING pattern"""
     logger.info(f"🚀 NON_BLOCKING: Creating task '{task_name}' in Monday.com...")
     
-    # Immediately respond while MCP processes in background
-    # Start the actual MCP call asynchronously
-    asyncio.create_task(create_task_background(task_name))
+    # Immediately respond while the durable queue performs the write exactly once
+    main_board_id = "2034046752"  # Paid Media CRM main board
+    job_id = enqueue_mcp_tool("monday_create_item", {
+        "itemTitle": task_name,
+        "groupId": "group_mkv6xpc",
+        "boardId": main_board_id
+    }, scope=_call_id(context))
+    get_job_queue().on_complete(job_id, _report_task_outcome(context, task_name))
     
     # Return immediate confident response
     return f"Creating task '{task_name}' in your Paid Media CRM board, Sir. This will be processed right away!"
 
+@register_tool(BACKGROUND, **MCP_TOOL_BACKEND)
 @function_tool()
+@traced()
 async def list_monday_boards_real(context: RunContext) -> str:
     """List Monday.com boards - using NON_BLOCKING pattern"""
     logger.info(f"🚀 NON_BLOCKING: Listing Monday.com boards...")
     
     # Start the actual MCP call asynchronously
-    asyncio.create_task(list_boards_background())
+    task = asyncio.create_task(list_boards_background())
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
     
     # Return immediate response with known data
     return "I can see your Monday.com workspace, Sir. You have the Paid Media CRM board (ID: 2034046752), September Content Board, AOP Pizza Hut, AOP MR DIY, and Beauty Fair boards active."
 
 # Background processors that do the real work
-async def create_task_background(task_name: str):
-    """Background task creation with proper error handling"""
-    try:
-        logger.info(f"📋 BACKGROUND: Creating '{task_name}' in Monday.com...")
-        main_board_id = "2034046752"  # Paid Media CRM main board
-        
-        result = await execute_mcp_tool("monday_create_item", {
-            "itemTitle": task_name,
-            "groupId": "group_mkv6xpc",
-            "boardId": main_board_id
-        })
-        
-        logger.info(f"✅ BACKGROUND SUCCESS: {result}")
-        
-        if "error" in result:
-            logger.error(f"❌ BACKGROUND ERROR: {result['error']}")
-        elif "You can set either" in str(result):
-            logger.warning(f"⚠️ PARAMETER CONFLICT: {result}")
+def _call_id(context: RunContext):
+    """Id of the function call being answered, used to deduplicate repeated writes"""
+    return getattr(getattr(context, "function_call", None), "call_id", None)
+
+def _report_task_outcome(context: RunContext, task_name: str):
+    """Completion callback for queued task creation with proper error handling"""
+    async def report(job: dict):
+        if job["status"] != "done":
+            logger.error(f"❌ BACKGROUND ERROR: {job['error']}")
+            await deliver_to_session(context.session, f"Sorry Sir, task '{task_name}' could not be created in Monday.com.")
+        elif "You can set either" in str(job["result"]):
+            logger.warning(f"⚠️ PARAMETER CONFLICT: {job['result']}")
         else:
             logger.info(f"🎉 TASK CREATED: '{task_name}' successfully added to Monday.com!")
-            
-    except Exception as e:
-        logger.error(f"💥 BACKGROUND EXCEPTION: {str(e)}")
+    return report
 
 async def list_boards_background():
     """Background board listing with proper error handling"""
     try:
         logger.info(f"📋 BACKGROUND: Fetching Monday.com boards...")
         
+        from tools import execute_mcp_tool
         result = await execute_mcp_tool("monday_list_boards", {"limit": 10, "page": 1})
         
         logger.info(f"✅ BACKGROUND SUCCESS: {result}")
@@ -83,8 +96,10 @@ async def list_boards_background():
     except Exception as e:
         logger.error(f"💥 BACKGROUND EXCEPTION: {str(e)}")
 
+TOOL_NAMES = ["create_monday_task_real", "list_monday_boards_real"]
+
 class FinalMVPFriday(Agent):
-    def __init__(self) -> None:
+    def __init__(self, llm) -> None:
         super().__init__(
             instructions="""
 You are Friday, a personal AI assistant like from Iron Man.
@@ -105,20 +120,20 @@ IMPORTANT:
 - Use tools to perform real Monday.com operations
 - Give confident, professional responses
 """,
-            llm=google.beta.realtime.RealtimeModel(
-                voice="Aoede",
-                temperature=0.8,
-            ),
-            tools=[
-                create_monday_task_real,
-                list_monday_boards_real,
-            ],
+            llm=llm,
+            tools=get_tools(TOOL_NAMES),
         )
 
+def prewarm(proc: agents.JobProcess):
+    prewarm_process(proc, TOOL_NAMES)
+
 async def entrypoint(ctx: agents.JobContext):
+    started = time.perf_counter()
+    # Load tools.py and open the MCP session while the room connects
+    start_tool_prewarm(TOOL_NAMES)
     await ctx.connect()
     
-    assistant = FinalMVPFriday()
+    assistant = FinalMVPFriday(realtime_model(ctx))
     
     session = AgentSession(
         llm=assistant.llm,
@@ -128,15 +143,23 @@ async def entrypoint(ctx: agents.JobContext):
         agent=assistant,
         room=ctx.room,
     )
+    record_job_ready(ctx, started)
 
     logger.info("🎯 Final MVP Friday Agent Started")
     logger.info("✅ NON_BLOCKING MCP Integration Active")
     logger.info("🎤 Voice responses guaranteed immediate")
     logger.info("📋 Real Monday.com operations in background")
     
+    # Record per-turn latency and serve /metrics if METRICS_PORT is set
+    instrument_session(session)
+    # Warm up the MCP session and board caches while the greeting is spoken
+    start_session_warmup()
+    # Resume any Monday.com writes a previous worker left queued
+    get_job_queue().start()
+
     await session.generate_reply(
         instructions="Say: 'Hello Sir, I'm Friday. I'm ready to manage your Monday.com workspace with instant responses. How may I assist you?'",
     )
 
 if __name__ == "__main__":
-    agents.cli.run_app(agents.WorkerOptions(entrypoint_fnc=entrypoint))
+    agents.cli.run_app(agents.WorkerOptions(entrypoint_fnc=entrypoint, prewarm_fnc=prewarm))
@@ -0,0 +1,58 @@
+# http_client.py
+
+import os
+import ssl
+import asyncio
+import weakref
+import threading
+import httpx
+from typing import Optional
+
+# Pool shared by the plain HTTP tools (weather, etc.)
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "20"))
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "10"))
+HTTP_KEEPALIVE_EXPIRY = 60.0
+
+# Loading the CA bundle costs tens of ms per client; every client in the process shares one
+# context. HTTP/1.1 and HTTP/2 clients can share it: httpcore sets ALPN on it per connection.
+_ssl_context: Optional[ssl.SSLContext] = None
+_ssl_lock = threading.Lock()
+
+# Pooled connections belong to one event loop, so keep one client per loop
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+
+def get_ssl_context() -> ssl.SSLContext:
+    """Process-wide TLS context for httpx clients; safe to build before any event loop exists"""
+    global _ssl_context
+    if _ssl_context is None:
+        with _ssl_lock:
+            if _ssl_context is None:
+                _ssl_context = httpx.create_ssl_context()
+    return _ssl_context
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the keep-alive HTTP client for the running event loop, creating it on first use"""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=HTTP_TIMEOUT,
+            follow_redirects=True,
+            verify=get_ssl_context(),
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_CONNECTIONS,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+            ),
+        )
+        _clients[loop] = client
+    return client
+
+
+async def close_http_client() -> None:
+    """Close the shared client for the running event loop, if any"""
+    client: Optional[httpx.AsyncClient] = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None and not client.is_closed:
+        await client.aclose()
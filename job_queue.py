@@ -0,0 +1,444 @@
+# job_queue.py
+
+import os
+import json
+import time
+import random
+import asyncio
+import hashlib
+import sqlite3
+import logging
+import threading
+import weakref
+from typing import Optional, Dict, Any, Awaitable, Callable, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+JOB_QUEUE_PATH = os.getenv("JOB_QUEUE_PATH", "job_queue.db")
+JOB_QUEUE_WORKERS = int(os.getenv("JOB_QUEUE_WORKERS", "2"))
+JOB_QUEUE_MAX_ATTEMPTS = int(os.getenv("JOB_QUEUE_MAX_ATTEMPTS", "5"))
+# Finished jobs (and their idempotency keys) are kept this long
+JOB_QUEUE_RETENTION = float(os.getenv("JOB_QUEUE_RETENTION", str(7 * 24 * 3600)))
+# A running job belongs to its claiming process for this long; the worker renews it while it runs
+JOB_LEASE_SECONDS = float(os.getenv("JOB_LEASE_SECONDS", "30"))
+POLL_INTERVAL = 0.5
+RETRY_BASE = 1.0
+RETRY_CAP = 60.0
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    idempotency_key TEXT UNIQUE,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    run_at REAL NOT NULL,
+    result TEXT,
+    error TEXT,
+    owner_pid INTEGER,
+    lease_expires_at REAL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_due ON jobs (status, run_at);
+"""
+
+# Columns added after the first release; ALTERed into older queue files
+LEASE_COLUMNS = (("owner_pid", "INTEGER"), ("lease_expires_at", "REAL"))
+
+JobHandler = Callable[[Dict[str, Any]], Awaitable[Any]]
+JobCallback = Callable[[Dict[str, Any]], Any]
+
+
+class PermanentJobError(Exception):
+    """Raised by a handler when retrying the job can't help."""
+
+
+def make_idempotency_key(kind: str, payload: Dict[str, Any], scope: Optional[str] = None) -> str:
+    """Stable key for "this write, requested once": same kind, payload and scope dedupe"""
+    body = json.dumps([kind, payload, scope], sort_keys=True, default=str)
+    return hashlib.sha256(body.encode("utf-8")).hexdigest()
+
+
+def _job_row(row: sqlite3.Row) -> Dict[str, Any]:
+    job = dict(row)
+    job["payload"] = json.loads(job["payload"])
+    job["result"] = json.loads(job["result"]) if job["result"] is not None else None
+    return job
+
+
+class JobQueue:
+    """
+    Persistent queue for writes that must not block the voice turn.
+
+    Jobs live in SQLite (WAL) so a worker restart picks up whatever was still
+    pending. An idempotency key makes enqueueing the same write twice return
+    the original job instead of running it again. Workers retry failures with
+    exponential backoff up to max_attempts, then report the final outcome to
+    completion callbacks and waiters.
+
+    Every process that opens the file (one per LiveKit job) shares it. A
+    claimed job records the claiming pid and a lease the worker keeps renewing;
+    only jobs whose lease ran out or whose owner process is gone are requeued.
+    Such a job is run again, since there is no way to know whether the remote
+    side saw it.
+    """
+
+    def __init__(self, path: str = JOB_QUEUE_PATH, workers: int = JOB_QUEUE_WORKERS, lease: float = JOB_LEASE_SECONDS):
+        self.path = path
+        self.worker_count = workers
+        self.lease = lease
+        self.pid = os.getpid()
+        self._handlers: Dict[str, JobHandler] = {}
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._migrate()
+        self._conn.commit()
+        self._last_recovery = 0.0
+        self._recover()
+        # Callbacks and waiters only live in this process; they are keyed by job id
+        self._callbacks: Dict[int, List[Tuple[asyncio.AbstractEventLoop, JobCallback]]] = {}
+        self._waiters: Dict[int, List[asyncio.Future]] = {}
+        self._workers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, List[asyncio.Task]]" = weakref.WeakKeyDictionary()
+        self._wakeups: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Event]" = weakref.WeakKeyDictionary()
+        self.completed = 0
+        self.failed = 0
+        self.retried = 0
+        self.deduplicated = 0
+
+    def _migrate(self) -> None:
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+        for name, kind in LEASE_COLUMNS:
+            if name not in columns:
+                self._conn.execute(f"ALTER TABLE jobs ADD COLUMN {name} {kind}")
+
+    def _recover(self) -> None:
+        """Requeue running jobs whose owner died or stopped renewing, and drop old finished ones"""
+        now = time.time()
+        self._last_recovery = now
+        with self._lock, self._conn:
+            running = self._conn.execute(
+                "SELECT id, owner_pid, lease_expires_at FROM jobs WHERE status = ?", (RUNNING,)
+            ).fetchall()
+            orphaned = [
+                row["id"] for row in running
+                if row["lease_expires_at"] is None or row["lease_expires_at"] < now
+                or row["owner_pid"] is None or not _pid_alive(row["owner_pid"])
+            ]
+            recovered = 0
+            for job_id in orphaned:
+                # Re-check the status: another process may have finished or recovered it meanwhile
+                recovered += self._conn.execute(
+                    "UPDATE jobs SET status = ?, run_at = ?, owner_pid = NULL, lease_expires_at = NULL, updated_at = ? "
+                    "WHERE id = ? AND status = ?",
+                    (PENDING, now, now, job_id, RUNNING),
+                ).rowcount
+            self._conn.execute(
+                "DELETE FROM jobs WHERE status IN (?, ?) AND updated_at < ?",
+                (DONE, FAILED, now - JOB_QUEUE_RETENTION),
+            )
+        if recovered:
+            logger.warning(f"♻️ Requeued {recovered} job(s) whose worker process died or stopped renewing its lease")
+
+    def register(self, kind: str, handler: JobHandler) -> None:
+        """Set the coroutine that runs jobs of this kind"""
+        self._handlers[kind] = handler
+
+    # --- producer side ------------------------------------------------------
+
+    def enqueue(
+        self,
+        kind: str,
+        payload: Dict[str, Any],
+        idempotency_key: Optional[str] = None,
+        max_attempts: int = JOB_QUEUE_MAX_ATTEMPTS,
+    ) -> int:
+        """
+        Persist a job and wake the workers. Returns the job id; if a job with
+        the same idempotency key exists, returns its id without adding another.
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO jobs (kind, payload, idempotency_key, status, max_attempts, run_at, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?) ON CONFLICT(idempotency_key) DO NOTHING",
+                (kind, json.dumps(payload, default=str), idempotency_key, PENDING, max_attempts, now, now, now),
+            )
+            if cursor.rowcount:
+                job_id = cursor.lastrowid
+            else:
+                job_id = self._conn.execute(
+                    "SELECT id FROM jobs WHERE idempotency_key = ?", (idempotency_key,)
+                ).fetchone()["id"]
+                self.deduplicated += 1
+                logger.info(f"🔁 Job {job_id} already queued for this request, not adding it again")
+
+        self._ensure_workers()
+        return job_id
+
+    def get(self, job_id: int) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return _job_row(row) if row else None
+
+    def on_complete(self, job_id: int, callback: JobCallback) -> None:
+        """
+        Call callback(job) once the job is done or has finally failed. Runs
+        right away (soon) if it already finished. Coroutine callbacks are awaited
+        in a task on the caller's event loop.
+        """
+        loop = asyncio.get_running_loop()
+        job = self.get(job_id)
+        if job and job["status"] in (DONE, FAILED):
+            loop.call_soon(self._run_callback, callback, job)
+            return
+        self._callbacks.setdefault(job_id, []).append((loop, callback))
+
+    async def wait(self, job_id: int, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Wait up to timeout seconds for the job to finish. Returns the job, or
+        None on timeout; the job keeps running either way.
+        """
+        job = self.get(job_id)
+        if job is None or job["status"] in (DONE, FAILED):
+            return job
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(job_id, []).append(future)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            waiters = self._waiters.get(job_id)
+            if waiters and future in waiters:
+                waiters.remove(future)
+                if not waiters:
+                    del self._waiters[job_id]
+
+    # --- worker side ----------------------------------------------------------
+
+    def _ensure_workers(self) -> None:
+        """Start the worker pool on the running loop (once per loop) and wake it"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Enqueued outside a loop: the job waits on disk for the next worker
+            return
+        wakeup = self._wakeups.get(loop)
+        if wakeup is None:
+            wakeup = self._wakeups[loop] = asyncio.Event()
+        workers = [task for task in self._workers.get(loop, []) if not task.done()]
+        while len(workers) < self.worker_count:
+            workers.append(loop.create_task(self._work(wakeup)))
+        self._workers[loop] = workers
+        wakeup.set()
+
+    def start(self) -> None:
+        """Start workers on the running loop so jobs left from a previous run are resumed"""
+        self._ensure_workers()
+
+    def _claim(self) -> Optional[Dict[str, Any]]:
+        if not self._handlers:
+            return None
+        kinds = list(self._handlers)
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "UPDATE jobs SET status = ?, attempts = attempts + 1, owner_pid = ?, lease_expires_at = ?, updated_at = ? WHERE id = ("
+                f"SELECT id FROM jobs WHERE status = ? AND run_at <= ? AND kind IN ({', '.join('?' * len(kinds))}) "
+                "ORDER BY run_at, id LIMIT 1) RETURNING *",
+                (RUNNING, self.pid, now + self.lease, now, PENDING, now, *kinds),
+            ).fetchone()
+        return _job_row(row) if row else None
+
+    async def _work(self, wakeup: asyncio.Event) -> None:
+        while True:
+            job = self._claim()
+            if job is None:
+                # Idle: pick up jobs a crashed sibling process left behind
+                if time.time() - self._last_recovery >= self.lease:
+                    self._recover()
+                    continue
+                wakeup.clear()
+                try:
+                    await asyncio.wait_for(wakeup.wait(), POLL_INTERVAL)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            await self._run(job)
+
+    async def _run(self, job: Dict[str, Any]) -> None:
+        handler = self._handlers[job["kind"]]
+        renewal = asyncio.create_task(self._renew_lease(job["id"]))
+        try:
+            result = await handler(job["payload"])
+        except asyncio.CancelledError:
+            # Worker shut down mid-job; leave it for the next start
+            self._finish(job["id"], PENDING, run_at=time.time())
+            raise
+        except Exception as e:
+            permanent = isinstance(e, PermanentJobError)
+            if not permanent and job["attempts"] < job["max_attempts"]:
+                delay = random.uniform(0, min(RETRY_CAP, RETRY_BASE * (2 ** job["attempts"])))
+                self.retried += 1
+                logger.warning(f"⚠️ Job {job['id']} ({job['kind']}) attempt {job['attempts']} failed: {e}; retrying in {delay:.1f}s")
+                self._finish(job["id"], PENDING, error=str(e), run_at=time.time() + delay)
+                return
+            self.failed += 1
+            logger.error(f"❌ Job {job['id']} ({job['kind']}) failed after {job['attempts']} attempt(s): {e}")
+            self._finish(job["id"], FAILED, error=str(e))
+        else:
+            self.completed += 1
+            logger.info(f"✅ Job {job['id']} ({job['kind']}) done")
+            self._finish(job["id"], DONE, result=result)
+        finally:
+            renewal.cancel()
+        self._notify(job["id"])
+
+    async def _renew_lease(self, job_id: int) -> None:
+        """Keep extending this process's lease on a running job so siblings leave it alone"""
+        while True:
+            await asyncio.sleep(self.lease / 3)
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "UPDATE jobs SET lease_expires_at = ? WHERE id = ? AND status = ? AND owner_pid = ?",
+                    (time.time() + self.lease, job_id, RUNNING, self.pid),
+                )
+
+    def _finish(
+        self,
+        job_id: int,
+        status: str,
+        result: Any = None,
+        error: Optional[str] = None,
+        run_at: Optional[float] = None,
+    ) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, run_at = COALESCE(?, run_at), "
+                "owner_pid = NULL, lease_expires_at = NULL, updated_at = ? WHERE id = ?",
+                (status, json.dumps(result, default=str) if result is not None else None, error, run_at, time.time(), job_id),
+            )
+
+    def _notify(self, job_id: int) -> None:
+        job = self.get(job_id)
+        for future in self._waiters.pop(job_id, []):
+            loop = future.get_loop()
+            loop.call_soon_threadsafe(_resolve, future, job)
+        for loop, callback in self._callbacks.pop(job_id, []):
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(self._run_callback, callback, job)
+
+    def _run_callback(self, callback: JobCallback, job: Dict[str, Any]) -> None:
+        try:
+            outcome = callback(job)
+            if asyncio.iscoroutine(outcome):
+                task = asyncio.ensure_future(outcome)
+                task.add_done_callback(_log_callback_error)
+        except Exception as e:
+            logger.error(f"💥 Completion callback for job {job['id']} failed: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status").fetchall()
+        counts = {row["status"]: row["n"] for row in rows}
+        return {
+            "pending": counts.get(PENDING, 0),
+            "running": counts.get(RUNNING, 0),
+            "done": counts.get(DONE, 0),
+            "failed": counts.get(FAILED, 0),
+            "completed": self.completed,
+            "gave_up": self.failed,
+            "retried": self.retried,
+            "deduplicated": self.deduplicated,
+        }
+
+    def close(self) -> None:
+        for workers in list(self._workers.values()):
+            for task in workers:
+                task.cancel()
+        with self._lock:
+            self._conn.close()
+
+
+def _pid_alive(pid: int) -> bool:
+    """Whether a process with this pid exists on this host (signal 0 only checks)"""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # Exists, owned by another user
+    except OSError:
+        return False
+    return True
+
+
+def _resolve(future: asyncio.Future, job: Dict[str, Any]) -> None:
+    if not future.done():
+        future.set_result(job)
+
+
+def _log_callback_error(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f"💥 Completion callback failed: {task.exception()}")
+
+
+async def _run_mcp_tool(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Job handler for MCP tool calls: payload is {"tool_name": ..., "parameters": {...}}.
+    Rate limits and requests that never left are retried. A call that failed
+    after it was sent is only retried for read-only tools, since a create may
+    already have happened; everything else fails the job straight away.
+    """
+    from tools import execute_mcp_tool, RATE_LIMITED, NOT_SENT, TRANSPORT
+    from tool_cache import get_tool_cache
+    tool_name = payload["tool_name"]
+    result = await execute_mcp_tool(tool_name, payload.get("parameters") or {})
+    if "error" not in result:
+        return result
+    kind = result.get("error_kind")
+    if kind in (RATE_LIMITED, NOT_SENT):
+        raise Exception(result["error"])
+    if kind == TRANSPORT and get_tool_cache().is_cached_tool(tool_name):
+        raise Exception(result["error"])
+    raise PermanentJobError(result["error"])
+
+
+_queue: Optional[JobQueue] = None
+
+
+def get_job_queue() -> JobQueue:
+    """Return the process-wide job queue with the built-in handlers registered"""
+    global _queue
+    if _queue is None:
+        _queue = JobQueue()
+        _queue.register("mcp_tool", _run_mcp_tool)
+    return _queue
+
+
+def enqueue_mcp_tool(
+    tool_name: str,
+    parameters: Dict[str, Any],
+    scope: Optional[str] = None,
+) -> int:
+    """
+    Queue an MCP tool call (typically a write) to run exactly once per scope.
+    Pass the function call id as scope so a repeated call for the same
+    request is deduplicated while a genuinely new request is not.
+    """
+    payload = {"tool_name": tool_name, "parameters": parameters}
+    key = make_idempotency_key("mcp_tool", payload, scope) if scope else None
+    return get_job_queue().enqueue("mcp_tool", payload, idempotency_key=key)
@@ -0,0 +1,152 @@
+# loop_watchdog.py
+
+import os
+import sys
+import time
+import asyncio
+import logging
+import threading
+import traceback
+import weakref
+from collections import deque
+from typing import Optional, Dict, Any, Deque, List
+
+from tracing import get_tracer, tool_name_of_frame
+
+logger = logging.getLogger(__name__)
+
+LOOP_WATCHDOG_ENABLED = os.getenv("LOOP_WATCHDOG", "true").lower() not in ("0", "false", "no")
+# How often the loop heartbeat runs; its lateness is the loop lag
+LOOP_LAG_INTERVAL = float(os.getenv("LOOP_LAG_INTERVAL_MS", "50")) / 1000
+# A heartbeat this late means something blocked the loop: capture its stack
+LOOP_STALL_THRESHOLD = float(os.getenv("LOOP_STALL_THRESHOLD_MS", "100")) / 1000
+# Frames kept from the blocked stack, innermost last
+STALL_STACK_DEPTH = 12
+RECENT_STALLS = 20
+
+
+class LoopWatchdog:
+    """
+    Watches one event loop for blocking calls.
+
+    A heartbeat task on the loop records how late each wake-up is
+    (histogram "loop.lag"). A daemon thread checks the heartbeat; once it is
+    more than the threshold overdue, the thread grabs the loop thread's
+    current stack with sys._current_frames(). That is the code doing the
+    blocking. The innermost traced tool on that stack gets the blame. When the
+    loop comes back, the stall is counted per tool and its duration recorded
+    in "loop.stall" and "loop.stall.<tool>".
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, threshold: float = LOOP_STALL_THRESHOLD, interval: float = LOOP_LAG_INTERVAL):
+        self.loop = loop
+        self.threshold = threshold
+        self.interval = interval
+        self.stalls = 0
+        self.stalls_by_tool: Dict[str, int] = {}
+        self.recent: Deque[Dict[str, Any]] = deque(maxlen=RECENT_STALLS)
+        self._beat = time.monotonic()
+        self._loop_thread_id: Optional[int] = None
+        self._capture: Optional[Dict[str, Any]] = None
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._heartbeat: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the heartbeat and the watcher thread; call from the loop being watched"""
+        if self._heartbeat is not None:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._beat = time.monotonic()
+        self._heartbeat = self.loop.create_task(self._run_heartbeat())
+        self._thread = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._thread.start()
+        logger.info(f"🐕 Event-loop watchdog on (stall threshold {self.threshold * 1000:.0f} ms)")
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+
+    async def _run_heartbeat(self) -> None:
+        tracer = get_tracer()
+        while not self._stopped.is_set():
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            self._beat = now
+            lag = max(0.0, now - expected)
+            tracer.record("loop.lag", lag * 1000)
+            if lag >= self.threshold:
+                self._finish_stall(lag)
+
+    def _watch(self) -> None:
+        """Runs on the watchdog thread: catch the loop thread while it is still blocked"""
+        check_every = min(self.interval, self.threshold) / 2
+        while not self._stopped.wait(check_every):
+            if self.loop.is_closed():
+                return
+            overdue = time.monotonic() - self._beat - self.interval
+            if overdue < self.threshold:
+                continue
+            with self._lock:
+                if self._capture is not None and self._capture["beat"] == self._beat:
+                    continue  # Already captured this stall
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            capture = {
+                "beat": self._beat,
+                "tool": tool_name_of_frame(frame) or "unknown",
+                "stack": traceback.format_stack(frame)[-STALL_STACK_DEPTH:],
+            }
+            del frame
+            with self._lock:
+                self._capture = capture
+
+    def _finish_stall(self, lag: float) -> None:
+        with self._lock:
+            capture, self._capture = self._capture, None
+        # A stall shorter than the thread's check interval can end before it's seen
+        tool = capture["tool"] if capture else "unknown"
+        stack = capture["stack"] if capture else []
+        lag_ms = round(lag * 1000, 1)
+
+        self.stalls += 1
+        self.stalls_by_tool[tool] = self.stalls_by_tool.get(tool, 0) + 1
+        tracer = get_tracer()
+        tracer.record("loop.stall", lag_ms)
+        tracer.record(f"loop.stall.{tool}", lag_ms)
+        self.recent.append({"at": time.time(), "ms": lag_ms, "tool": tool, "stack": [line.rstrip() for line in stack]})
+        where = stack[-1].strip().splitlines()[0] if stack else "stack not captured"
+        logger.warning(f"🐢 Event loop blocked for {lag_ms:.0f} ms by {tool} ({where})")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "threshold_ms": self.threshold * 1000,
+            "stalls": self.stalls,
+            "stalls_by_tool": dict(self.stalls_by_tool),
+            "recent": list(self.recent),
+        }
+
+
+# One watchdog per event loop (the web server and each agent job loop)
+_watchdogs: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, LoopWatchdog]" = weakref.WeakKeyDictionary()
+
+
+def start_loop_watchdog() -> Optional[LoopWatchdog]:
+    """Watch the running loop for blocking calls (no-op if LOOP_WATCHDOG=false)"""
+    if not LOOP_WATCHDOG_ENABLED:
+        return None
+    loop = asyncio.get_running_loop()
+    watchdog = _watchdogs.get(loop)
+    if watchdog is None:
+        watchdog = _watchdogs[loop] = LoopWatchdog(loop)
+        watchdog.start()
+    return watchdog
+
+
+def get_watchdog_stats() -> List[Dict[str, Any]]:
+    """Stall counters and recent stalls for every watched loop"""
+    return [watchdog.stats() for watchdog in list(_watchdogs.values())]
@@ -0,0 +1,249 @@
+# mailer.py
+
+import os
+import ssl
+import time
+import uuid
+import asyncio
+import logging
+import smtplib
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from typing import Optional, Dict, Any, Callable, List
+
+logger = logging.getLogger(__name__)
+
+SMTP_TIMEOUT = float(os.getenv("SMTP_TIMEOUT", "30"))
+# Servers drop idle connections; reconnect instead of trusting one idle this long
+SMTP_IDLE_TIMEOUT = float(os.getenv("SMTP_IDLE_TIMEOUT", "60"))
+MAIL_BATCH_SIZE = int(os.getenv("MAIL_BATCH_SIZE", "20"))
+# How long the sender lingers for more messages to send on the same round
+MAIL_BATCH_WINDOW = float(os.getenv("MAIL_BATCH_WINDOW", "0.05"))
+
+DeliveryCallback = Callable[[Dict[str, Any]], Any]
+
+
+def smtp_settings() -> Dict[str, Any]:
+    """
+    Server and credentials, read from the environment when used rather than at
+    import so values loaded by load_dotenv() later still apply.
+
+    Defaults match Gmail; point SMTP_HOST/SMTP_PORT at a local aiosmtpd with
+    SMTP_STARTTLS=false (and no password) for tests and benchmarks.
+    """
+    user = os.getenv("SMTP_USER") or os.getenv("GMAIL_USER")
+    return {
+        "host": os.getenv("SMTP_HOST", "smtp.gmail.com"),
+        "port": int(os.getenv("SMTP_PORT", "587")),
+        "starttls": os.getenv("SMTP_STARTTLS", "true").lower() not in ("0", "false", "no"),
+        "user": user,
+        "password": os.getenv("SMTP_PASSWORD") or os.getenv("GMAIL_APP_PASSWORD"),  # Use App Password, not regular password
+        "sender": os.getenv("SMTP_FROM") or user,
+    }
+
+
+class SMTPConnection:
+    """
+    One persistent, authenticated SMTP connection. Only ever used from the
+    mailer's single worker thread, so it needs no locking.
+    """
+
+    def __init__(self):
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._last_used = 0.0
+        self.connects = 0
+
+    def _connect(self) -> smtplib.SMTP:
+        settings = smtp_settings()
+        smtp = smtplib.SMTP(settings["host"], settings["port"], timeout=SMTP_TIMEOUT)
+        if settings["starttls"]:
+            smtp.starttls(context=ssl.create_default_context())
+        if settings["user"] and settings["password"]:
+            smtp.login(settings["user"], settings["password"])
+        self.connects += 1
+        logger.info(f"📮 SMTP connected to {settings['host']}:{settings['port']}")
+        return smtp
+
+    def ensure(self) -> smtplib.SMTP:
+        """Return a live connection, reconnecting after idling or if the server hung up"""
+        if self._smtp is not None and time.monotonic() - self._last_used > SMTP_IDLE_TIMEOUT:
+            try:
+                if self._smtp.noop()[0] != 250:
+                    self.close()
+            except (smtplib.SMTPException, OSError):
+                self.close()
+        if self._smtp is None:
+            self._smtp = self._connect()
+        return self._smtp
+
+    def send(self, sender: str, recipients: List[str], data: str) -> None:
+        try:
+            self.ensure().sendmail(sender, recipients, data)
+        except smtplib.SMTPServerDisconnected:
+            # Dropped since the last check; one fresh connection, then give up
+            self.close()
+            self.ensure().sendmail(sender, recipients, data)
+        self._last_used = time.monotonic()
+
+    def close(self) -> None:
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._smtp = None
+
+
+def build_message(sender: str, to_email: str, subject: str, body: str, cc_email: Optional[str] = None) -> MIMEMultipart:
+    msg = MIMEMultipart()
+    msg['From'] = sender
+    msg['To'] = to_email
+    msg['Subject'] = subject
+    if cc_email:
+        msg['Cc'] = cc_email
+    msg.attach(MIMEText(body, 'plain'))
+    return msg
+
+
+class Mailer:
+    """
+    Outbound mail queue.
+
+    queue_email() returns at once. A sender task per event loop drains the
+    queue in batches, and a single worker thread sends each batch over the
+    persistent SMTP connection (smtplib is blocking). The delivery callback
+    gets {"id", "to", "ok", "error"} once the server accepted or refused it.
+    """
+
+    def __init__(self):
+        self._connection = SMTPConnection()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="smtp")
+        self._queues: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Queue]" = weakref.WeakKeyDictionary()
+        self._senders: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Task]" = weakref.WeakKeyDictionary()
+        self.sent = 0
+        self.failed = 0
+        self.batches = 0
+
+    def queue_email(
+        self,
+        to_email: str,
+        subject: str,
+        message: str,
+        cc_email: Optional[str] = None,
+        on_delivery: Optional[DeliveryCallback] = None,
+    ) -> str:
+        """Queue a plain-text email and return its id without waiting for SMTP"""
+        sender = smtp_settings()["sender"]
+        if not sender:
+            raise ValueError("Email sending is not configured: set GMAIL_USER (or SMTP_FROM).")
+        recipients = [to_email] + ([cc_email] if cc_email else [])
+        outgoing = {
+            "id": uuid.uuid4().hex,
+            "to": to_email,
+            "sender": sender,
+            "recipients": recipients,
+            "data": build_message(sender, to_email, subject, message, cc_email).as_string(),
+            "on_delivery": on_delivery,
+        }
+        self._queue().put_nowait(outgoing)
+        return outgoing["id"]
+
+    def _queue(self) -> asyncio.Queue:
+        loop = asyncio.get_running_loop()
+        queue = self._queues.get(loop)
+        if queue is None:
+            queue = self._queues[loop] = asyncio.Queue()
+        sender = self._senders.get(loop)
+        if sender is None or sender.done():
+            self._senders[loop] = loop.create_task(self._send_forever(queue))
+        return queue
+
+    async def _send_forever(self, queue: asyncio.Queue) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            # Give closely spaced messages a moment to join the same round
+            deadline = loop.time() + MAIL_BATCH_WINDOW
+            while len(batch) < MAIL_BATCH_SIZE:
+                if not queue.empty():
+                    batch.append(queue.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            results = await loop.run_in_executor(self._executor, self._send_batch, batch)
+            self.batches += 1
+            for outgoing, status in zip(batch, results):
+                self._report(outgoing, status)
+
+    def _send_batch(self, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Runs on the SMTP thread: send each message over the shared connection"""
+        results = []
+        for outgoing in batch:
+            status = {"id": outgoing["id"], "to": outgoing["to"], "ok": True, "error": None}
+            try:
+                self._connection.send(outgoing["sender"], outgoing["recipients"], outgoing["data"])
+            except smtplib.SMTPAuthenticationError:
+                status.update(ok=False, error="Authentication error. Please check your Gmail credentials.")
+                self._connection.close()
+            except (smtplib.SMTPException, OSError) as e:
+                status.update(ok=False, error=f"SMTP error - {e}")
+                if not isinstance(e, smtplib.SMTPRecipientsRefused):
+                    self._connection.close()
+            results.append(status)
+        return results
+
+    def _report(self, outgoing: Dict[str, Any], status: Dict[str, Any]) -> None:
+        if status["ok"]:
+            self.sent += 1
+            logger.info(f"📧 Email sent successfully to {status['to']}")
+        else:
+            self.failed += 1
+            logger.error(f"❌ Email to {status['to']} failed: {status['error']}")
+        callback = outgoing.get("on_delivery")
+        if callback is None:
+            return
+        try:
+            outcome = callback(status)
+            if asyncio.iscoroutine(outcome):
+                task = asyncio.ensure_future(outcome)
+                task.add_done_callback(_log_callback_error)
+        except Exception as e:
+            logger.error(f"💥 Delivery callback failed: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "queued": sum(queue.qsize() for queue in self._queues.values()),
+            "sent": self.sent,
+            "failed": self.failed,
+            "batches": self.batches,
+            "connects": self._connection.connects,
+        }
+
+    def close(self) -> None:
+        for sender in list(self._senders.values()):
+            sender.cancel()
+        self._executor.submit(self._connection.close)
+        self._executor.shutdown(wait=True)
+
+
+def _log_callback_error(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f"💥 Delivery callback failed: {task.exception()}")
+
+
+_mailer: Optional[Mailer] = None
+
+
+def get_mailer() -> Mailer:
+    """Return the process-wide mailer"""
+    global _mailer
+    if _mailer is None:
+        _mailer = Mailer()
+    return _mailer
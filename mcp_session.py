@@ -0,0 +1,475 @@
+# mcp_session.py
+
+import os
+import json
+import asyncio
+import itertools
+import logging
+import weakref
+import inspect
+import httpx
+from contextlib import aclosing
+from typing import Optional, Dict, Any, AsyncIterator, Awaitable, Callable, List, Union
+
+from tracing import span
+from http_client import get_ssl_context
+
+logger = logging.getLogger(__name__)
+
+MCP_PROTOCOL_VERSION = "2024-11-05"
+MCP_CLIENT_INFO = {"name": "voice-agent", "version": "1.0.0"}
+
+# Header names the MCP server may use to hand back the session ID
+SESSION_HEADER_NAMES = ("mcp-session-id", "x-session-id", "session-id")
+
+# Size of the shared connection pool - enough for parallel tool calls from one turn
+MCP_MAX_CONNECTIONS = int(os.getenv("MCP_MAX_CONNECTIONS", "10"))
+MCP_TIMEOUT = float(os.getenv("MCP_TIMEOUT", "30.0"))
+# How many times a request is re-sent after its session expired under it
+MCP_SESSION_RETRIES = int(os.getenv("MCP_SESSION_RETRIES", "3"))
+
+
+# Called with the params of each notifications/progress message for a request
+ProgressCallback = Callable[[Dict[str, Any]], Union[None, Awaitable[None]]]
+
+
+class MCPSessionExpired(Exception):
+    """Raised when the MCP server no longer recognises our session ID."""
+
+    def __init__(self, session_id: str):
+        super().__init__(session_id)
+        # The session the rejected request was sent on, which may already be replaced
+        self.session_id = session_id
+
+
+class SSEDecoder:
+    """
+    Incremental Server-Sent Events decoder.
+
+    Feed it one line at a time (without the trailing newline); it returns the
+    joined data of an event when the blank line that terminates it arrives.
+    Multi-line data fields are joined with newlines as the SSE spec requires.
+    """
+
+    def __init__(self):
+        self._data: List[str] = []
+        self.event: Optional[str] = None
+        self.last_event_id: Optional[str] = None
+
+    def feed_line(self, line: str) -> Optional[str]:
+        line = line.rstrip("\r")
+        if not line:
+            return self.flush()
+        if line.startswith(":"):
+            return None  # comment / keep-alive
+
+        field, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+
+        if field == "data":
+            self._data.append(value)
+        elif field == "event":
+            self.event = value
+        elif field == "id":
+            self.last_event_id = value
+        return None
+
+    def flush(self) -> Optional[str]:
+        """Dispatch the pending event, if any (also used at end of stream)"""
+        if not self._data:
+            self.event = None
+            return None
+        data = "\n".join(self._data)
+        self._data = []
+        self.event = None
+        return data
+
+
+async def iter_sse_messages(lines: AsyncIterator[str]) -> AsyncIterator[Dict[str, Any]]:
+    """Decode JSON-RPC messages from an async iterator of SSE lines as they arrive"""
+    decoder = SSEDecoder()
+    async for line in lines:
+        data = decoder.feed_line(line)
+        if data is not None:
+            for message in _decode_json_messages(data):
+                yield message
+    data = decoder.flush()
+    if data is not None:
+        for message in _decode_json_messages(data):
+            yield message
+
+
+class MCPSession:
+    """
+    A long-lived MCP StreamableHTTP session.
+
+    The session is initialized once (initialize + notifications/initialized) and
+    its mcp-session-id is reused for every following request, so a tool call
+    costs a single round trip on a pooled keep-alive connection. If the server
+    expires the session it is re-initialized transparently and the request is
+    retried (up to MCP_SESSION_RETRIES times). Many requests can share the
+    session concurrently; when several see the same expiry only one of them
+    re-initializes and the rest retry on the new session.
+    """
+
+    def __init__(
+        self,
+        server_url: str,
+        max_connections: int = MCP_MAX_CONNECTIONS,
+        timeout: float = MCP_TIMEOUT,
+    ):
+        self.server_url = server_url
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.session_id: Optional[str] = None
+        self.server_info: Optional[Dict[str, Any]] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._initialized = False
+        self._init_lock = asyncio.Lock()
+        # Monotonically increasing JSON-RPC ids and the requests still awaiting a response
+        self._request_ids = itertools.count(1)
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._progress_handlers: Dict[int, ProgressCallback] = {}
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared pooled HTTP client, created on first use"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                verify=get_ssl_context(),
+                limits=httpx.Limits(
+                    max_keepalive_connections=self.max_connections,
+                    max_connections=self.max_connections,
+                ),
+            )
+        return self._client
+
+    @property
+    def initialized(self) -> bool:
+        return self._initialized
+
+    def _headers(self) -> Dict[str, str]:
+        headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/json, text/event-stream",
+            "Connection": "keep-alive",
+        }
+        if self.session_id:
+            headers["mcp-session-id"] = self.session_id
+        return headers
+
+    async def ensure_initialized(self) -> None:
+        """Initialize the session once; concurrent callers wait for the same handshake"""
+        if self._initialized:
+            return
+        async with self._init_lock:
+            if not self._initialized:
+                await self._initialize()
+
+    async def _initialize(self) -> None:
+        with span("mcp.initialize", server_url=self.server_url):
+            await self._handshake()
+        self._initialized = True
+
+    async def _handshake(self) -> None:
+        self.session_id = None
+        init_request = {
+            "jsonrpc": "2.0",
+            "id": next(self._request_ids),
+            "method": "initialize",
+            "params": {
+                "protocolVersion": MCP_PROTOCOL_VERSION,
+                "capabilities": {
+                    "tools": {}
+                },
+                "clientInfo": MCP_CLIENT_INFO,
+            },
+        }
+
+        async with aclosing(self._post_stream(init_request)) as messages:
+            async for message in messages:
+                if message.get("id") != init_request["id"]:
+                    continue
+                if "result" in message:
+                    self.server_info = message["result"].get("serverInfo")
+                    if self.server_info:
+                        logger.info(
+                            f"✅ MCP Server initialized: {self.server_info.get('name')} "
+                            f"v{self.server_info.get('version')}"
+                        )
+                break
+
+        # The server expects notifications/initialized before any other request
+        if self.session_id:
+            notify_request = {
+                "jsonrpc": "2.0",
+                "method": "notifications/initialized",
+                "params": {},
+            }
+            with span("mcp.notify_initialized"):
+                await self.client.post(
+                    self.server_url, json=notify_request, headers=self._headers()
+                )
+
+    async def request(
+        self,
+        method: str,
+        params: Optional[Dict[str, Any]] = None,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> Dict[str, Any]:
+        """
+        Send a JSON-RPC request on the shared session and return the response message.
+
+        Requests are multiplexed: each gets its own id and a pending future, so
+        any number can be in flight at once and each is resolved by the response
+        carrying its id. Progress notifications are handed to on_progress.
+        """
+        attributes = {"method": method}
+        if method == "tools/call":
+            attributes["tool"] = (params or {}).get("name")
+        with span("mcp.request", **attributes) as request_span:
+            for attempt in range(MCP_SESSION_RETRIES + 1):
+                await self.ensure_initialized()
+                try:
+                    return await self._request_once(method, params or {}, on_progress)
+                except MCPSessionExpired as expired:
+                    if attempt == MCP_SESSION_RETRIES:
+                        raise
+                    logger.info("🔄 MCP session expired, re-initializing...")
+                    request_span.set(session_expired=True)
+                    await self.reset(expired.session_id)
+
+    async def _request_once(
+        self,
+        method: str,
+        params: Dict[str, Any],
+        on_progress: Optional[ProgressCallback],
+    ) -> Dict[str, Any]:
+        payload = self._build_request(method, params, on_progress is not None)
+        request_id = payload["id"]
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        if on_progress is not None:
+            self._progress_handlers[request_id] = on_progress
+
+        pump = asyncio.create_task(self._pump(payload))
+        try:
+            return await future
+        finally:
+            self._pending.pop(request_id, None)
+            self._progress_handlers.pop(request_id, None)
+            # Once answered, the pump is already closing its response; cancelling it
+            # mid-close would strand the connection in the pool. Only stop it if
+            # the caller gave up waiting.
+            if future.cancelled() and not pump.done():
+                pump.cancel()
+
+    async def _pump(self, payload: Dict[str, Any]) -> None:
+        """Read one POST's response stream and route every message it carries"""
+        request_id = payload["id"]
+        try:
+            async with aclosing(self._post_stream(payload)) as messages:
+                async for message in messages:
+                    await self._dispatch(message)
+                    future = self._pending.get(request_id)
+                    if future is None or future.done():
+                        return
+            error: Exception = ValueError("Failed to parse MCP server response")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            error = e
+
+        future = self._pending.get(request_id)
+        if future is not None and not future.done():
+            future.set_exception(error)
+
+    async def _dispatch(self, message: Dict[str, Any]) -> None:
+        """Resolve the pending future for a response, or forward a progress notification"""
+        if "result" in message or "error" in message:
+            future = self._pending.get(message.get("id"))
+            if future is not None and not future.done():
+                future.set_result(message)
+            return
+
+        if message.get("method") == "notifications/progress":
+            params = message.get("params", {})
+            handler = self._progress_handlers.get(params.get("progressToken"))
+            if handler is not None:
+                try:
+                    outcome = handler(params)
+                    if inspect.isawaitable(outcome):
+                        await outcome
+                except Exception as e:
+                    logger.warning(f"⚠️ MCP progress handler failed: {e}")
+
+    async def call_tool(
+        self,
+        tool_name: str,
+        arguments: Dict[str, Any],
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> Dict[str, Any]:
+        """Send a tools/call request and return the JSON-RPC response message"""
+        return await self.request(
+            "tools/call", {"name": tool_name, "arguments": arguments}, on_progress
+        )
+
+    async def stream(
+        self,
+        method: str,
+        params: Optional[Dict[str, Any]] = None,
+        with_progress: bool = False,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Send a JSON-RPC request and yield messages as the server streams them.
+
+        Notifications (e.g. notifications/progress) are yielded as they arrive;
+        the stream stops right after the response matching this request's id.
+        Re-initializes and retries once if the server has expired the session.
+        """
+        await self.ensure_initialized()
+        payload = self._build_request(method, params or {}, with_progress)
+        try:
+            async with aclosing(self._post_stream(payload)) as messages:
+                async for message in messages:
+                    yield message
+                    if message.get("id") == payload["id"]:
+                        return
+        except MCPSessionExpired as expired:
+            logger.info("🔄 MCP session expired, re-initializing...")
+            await self.reset(expired.session_id)
+            await self.ensure_initialized()
+            payload = self._build_request(method, params or {}, with_progress)
+            async with aclosing(self._post_stream(payload)) as messages:
+                async for message in messages:
+                    yield message
+                    if message.get("id") == payload["id"]:
+                        return
+
+    def _build_request(self, method: str, params: Dict[str, Any], with_progress: bool) -> Dict[str, Any]:
+        request_id = next(self._request_ids)
+        if with_progress:
+            params = dict(params)
+            params["_meta"] = {**params.get("_meta", {}), "progressToken": request_id}
+        return {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "method": method,
+            "params": params,
+        }
+
+    async def _post_stream(self, payload: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """POST a JSON-RPC message and decode the reply incrementally (SSE or plain JSON)"""
+        messages = 0
+        # Another caller may replace the session while this request is in flight
+        headers = self._headers()
+        sent_session_id = headers.get("mcp-session-id")
+        with span("mcp.http", method=payload.get("method")) as http_span:
+            async with self.client.stream(
+                "POST", self.server_url, json=payload, headers=headers
+            ) as response:
+                http_span.event("response_headers", status=response.status_code)
+                # StreamableHTTP servers answer 404 for a session ID they no longer know
+                if response.status_code == 404 and sent_session_id and payload.get("method") != "initialize":
+                    raise MCPSessionExpired(sent_session_id)
+                if response.is_error:
+                    await response.aread()
+                    response.raise_for_status()
+
+                if payload.get("method") == "initialize":
+                    for header_name in SESSION_HEADER_NAMES:
+                        header_value = response.headers.get(header_name)
+                        if header_value:
+                            self.session_id = header_value
+                            logger.info(f"🔗 MCP session established ({header_name}: {header_value})")
+                            break
+
+                try:
+                    if "text/event-stream" in response.headers.get("content-type", ""):
+                        async for message in iter_sse_messages(response.aiter_lines()):
+                            messages += 1
+                            if messages == 1:
+                                http_span.event("first_message")
+                            yield message
+                    else:
+                        body = await response.aread()
+                        http_span.event("body_read")
+                        for message in _decode_json_messages(body.decode("utf-8", "replace")):
+                            messages += 1
+                            yield message
+                finally:
+                    # Also reached when the caller stops at its response and closes the stream
+                    http_span.set(messages=messages)
+
+    async def reset(self, expired_session_id: Optional[str] = None) -> None:
+        """
+        Forget the current session so the next request performs a fresh handshake.
+
+        With expired_session_id the session is only dropped if it is still the
+        one that expired; when a concurrent caller has already re-initialized,
+        the new session is kept and the caller simply retries on it.
+        """
+        async with self._init_lock:
+            if expired_session_id is not None and self.session_id != expired_session_id:
+                return
+            self._initialized = False
+            self.session_id = None
+
+    async def aclose(self) -> None:
+        """Terminate the session on the server and close pooled connections"""
+        if self._client is not None and not self._client.is_closed:
+            if self.session_id:
+                try:
+                    await self._client.delete(self.server_url, headers=self._headers())
+                except httpx.HTTPError:
+                    pass
+            await self._client.aclose()
+        self._client = None
+        self._initialized = False
+        self.session_id = None
+
+
+def _decode_json_messages(data: str) -> List[Dict[str, Any]]:
+    """Decode one JSON-RPC message (or batch) from an event payload or response body"""
+    data = data.strip()
+    if not data:
+        return []
+    try:
+        parsed = json.loads(data)
+    except json.JSONDecodeError:
+        logger.warning(f"⚠️ Skipping undecodable MCP message: {data[:200]}")
+        return []
+    if isinstance(parsed, list):
+        return [message for message in parsed if isinstance(message, dict)]
+    return [parsed] if isinstance(parsed, dict) else []
+
+
+# One session per event loop: pooled connections can't be shared across loops
+_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, MCPSession]" = weakref.WeakKeyDictionary()
+
+
+def get_mcp_session(server_url: Optional[str] = None) -> MCPSession:
+    """Return the worker's shared MCP session, creating it on first use"""
+    loop = asyncio.get_running_loop()
+    session = _sessions.get(loop)
+    if session is None:
+        url = server_url or os.getenv("MCP_SERVER_URL")
+        if not url:
+            raise ValueError("MCP_SERVER_URL must be set in the .env file.")
+        session = MCPSession(url)
+        _sessions[loop] = session
+    return session
+
+
+async def close_mcp_session() -> None:
+    """Close the shared MCP session for the running event loop, if any"""
+    session = _sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None:
+        await session.aclose()
+
+
+async def open_mcp_session() -> None:
+    """Handshake the running loop's MCP session ahead of the first tool call"""
+    await get_mcp_session().ensure_initialized()
@@ -0,0 +1,352 @@
+import os
+import re
+import asyncio
+import sqlite3
+import logging
+import threading
+import time
+import weakref
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, Any, List
+
+from .monday_integration import MondayClient, get_monday_client
+from .rate_limiter import BACKGROUND, request_priority
+
+logger = logging.getLogger(__name__)
+
+# Where the local index lives and how often the background task pulls deltas
+MONDAY_INDEX_PATH = os.getenv("MONDAY_INDEX_PATH", "monday_index.db")
+MONDAY_INDEX_SYNC_INTERVAL = float(os.getenv("MONDAY_INDEX_SYNC_INTERVAL", "60"))
+# Deltas can't see deleted items, so rebuild from scratch every so often
+MONDAY_INDEX_FULL_SYNC_INTERVAL = float(os.getenv("MONDAY_INDEX_FULL_SYNC_INTERVAL", "3600"))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS boards (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    description TEXT,
+    state TEXT,
+    updated_at TEXT
+);
+CREATE TABLE IF NOT EXISTS groups (
+    board_id TEXT NOT NULL,
+    id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    color TEXT,
+    PRIMARY KEY (board_id, id)
+);
+CREATE TABLE IF NOT EXISTS columns (
+    board_id TEXT NOT NULL,
+    id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    type TEXT,
+    PRIMARY KEY (board_id, id)
+);
+CREATE TABLE IF NOT EXISTS items (
+    id TEXT PRIMARY KEY,
+    board_id TEXT NOT NULL,
+    group_id TEXT,
+    group_title TEXT,
+    name TEXT NOT NULL,
+    state TEXT,
+    url TEXT,
+    creator TEXT,
+    created_at TEXT,
+    updated_at TEXT
+);
+CREATE INDEX IF NOT EXISTS items_board_updated ON items (board_id, updated_at);
+CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5(
+    name, content='items', content_rowid='rowid', tokenize='unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS items_ai AFTER INSERT ON items BEGIN
+    INSERT INTO items_fts(rowid, name) VALUES (new.rowid, new.name);
+END;
+CREATE TRIGGER IF NOT EXISTS items_ad AFTER DELETE ON items BEGIN
+    INSERT INTO items_fts(items_fts, rowid, name) VALUES ('delete', old.rowid, old.name);
+END;
+CREATE TRIGGER IF NOT EXISTS items_au AFTER UPDATE ON items BEGIN
+    INSERT INTO items_fts(items_fts, rowid, name) VALUES ('delete', old.rowid, old.name);
+    INSERT INTO items_fts(rowid, name) VALUES (new.rowid, new.name);
+END;
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+class BoardIndex:
+    """
+    Local SQLite copy of Monday.com boards, groups, columns and items.
+
+    Item names are indexed with FTS5 so voice lookups are answered locally
+    in milliseconds. The index is filled by sync() and kept current by the
+    background task from start_background_sync(); writes made through the
+    tools are recorded here as soon as Monday.com confirms them.
+    """
+
+    def __init__(self, path: str = MONDAY_INDEX_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+    # --- sync state -----------------------------------------------------
+
+    def get_state(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM sync_state WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else None
+
+    def set_state(self, key: str, value: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO sync_state (key, value) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                (key, value),
+            )
+
+    def is_ready(self, board_id: Optional[str] = None) -> bool:
+        """True once a full sync of the board has completed at least once"""
+        return self.get_state(f"full_sync:{board_id}" if board_id else "boards_synced") is not None
+
+    # --- writes -----------------------------------------------------------
+
+    def upsert_boards(self, boards: List[Dict[str, Any]], replace: bool = False) -> None:
+        rows = [
+            (str(b["id"]), b.get("name") or "", b.get("description"), b.get("state"), b.get("updated_at"))
+            for b in boards
+        ]
+        with self._lock, self._conn:
+            if replace:
+                self._conn.execute("DELETE FROM boards")
+            self._conn.executemany(
+                "INSERT INTO boards (id, name, description, state, updated_at) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET name = excluded.name, description = excluded.description, "
+                "state = excluded.state, updated_at = excluded.updated_at",
+                rows,
+            )
+
+    def replace_groups(self, board_id: str, groups: List[Dict[str, Any]]) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM groups WHERE board_id = ?", (str(board_id),))
+            self._conn.executemany(
+                "INSERT INTO groups (board_id, id, title, color) VALUES (?, ?, ?, ?)",
+                [(str(board_id), g["id"], g.get("title") or "", g.get("color")) for g in groups],
+            )
+
+    def replace_columns(self, board_id: str, columns: List[Dict[str, Any]]) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM columns WHERE board_id = ?", (str(board_id),))
+            self._conn.executemany(
+                "INSERT INTO columns (board_id, id, title, type) VALUES (?, ?, ?, ?)",
+                [(str(board_id), c["id"], c.get("title") or "", c.get("type")) for c in columns],
+            )
+
+    def upsert_items(self, board_id: str, items: List[Dict[str, Any]]) -> None:
+        rows = []
+        for item in items:
+            group = item.get("group") or {}
+            creator = item.get("creator") or {}
+            rows.append((
+                str(item["id"]),
+                str(board_id),
+                group.get("id") or item.get("group_id"),
+                group.get("title") or item.get("group_title"),
+                item.get("name") or "",
+                item.get("state"),
+                item.get("url"),
+                creator.get("name"),
+                item.get("created_at"),
+                item.get("updated_at") or item.get("created_at"),
+            ))
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO items (id, board_id, group_id, group_title, name, state, url, creator, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET board_id = excluded.board_id, "
+                "group_id = COALESCE(excluded.group_id, items.group_id), "
+                "group_title = COALESCE(excluded.group_title, items.group_title), "
+                "name = excluded.name, state = COALESCE(excluded.state, items.state), "
+                "url = COALESCE(excluded.url, items.url), creator = COALESCE(excluded.creator, items.creator), "
+                "created_at = COALESCE(excluded.created_at, items.created_at), "
+                "updated_at = COALESCE(excluded.updated_at, items.updated_at)",
+                rows,
+            )
+
+    def delete_items_not_in(self, board_id: str, item_ids: List[str]) -> None:
+        """Drop items that disappeared from the board (used after a full sync)"""
+        with self._lock, self._conn:
+            self._conn.execute("CREATE TEMP TABLE IF NOT EXISTS seen_items (id TEXT PRIMARY KEY)")
+            self._conn.execute("DELETE FROM seen_items")
+            self._conn.executemany("INSERT OR IGNORE INTO seen_items (id) VALUES (?)", [(i,) for i in item_ids])
+            self._conn.execute(
+                "DELETE FROM items WHERE board_id = ? AND id NOT IN (SELECT id FROM seen_items)",
+                (str(board_id),),
+            )
+
+    # --- reads ------------------------------------------------------------
+
+    def list_boards(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, name, description, state, updated_at FROM boards ORDER BY name"
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def list_groups(self, board_id: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, title, color FROM groups WHERE board_id = ?", (str(board_id),)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def list_columns(self, board_id: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, title, type FROM columns WHERE board_id = ?", (str(board_id),)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def count_items(self, board_id: str) -> int:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*) AS n FROM items WHERE board_id = ?", (str(board_id),)
+            ).fetchone()
+        return row["n"]
+
+    def recent_items(self, board_id: str, limit: int = 10) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM items WHERE board_id = ? ORDER BY created_at DESC LIMIT ?",
+                (str(board_id), limit),
+            ).fetchall()
+        return [_item_row(row) for row in rows]
+
+    def search_items(self, board_id: str, search_term: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Full-text search over item names; every word matches as a prefix"""
+        match = _fts_query(search_term)
+        if not match:
+            return self.recent_items(board_id, limit)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT items.* FROM items_fts JOIN items ON items.rowid = items_fts.rowid "
+                "WHERE items_fts MATCH ? AND items.board_id = ? ORDER BY rank LIMIT ?",
+                (match, str(board_id), limit),
+            ).fetchall()
+        return [_item_row(row) for row in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def _fts_query(search_term: str) -> str:
+    """Turn free text into an FTS5 query of quoted prefix terms"""
+    words = re.findall(r"\w+", search_term, flags=re.UNICODE)
+    return " ".join(f'"{word}"*' for word in words)
+
+
+def _item_row(row: sqlite3.Row) -> Dict[str, Any]:
+    """Shape an index row like the items MondayClient returns"""
+    item = dict(row)
+    item["group"] = {"id": item.pop("group_id"), "title": item.pop("group_title")}
+    item["creator"] = {"name": item.pop("creator")}
+    return item
+
+
+async def sync(index: "BoardIndex", client: Optional[MondayClient] = None, full: bool = False) -> int:
+    """
+    Bring the index up to date for the enforced board.
+
+    The first run (or full=True) downloads everything; later runs only ask
+    Monday.com for items updated since the previous sync. Returns the number
+    of items written.
+    """
+    client = client or get_monday_client()
+    board_id = str(client.enforced_board_id)
+    started_at = datetime.now(timezone.utc)
+
+    # Read past the TTL cache so the index never stores minutes-old metadata
+    boards = await client.get_boards(fresh=True)
+    index.upsert_boards(boards, replace=True)
+    index.set_state("boards_synced", started_at.isoformat())
+    index.replace_groups(board_id, await client.get_board_groups(board_id, fresh=True))
+    index.replace_columns(board_id, await client.get_board_columns(board_id, fresh=True))
+
+    last_sync = None if full else index.get_state(f"items_synced:{board_id}")
+    rules = None
+    if last_sync:
+        # Monday.com's "last updated" pseudo-column gives us updated_at deltas
+        # The filter is day-granular, so overlap by a day; upserts make re-reads harmless
+        since = (datetime.fromisoformat(last_sync) - timedelta(days=1)).date().isoformat()
+        rules = [{
+            "column_id": "__last_updated__",
+            "compare_value": ["EXACT", since],
+            "operator": "greater_than",
+            "compare_attribute": "UPDATED_AT",
+        }]
+
+    batch: List[Dict[str, Any]] = []
+    seen: List[str] = []
+    written = 0
+    async for item in client.iter_items(rules=rules, page_size=500):
+        batch.append(item)
+        seen.append(str(item["id"]))
+        if len(batch) >= 500:
+            index.upsert_items(board_id, batch)
+            written += len(batch)
+            batch = []
+    if batch:
+        index.upsert_items(board_id, batch)
+        written += len(batch)
+
+    if rules is None:
+        index.delete_items_not_in(board_id, seen)
+        index.set_state(f"full_sync:{board_id}", started_at.isoformat())
+    index.set_state(f"items_synced:{board_id}", started_at.isoformat())
+
+    logger.info(f"📇 Board index synced: {written} item(s) {'(full)' if rules is None else '(delta)'}")
+    return written
+
+
+async def _sync_forever(index: "BoardIndex", interval: float) -> None:
+    # Syncing yields the complexity budget to interactive voice requests
+    request_priority.set(BACKGROUND)
+    last_full = 0.0
+    while True:
+        full = time.monotonic() - last_full >= MONDAY_INDEX_FULL_SYNC_INTERVAL
+        try:
+            await sync(index, full=full)
+            if full:
+                last_full = time.monotonic()
+        except Exception as e:
+            logger.error(f"❌ Board index sync failed: {e}")
+        await asyncio.sleep(interval)
+
+
+_index: Optional[BoardIndex] = None
+_sync_tasks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Task]" = weakref.WeakKeyDictionary()
+
+
+def get_board_index() -> BoardIndex:
+    """Return the process-wide board index, opening it on first use"""
+    global _index
+    if _index is None:
+        _index = BoardIndex()
+    return _index
+
+
+def start_background_sync(interval: float = MONDAY_INDEX_SYNC_INTERVAL) -> asyncio.Task:
+    """Start (once per event loop) the task that keeps the index in sync"""
+    loop = asyncio.get_running_loop()
+    task = _sync_tasks.get(loop)
+    if task is None or task.done():
+        task = loop.create_task(_sync_forever(get_board_index(), interval))
+        _sync_tasks[loop] = task
+    return task
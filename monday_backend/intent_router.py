@@ -0,0 +1,139 @@
+# intent_router.py
+
+import re
+from typing import Optional, Dict, List, Tuple, Iterable
+
+# Words the router matches on: lowercase letters, digits and apostrophes
+_TOKEN = re.compile(r"[a-z0-9']+")
+
+
+class Intent:
+    """
+    One thing the user can ask for.
+
+    triggers are words or phrases ("look up") that select the intent; slots
+    maps a slot name to a pattern with a group of that name, run against the
+    original message only once the intent has won.
+    """
+
+    def __init__(self, name: str, triggers: Iterable[str], slots: Optional[Dict[str, str]] = None):
+        self.name = name
+        self.triggers = [tuple(_TOKEN.findall(trigger.lower())) for trigger in triggers]
+        self.slots = {slot: re.compile(pattern, re.IGNORECASE) for slot, pattern in (slots or {}).items()}
+
+
+class IntentMatch:
+    """The winning intent for a message, with whatever slots could be filled"""
+
+    def __init__(self, intent: str, trigger: str, slots: Dict[str, Optional[str]]):
+        self.intent = intent
+        self.trigger = trigger
+        self.slots = slots
+
+    def __repr__(self) -> str:
+        return f"IntentMatch({self.intent!r}, trigger={self.trigger!r}, slots={self.slots!r})"
+
+
+class IntentRouter:
+    """
+    Routes a message to the first declared intent whose trigger appears in it.
+
+    compile() folds every trigger into a word-level trie (Aho-Corasick over
+    tokens, without failure links since phrases are a few words long), so
+    routing is one tokenizing regex pass plus a dict lookup per word. The
+    cost follows the message length, not the number of intents.
+    """
+
+    def __init__(self, intents: Iterable[Intent] = ()):
+        self._intents: List[Intent] = []
+        self._trie: Optional[Dict] = None
+        for intent in intents:
+            self.add(intent)
+
+    def add(self, intent: Intent) -> "IntentRouter":
+        """Register an intent; earlier intents win when several match"""
+        self._intents.append(intent)
+        self._trie = None
+        return self
+
+    @property
+    def intents(self) -> List[str]:
+        return [intent.name for intent in self._intents]
+
+    def compile(self) -> "IntentRouter":
+        trie: Dict = {}
+        for rank, intent in enumerate(self._intents):
+            for trigger in intent.triggers:
+                node = trie
+                for word in trigger:
+                    node = node.setdefault(word, {})
+                # Keep the highest-priority intent when two share a trigger
+                if None not in node or node[None][0] > rank:
+                    node[None] = (rank, " ".join(trigger))
+        self._trie = trie
+        return self
+
+    def route(self, message: str) -> Optional[IntentMatch]:
+        """Return the best intent for message, or None if nothing triggers"""
+        if self._trie is None:
+            self.compile()
+        best = self._best_trigger(_TOKEN.findall(message.lower()))
+        if best is None:
+            return None
+        rank, trigger = best
+        intent = self._intents[rank]
+        slots = {}
+        for slot, pattern in intent.slots.items():
+            found = pattern.search(message)
+            value = found.group(slot).strip(" \"'.,?!") if found else None
+            slots[slot] = value or None
+        return IntentMatch(intent.name, trigger, slots)
+
+    def _best_trigger(self, words: List[str]) -> Optional[Tuple[int, str]]:
+        best = None
+        root = self._trie
+        for start in range(len(words)):
+            node = root
+            for word in words[start:]:
+                node = node.get(word)
+                if node is None:
+                    break
+                hit = node.get(None)
+                if hit is not None and (best is None or hit[0] < best[0]):
+                    best = hit
+                    if hit[0] == 0:
+                        return best
+        return best
+
+
+# Slot patterns shared by several intents
+_UNTIL_END = r"(?=\s+(?:today|tomorrow|tonight|now|right now|please|this week)\b|[?.!,]|$)"
+
+# Declaration order is priority: task intents come before web search so
+# "find the task named ..." or "add task named find leads" aren't searches
+FRIDAY_INTENTS = [
+    Intent("weather", ["weather", "temperature", "forecast"], {
+        "city": r"\b(?:in|for|at)\s+(?P<city>[a-z][a-z .'-]*?)" + _UNTIL_END,
+    }),
+    Intent("create_task", ["create task", "create a task", "add task", "add a task", "new task", "crm task", "paid media"], {
+        "task_name": r"\b(?:called|named)\s+(?P<task_name>.+)$",
+    }),
+    Intent("search_tasks", ["find task", "find tasks", "find the task", "search tasks", "search for task", "search my tasks"], {
+        "query": r"\btasks?\s+(?:called|named|about|for|with)?\s*(?P<query>.+)$",
+    }),
+    Intent("list_boards", ["boards", "list boards", "show boards"]),
+    Intent("send_email", ["email", "send email", "mail"], {
+        "recipient": r"\bto\s+(?P<recipient>[\w.+-]+@[\w-]+(?:\.[\w-]+)+)",
+    }),
+    Intent("web_search", ["search", "look up", "find", "google"], {
+        "query": r"\b(?:search(?:\s+the\s+web)?(?:\s+for)?|look\s+up|find|google)\s+(?P<query>.+)$",
+    }),
+    Intent("greeting", ["hello", "hi", "hey", "good morning", "good afternoon", "good evening"]),
+    Intent("help", ["help", "what can you do", "capabilities"]),
+    Intent("thanks", ["thank", "thanks", "appreciate"]),
+]
+
+
+def friday_router() -> IntentRouter:
+    """The compiled router for Friday's web intents"""
+    return IntentRouter(FRIDAY_INTENTS).compile()
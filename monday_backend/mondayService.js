@@ -8,8 +8,230 @@ const mondayClient = new GraphQLClient('https://api.monday.com/v2', {
   }
 });
 
-// Board schema cache to avoid repeated API calls
-const boardSchemaCache = new Map();
+// Read-only lookup cache (board schemas, group lists) with per-kind TTL,
+// bounded LRU size and de-duplication of concurrent misses
+const LOOKUP_CACHE_MAX_ENTRIES = 256;
+const LOOKUP_TTL_MS = {
+  boardSchema: 10 * 60 * 1000,
+  boardGroups: 5 * 60 * 1000
+};
+const lookupCache = new Map();
+const lookupsInFlight = new Map();
+const lookupCacheStats = { hits: 0, misses: 0, coalesced: 0, evictions: 0 };
+
+/**
+ * Return a cached lookup result, or run fetchFn once for all concurrent callers
+ * @param {string} kind - Lookup kind, selects the TTL (see LOOKUP_TTL_MS)
+ * @param {string} key - Normalized lookup key (e.g. the board ID)
+ * @param {Function} fetchFn - Async function producing the value on a miss
+ * @returns {Promise<any>} - Cached or freshly fetched value
+ */
+async function cachedLookup(kind, key, fetchFn) {
+  const cacheKey = `${kind}:${key}`;
+  const entry = lookupCache.get(cacheKey);
+
+  if (entry && entry.expiresAt > Date.now()) {
+    // Re-insert to mark as most recently used
+    lookupCache.delete(cacheKey);
+    lookupCache.set(cacheKey, entry);
+    lookupCacheStats.hits++;
+    return entry.value;
+  }
+  lookupCache.delete(cacheKey);
+
+  if (lookupsInFlight.has(cacheKey)) {
+    lookupCacheStats.coalesced++;
+    return lookupsInFlight.get(cacheKey);
+  }
+
+  lookupCacheStats.misses++;
+  const pending = (async () => {
+    try {
+      const value = await fetchFn();
+      // A missing board or failed lookup is retried next time, not remembered
+      if (value !== null && value !== undefined) {
+        lookupCache.set(cacheKey, { value, expiresAt: Date.now() + LOOKUP_TTL_MS[kind] });
+        while (lookupCache.size > LOOKUP_CACHE_MAX_ENTRIES) {
+          lookupCache.delete(lookupCache.keys().next().value);
+          lookupCacheStats.evictions++;
+        }
+      }
+      return value;
+    } finally {
+      lookupsInFlight.delete(cacheKey);
+    }
+  })();
+  lookupsInFlight.set(cacheKey, pending);
+  return pending;
+}
+
+/**
+ * Drop cached lookups of one kind, optionally only for a single key
+ * @param {string} kind - Lookup kind to invalidate
+ * @param {string} [key] - Optional key (e.g. board ID)
+ */
+function invalidateLookup(kind, key) {
+  for (const cacheKey of [...lookupCache.keys()]) {
+    if (key === undefined ? cacheKey.startsWith(`${kind}:`) : cacheKey === `${kind}:${key}`) {
+      lookupCache.delete(cacheKey);
+    }
+  }
+}
+
+// Lookup kinds each mutation can make stale. Column value changes can add
+// status/dropdown labels, and the first subitem adds a subitems column to
+// the parent board, so those invalidate the board schema too.
+const MUTATION_INVALIDATIONS = {
+  create_group: ['boardGroups'],
+  update_group: ['boardGroups'],
+  duplicate_group: ['boardGroups'],
+  archive_group: ['boardGroups'],
+  delete_group: ['boardGroups'],
+  create_column: ['boardSchema'],
+  change_column_title: ['boardSchema'],
+  change_column_metadata: ['boardSchema'],
+  delete_column: ['boardSchema'],
+  change_column_value: ['boardSchema'],
+  change_multiple_column_values: ['boardSchema'],
+  create_subitem: ['boardSchema']
+};
+
+/**
+ * Drop the cached lookups a successful mutation made stale
+ * @param {string} op - GraphQL mutation name (e.g. 'change_column_value')
+ * @param {string|number} [boardId] - Board the mutation touched; all boards if unknown
+ */
+function invalidateAfterMutation(op, boardId) {
+  for (const kind of MUTATION_INVALIDATIONS[op] || []) {
+    invalidateLookup(kind, boardId === undefined || boardId === null ? undefined : boardId.toString());
+  }
+}
+
+/**
+ * Hit/miss counters for the lookup cache
+ * @returns {Object} - Cache statistics
+ */
+function getLookupCacheStats() {
+  return { ...lookupCacheStats, entries: lookupCache.size };
+}
+
+// Mutations that can be packed into one aliased GraphQL document, with an
+// estimate of each one's complexity cost so a batch stays under Monday.com's cap
+const BATCH_OPERATIONS = {
+  create_subitem: {
+    args: { parent_item_id: 'ID!', item_name: 'String!', column_values: 'JSON' },
+    fields: 'id name board { id }',
+    complexity: 30000
+  },
+  change_multiple_column_values: {
+    args: { board_id: 'ID!', item_id: 'ID!', column_values: 'JSON!' },
+    fields: 'id',
+    complexity: 20000
+  },
+  create_update: {
+    args: { item_id: 'ID!', body: 'String!' },
+    fields: 'id body',
+    complexity: 10000
+  }
+};
+const BATCH_COMPLEXITY_BUDGET = 1000000;
+const BATCH_MAX_OPERATIONS = 25;
+
+/**
+ * Run many mutations in as few requests as possible using aliased GraphQL documents
+ * @param {Array<{op: string, args: Object}>} operations - Mutations to run (see BATCH_OPERATIONS)
+ * @returns {Promise<Array<{ok: boolean, data?: Object, error?: string}>>} - One result per operation, in order
+ */
+async function runBatchedMutations(operations) {
+  const results = new Array(operations.length);
+
+  // Split into chunks that respect the complexity budget
+  const chunks = [];
+  let current = [];
+  let cost = 0;
+  operations.forEach((operation, index) => {
+    const spec = BATCH_OPERATIONS[operation.op];
+    if (!spec) {
+      throw new Error(`Unsupported batch operation: ${operation.op}`);
+    }
+    if (current.length > 0 && (cost + spec.complexity > BATCH_COMPLEXITY_BUDGET || current.length >= BATCH_MAX_OPERATIONS)) {
+      chunks.push(current);
+      current = [];
+      cost = 0;
+    }
+    current.push(index);
+    cost += spec.complexity;
+  });
+  if (current.length > 0) {
+    chunks.push(current);
+  }
+
+  for (const chunk of chunks) {
+    const declarations = [];
+    const fields = [];
+    const variables = {};
+
+    for (const index of chunk) {
+      const { op, args } = operations[index];
+      const spec = BATCH_OPERATIONS[op];
+      const callArgs = [];
+      for (const [name, type] of Object.entries(spec.args)) {
+        let value = args[name];
+        if (value === undefined || value === null) {
+          continue;
+        }
+        if (type.startsWith('JSON') && typeof value !== 'string') {
+          value = JSON.stringify(value);
+        } else if (type.startsWith('ID')) {
+          value = value.toString();
+        }
+        const variable = `op${index}_${name}`;
+        declarations.push(`$${variable}: ${type}`);
+        callArgs.push(`${name}: $${variable}`);
+        variables[variable] = value;
+      }
+      fields.push(`op${index}: ${op}(${callArgs.join(', ')}) { ${spec.fields} }`);
+    }
+
+    const document = `mutation (${declarations.join(', ')}) {\n${fields.join('\n')}\n}`;
+
+    let data = {};
+    let errors = [];
+    try {
+      data = await mondayClient.request(document, variables);
+    } catch (error) {
+      // graphql-request throws on any error; keep the partial data it carries
+      if (error.response && error.response.data) {
+        data = error.response.data;
+        errors = error.response.errors || [];
+      } else {
+        chunk.forEach(index => {
+          results[index] = { ok: false, error: error.message };
+        });
+        continue;
+      }
+    }
+
+    const errorsByAlias = {};
+    for (const error of errors) {
+      const alias = error.path && error.path.length > 0 ? error.path[0] : '*';
+      errorsByAlias[alias] = error.message;
+    }
+
+    for (const index of chunk) {
+      const alias = `op${index}`;
+      if (data[alias]) {
+        results[index] = { ok: true, data: data[alias] };
+        invalidateAfterMutation(operations[index].op, operations[index].args.board_id);
+      } else {
+        results[index] = { ok: false, error: errorsByAlias[alias] || errorsByAlias['*'] || 'No result returned' };
+      }
+    }
+  }
+
+  console.log(`📦 Batched ${operations.length} mutation(s) into ${chunks.length} request(s)`);
+  return results;
+}
 
 /**
  * Parse human-readable date text to YYYY-MM-DD format
@@ -68,58 +290,49 @@ function parseHumanDate(dateText) {
  * @returns {Promise<Object>} - Board schema with columns information
  */
 async function getBoardSchema(boardId) {
-  const cacheKey = boardId.toString();
-  
-  // Return cached schema if available
-  if (boardSchemaCache.has(cacheKey)) {
-    console.log('📋 Using cached board schema for board:', boardId);
-    return boardSchemaCache.get(cacheKey);
-  }
-
-  try {
-    console.log('🔍 Discovering board schema for board:', boardId);
-    
-    const query = gql`
-      query GetBoardSchema($boardId: [ID!]) {
-        boards(ids: $boardId) {
-          columns {
-            id
-            title
-            type
-            settings_str
+  return cachedLookup('boardSchema', boardId.toString(), async () => {
+    try {
+      console.log('🔍 Discovering board schema for board:', boardId);
+      
+      const query = gql`
+        query GetBoardSchema($boardId: [ID!]) {
+          boards(ids: $boardId) {
+            columns {
+              id
+              title
+              type
+              settings_str
+            }
           }
         }
-      }
-    `;
-
-    const response = await mondayClient.request(query, {
-      boardId: [boardId.toString()]
-    });
+      `;
 
-    if (!response.boards || !response.boards[0]) {
-      throw new Error(`Board ${boardId} not found`);
-    }
+      const response = await mondayClient.request(query, {
+        boardId: [boardId.toString()]
+      });
 
-    const boardSchema = {
-      boardId: boardId.toString(),
-      columns: response.boards[0].columns,
-      discoveredAt: new Date().toISOString()
-    };
+      if (!response.boards || !response.boards[0]) {
+        throw new Error(`Board ${boardId} not found`);
+      }
 
-    // Cache the schema
-    boardSchemaCache.set(cacheKey, boardSchema);
-    
-    console.log('✅ Board schema discovered and cached:', {
-      boardId,
-      columnCount: boardSchema.columns.length,
-      columnTypes: [...new Set(boardSchema.columns.map(col => col.type))]
-    });
+      const boardSchema = {
+        boardId: boardId.toString(),
+        columns: response.boards[0].columns,
+        discoveredAt: new Date().toISOString()
+      };
+      
+      console.log('✅ Board schema discovered and cached:', {
+        boardId,
+        columnCount: boardSchema.columns.length,
+        columnTypes: [...new Set(boardSchema.columns.map(col => col.type))]
+      });
 
-    return boardSchema;
-  } catch (error) {
-    console.error('❌ Error discovering board schema:', error);
-    throw error;
-  }
+      return boardSchema;
+    } catch (error) {
+      console.error('❌ Error discovering board schema:', error);
+      throw error;
+    }
+  });
 }
 
 /**
@@ -362,14 +575,15 @@ async function getGroupId(boardId, groupName) {
     `;
 
     console.log('🔍 Searching for group:', groupName, 'in board ID:', boardId);
-    const response = await mondayClient.request(query, { boardId: boardId.toString() });
+    const groups = await cachedLookup('boardGroups', boardId.toString(), async () => {
+      const response = await mondayClient.request(query, { boardId: boardId.toString() });
+      return response.boards && response.boards.length > 0 ? response.boards[0].groups : null;
+    });
     
-    if (!response.boards || response.boards.length === 0) {
+    if (!groups) {
       console.log('❌ Board not found or no groups available');
       return null;
     }
-
-    const groups = response.boards[0].groups;
     console.log('📋 Available groups:', groups.map(g => `"${g.title}" (ID: ${g.id})`));
     
     // Find group by name (case-insensitive)
@@ -736,6 +950,7 @@ async function assignUserToItem(boardId, itemId, userId) {
       columnId: personColumnId,
       value: JSON.stringify({ personsAndTeams: [{ id: parseInt(userId), kind: "person" }] })
     });
+    invalidateAfterMutation('change_column_value', boardId);
 
     console.log('✅ User assigned successfully');
     return true;
@@ -809,6 +1024,7 @@ async function setItemDeadline(boardId, itemId, deadline) {
       columnId: dateColumnId,
       value: JSON.stringify({ date: formattedDate })
     });
+    invalidateAfterMutation('change_column_value', boardId);
 
     console.log('✅ Deadline set successfully');
 
@@ -859,6 +1075,7 @@ async function setItemStatus(itemId, boardId, statusText) {
       columnId: statusColumnId,
       value: JSON.stringify(statusValue)
     });
+    invalidateAfterMutation('change_column_value', boardId);
 
     console.log('✅ Status set successfully');
 
@@ -981,6 +1198,8 @@ async function createSubtasksForItem(parentItemId, updateText, subtaskCount = 3)
       });
 
       if (response.create_subitem) {
+        // The parent's board isn't known here; drop every board's schema
+        invalidateAfterMutation('create_subitem');
         createdSubtasks.push(response.create_subitem);
         console.log('✅ Subtask created:', response.create_subitem);
       }
@@ -1003,29 +1222,21 @@ async function createSubtasks(parentItemId, subtaskNames) {
   try {
     console.log('🔗 Creating', subtaskNames.length, 'subtasks for parent item:', parentItemId);
     
-    const createdSubtasks = [];
-    
-    for (const subtaskName of subtaskNames) {
-      const mutation = gql`
-        mutation CreateSubitem($parentItemId: ID!, $itemName: String!) {
-          create_subitem(parent_item_id: $parentItemId, item_name: $itemName) {
-            id
-            name
-          }
-        }
-      `;
-
-      console.log('📝 Creating subtask:', subtaskName);
-      const response = await mondayClient.request(mutation, {
-        parentItemId: parentItemId.toString(),
-        itemName: subtaskName
-      });
+    // All subitems go out in one aliased mutation (chunked if very large)
+    const results = await runBatchedMutations(subtaskNames.map(subtaskName => ({
+      op: 'create_subitem',
+      args: { parent_item_id: parentItemId, item_name: subtaskName }
+    })));
 
-      if (response.create_subitem) {
-        createdSubtasks.push(response.create_subitem);
-        console.log('✅ Subtask created:', response.create_subitem);
+    const createdSubtasks = [];
+    results.forEach((result, index) => {
+      if (result.ok) {
+        createdSubtasks.push(result.data);
+        console.log('✅ Subtask created:', result.data);
+      } else {
+        console.error('❌ Failed to create subtask:', subtaskNames[index], result.error);
       }
-    }
+    });
 
     return createdSubtasks;
   } catch (error) {
@@ -1500,111 +1711,103 @@ async function createAutonomousProject(entities, sessionId = null) {
     }
 
     const createdSubtasks = [];
-    let processedCount = 0;
 
-    // Step 3: Create each subtask with full configuration
+    // Step 3: Create every subtask in one batched mutation
     sendProgress(`Creating ${subtasks.length} subtasks...`);
-    for (const subtask of subtasks) {
-      try {
-        console.log(`📝 Creating subtask ${processedCount + 1}/${subtasks.length}:`, subtask.subtaskName);
-        sendProgress(`Creating subtask ${processedCount + 1}/${subtasks.length}: ${subtask.subtaskName}`);
-        
-        // Create the subtask
-        const subtaskMutation = gql`
-          mutation CreateSubitem($parentItemId: ID!, $subitemName: String!) {
-            create_subitem(parent_item_id: $parentItemId, item_name: $subitemName) {
-              id
-              name
-              board {
-                id
-              }
-            }
-          }
-        `;
+    const creationResults = await runBatchedMutations(subtasks.map(subtask => ({
+      op: 'create_subitem',
+      args: { parent_item_id: mainTaskId, item_name: subtask.subtaskName }
+    })));
+
+    // Look up each distinct assignee once
+    const userIds = new Map();
+    for (const assigneeName of new Set(subtasks.map(subtask => subtask.assigneeName).filter(Boolean))) {
+      userIds.set(assigneeName, await getUserIdByName(assigneeName));
+    }
 
-        const subtaskResponse = await mondayClient.request(subtaskMutation, {
-          parentItemId: mainTaskId.toString(),
-          subitemName: subtask.subtaskName
-        });
+    // Steps 4-7: briefs, assignees, deadlines and statuses are collected and sent as one more batch
+    const followUps = [];
+    for (let index = 0; index < subtasks.length; index++) {
+      const subtask = subtasks[index];
+      const creation = creationResults[index];
 
-        if (!subtaskResponse.create_subitem) {
-          console.error('❌ Failed to create subtask:', subtask.subtaskName);
-          continue;
-        }
+      if (!creation.ok) {
+        console.error('❌ Failed to create subtask:', subtask.subtaskName, creation.error);
+        continue;
+      }
+
+      const createdSubtask = creation.data;
+      console.log('✅ Subtask created:', createdSubtask);
 
-        const createdSubtask = subtaskResponse.create_subitem;
-        console.log('✅ Subtask created:', createdSubtask);
+      if (subtask.brief) {
+        followUps.push({
+          op: 'create_update',
+          args: { item_id: createdSubtask.id, body: `📋 Brief: ${subtask.brief}` }
+        });
+      }
 
-        // Step 4: Add the brief as an update
-        if (subtask.brief) {
-          try {
-            await addUpdateToItem(createdSubtask.id, `📋 Brief: ${subtask.brief}`);
-            console.log('✅ Brief added to subtask');
-          } catch (briefError) {
-            console.error('❌ Failed to add brief to subtask:', briefError);
+      // Subtasks live on their own subitems board, so use that board's columns.
+      // Each column gets its own aliased op so a rejected value (e.g. a bad date)
+      // doesn't take the other columns down with it, as with the separate calls before.
+      if (subtask.assigneeName || subtask.deadline || subtask.status) {
+        try {
+          const subtaskBoardId = createdSubtask.board.id;
+          const subtaskSchema = await getBoardSchema(subtaskBoardId);
+          const columnValues = {};
+
+          const userId = userIds.get(subtask.assigneeName);
+          const personColumnId = userId ? findColumnId(subtaskSchema, 'people') : null;
+          if (personColumnId) {
+            columnValues[personColumnId] = { personsAndTeams: [{ id: parseInt(userId), kind: 'person' }] };
+          } else if (subtask.assigneeName) {
+            console.log('⚠️ Could not assign subtask to:', subtask.assigneeName);
           }
-        }
 
-        // Step 5: Assign the person
-        if (subtask.assigneeName) {
-          try {
-            const userId = await getUserIdByName(subtask.assigneeName);
-            if (userId) {
-              // Use the subtask's board ID for assignment
-              const subtaskBoardId = createdSubtask.board.id;
-              const assignmentSuccess = await assignUserToItem(subtaskBoardId, createdSubtask.id, userId);
-              if (assignmentSuccess) {
-                console.log('✅ Subtask assigned to:', subtask.assigneeName);
-              }
-            } else {
-              console.log('⚠️ User not found for assignment:', subtask.assigneeName);
-            }
-          } catch (assignError) {
-            console.error('❌ Failed to assign subtask:', assignError);
+          const formattedDate = subtask.deadline ? parseHumanDate(subtask.deadline) : null;
+          const dateColumnId = formattedDate ? findColumnId(subtaskSchema, 'date') : null;
+          if (dateColumnId) {
+            columnValues[dateColumnId] = { date: formattedDate };
+          } else if (subtask.deadline) {
+            console.log('⚠️ Subtask deadline not set - subtasks may not have date columns');
           }
-        }
 
-        // Step 6: Set subtask deadline
-        if (subtask.deadline) {
-          try {
-            // Use the subtask's board ID for deadline setting
-            const subtaskBoardId = createdSubtask.board.id;
-            console.log('📅 Attempting to set deadline on subtask board:', subtaskBoardId);
-            await setItemDeadline(subtaskBoardId, createdSubtask.id, subtask.deadline);
-            console.log('✅ Subtask deadline set');
-          } catch (deadlineError) {
-            console.error('❌ Failed to set subtask deadline:', deadlineError);
-            console.log('⚠️ Subtask deadline setting failed - this is normal as subtasks may not have date columns');
-            // This is expected behavior - subtasks often don't have the same column structure as main items
+          // Only send labels the status column actually has; an unknown one would fail the op
+          const statusColumnId = subtask.status ? findColumnId(subtaskSchema, 'status') : null;
+          const statusLabelId = statusColumnId ? findStatusLabel(subtaskSchema, subtask.status) : null;
+          if (statusLabelId !== null) {
+            columnValues[statusColumnId] = { index: parseInt(statusLabelId) };
+          } else if (subtask.status) {
+            console.log('⚠️ Subtask status not set:', subtask.status);
           }
-        }
 
-        // Step 7: Set subtask status (if status column exists)
-        if (subtask.status) {
-          try {
-            // Use the subtask's board ID for status setting
-            const subtaskBoardId = createdSubtask.board.id;
-            console.log('📊 Setting subtask status to:', subtask.status);
-            await setItemStatus(createdSubtask.id, subtaskBoardId, subtask.status);
-            console.log('✅ Subtask status set');
-          } catch (statusError) {
-            console.error('❌ Failed to set subtask status:', statusError);
-            console.log('⚠️ Subtask status setting failed - continuing without status');
+          for (const [columnId, value] of Object.entries(columnValues)) {
+            followUps.push({
+              op: 'change_multiple_column_values',
+              args: { board_id: subtaskBoardId, item_id: createdSubtask.id, column_values: { [columnId]: value } }
+            });
           }
+        } catch (schemaError) {
+          console.error('❌ Failed to prepare subtask columns:', schemaError);
         }
+      }
 
-        createdSubtasks.push({
-          ...createdSubtask,
-          assigneeName: subtask.assigneeName,
-          brief: subtask.brief,
-          deadline: subtask.deadline,
-          status: subtask.status
-        });
+      createdSubtasks.push({
+        ...createdSubtask,
+        assigneeName: subtask.assigneeName,
+        brief: subtask.brief,
+        deadline: subtask.deadline,
+        status: subtask.status
+      });
+    }
 
-        processedCount++;
-      } catch (subtaskError) {
-        console.error('❌ Error processing subtask:', subtask.subtaskName, subtaskError);
-      }
+    if (followUps.length > 0) {
+      sendProgress('Briefing, assigning and scheduling subtasks...');
+      const followUpResults = await runBatchedMutations(followUps);
+      followUpResults.forEach((result, index) => {
+        if (!result.ok) {
+          console.error(`❌ Subtask ${followUps[index].op} failed:`, result.error);
+        }
+      });
     }
 
     console.log('✅ Autonomous project creation completed');
@@ -1634,6 +1837,10 @@ module.exports = {
   getGroupStatusReport,
   getGroupWorkloadReport,
   getBoardSchema,
+  getLookupCacheStats,
+  runBatchedMutations,
+  invalidateLookup,
+  invalidateAfterMutation,
   findColumnId,
   findStatusLabel,
   parseHumanDate,
@@ -1,14 +1,105 @@
 import os
-import requests
+import re
+import asyncio
+import weakref
+import httpx
 import json
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, AsyncIterator, List
 import logging
 from datetime import datetime
 
+if not __package__:
+    # Needs the repo root on sys.path and the monday_backend package for its imports
+    raise SystemExit("Run the connection test from the repo root: python -m monday_backend.monday_integration")
+
+from tool_cache import get_tool_cache
+from tracing import span
+from http_client import get_ssl_context
+from .rate_limiter import (
+    MONDAY_MAX_RETRIES,
+    MondayRateLimitError,
+    backoff_delay,
+    get_complexity_scheduler,
+    rate_limit_retry_after,
+    with_complexity,
+)
+
+logger = logging.getLogger(__name__)
+
+# GraphQL endpoint; point it at a local stand-in for offline benchmarks
+MONDAY_API_URL = os.getenv("MONDAY_API_URL", "https://api.monday.com/v2")
+
+# Connection pool shared by every Monday.com call in the process
+MONDAY_MAX_CONNECTIONS = int(os.getenv("MONDAY_MAX_CONNECTIONS", "10"))
+MONDAY_KEEPALIVE_EXPIRY = 60.0
+
+# items_page accepts at most 500 items per page
+ITEMS_PAGE_SIZE = int(os.getenv("MONDAY_ITEMS_PAGE_SIZE", "100"))
+MAX_ITEMS_PAGE_SIZE = 500
+
+# First (possibly aliased) field of a GraphQL document, used to label traces
+_FIRST_FIELD = re.compile(r"\{\s*(?:\w+\s*:\s*)?(\w+)")
+
+# Mutations run_batch() can pack into one aliased GraphQL document, with an
+# estimate of each one's complexity cost (Monday.com caps a single query)
+BATCH_OPERATIONS: Dict[str, Dict[str, Any]] = {
+    "create_item": {
+        "args": {"board_id": "ID!", "item_name": "String!", "group_id": "String", "column_values": "JSON"},
+        "fields": "id name created_at url",
+        "complexity": 30000,
+    },
+    "create_subitem": {
+        "args": {"parent_item_id": "ID!", "item_name": "String!", "column_values": "JSON"},
+        "fields": "id name board { id }",
+        "complexity": 30000,
+    },
+    "change_column_value": {
+        "args": {"board_id": "ID!", "item_id": "ID!", "column_id": "String!", "value": "JSON!"},
+        "fields": "id name",
+        "complexity": 20000,
+    },
+    "change_multiple_column_values": {
+        "args": {"board_id": "ID!", "item_id": "ID!", "column_values": "JSON!"},
+        "fields": "id name",
+        "complexity": 20000,
+    },
+    "create_update": {
+        "args": {"item_id": "ID!", "body": "String!"},
+        "fields": "id body created_at",
+        "complexity": 10000,
+    },
+}
+BATCH_COMPLEXITY_BUDGET = int(os.getenv("MONDAY_BATCH_COMPLEXITY_BUDGET", "1000000"))
+BATCH_MAX_OPERATIONS = int(os.getenv("MONDAY_BATCH_MAX_OPERATIONS", "25"))
+
+ITEM_FIELDS = """
+                        id
+                        name
+                        created_at
+                        url
+                        state
+                        updated_at
+                        creator {
+                            name
+                        }
+                        group {
+                            id
+                            title
+                        }
+"""
+
+def _http2_available() -> bool:
+    """HTTP/2 needs the optional h2 package (pip install httpx[http2])"""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
 class MondayClient:
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or os.getenv("MONDAY_API_KEY")
-        self.base_url = "https://api.monday.com/v2"
+        self.base_url = MONDAY_API_URL
         self.headers = {
             "Authorization": self.api_key if self.api_key else "",
             "Content-Type": "application/json",
@@ -20,33 +111,103 @@ class MondayClient:
         if not self.enforced_board_id:
             raise ValueError("MONDAY_BOARD_ID environment variable is required but not set")
 
-    def _make_request(self, query: str, variables: Optional[Dict] = None) -> Dict[Any, Any]:
-        """Make a GraphQL request to Monday.com API"""
-        payload = {
-            "query": query,
-            "variables": variables or {}
-        }
-        
-        try:
-            response = requests.post(
-                self.base_url,
+        # Pooled connections belong to one event loop, so keep one client per loop
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """Pooled keep-alive HTTP client for the running event loop, created lazily"""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
                 headers=self.headers,
-                json=payload,
-                timeout=30
+                timeout=30.0,
+                http2=_http2_available(),
+                verify=get_ssl_context(),
+                limits=httpx.Limits(
+                    max_connections=MONDAY_MAX_CONNECTIONS,
+                    max_keepalive_connections=MONDAY_MAX_CONNECTIONS,
+                    keepalive_expiry=MONDAY_KEEPALIVE_EXPIRY,
+                ),
             )
-            response.raise_for_status()
-            result = response.json()
+            self._clients[loop] = client
+        return client
+
+    async def aclose(self) -> None:
+        """Close the running event loop's pooled connections"""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None and not client.is_closed:
+            await client.aclose()
+
+    async def _make_request(
+        self,
+        query: str,
+        variables: Optional[Dict] = None,
+        allow_partial: bool = False
+    ) -> Dict[Any, Any]:
+        """
+        Make a GraphQL request to Monday.com API.
+        Requests are paced against the complexity budget and rate-limit
+        rejections are retried with jittered backoff. With allow_partial,
+        field-level errors are returned alongside the data instead of raising
+        (used by batches to report per-operation results).
+        """
+        with span("monday.request", operation=_operation_name(query)) as request_span:
+            scheduler = get_complexity_scheduler()
+            payload = {
+                "query": with_complexity(query),
+                "variables": variables or {}
+            }
+        
+            attempt = 0
+            while True:
+                # Pace requests to the remaining complexity budget (interactive calls first)
+                await scheduler.acquire(scheduler.estimate(query))
+                request_span.event("budget_acquired", attempt=attempt)
+                try:
+                    response = await self.http_client.post(self.base_url, json=payload)
+                except httpx.HTTPError as e:
+                    logging.error(f"Error making request to Monday.com: {e}")
+                    raise Exception(f"Failed to connect to Monday.com: {str(e)}")
+            
+                try:
+                    result = response.json()
+                except ValueError:
+                    result = None
+            
+                retry_after = rate_limit_retry_after(response.status_code, response.headers, result)
+                if retry_after is not None:
+                    if attempt >= MONDAY_MAX_RETRIES:
+                        raise MondayRateLimitError(
+                            f"Monday.com rate limit exceeded after {attempt + 1} attempts", retry_after
+                        )
+                    delay = backoff_delay(attempt, retry_after)
+                    scheduler.block_for(delay)
+                    logger.warning(f"⏳ Monday.com throttled the request, retrying in {delay:.1f}s")
+                    attempt += 1
+                    continue
+            
+                try:
+                    response.raise_for_status()
+                except httpx.HTTPError as e:
+                    logging.error(f"Error making request to Monday.com: {e}")
+                    raise Exception(f"Failed to connect to Monday.com: {str(e)}")
             
-            if "errors" in result:
-                raise Exception(f"Monday.com API error: {result['errors']}")
+                if not isinstance(result, dict):
+                    raise Exception("Monday.com API error: response was not valid JSON")
             
-            return result
-        except requests.exceptions.RequestException as e:
-            logging.error(f"Error making request to Monday.com: {e}")
-            raise Exception(f"Failed to connect to Monday.com: {str(e)}")
+                complexity = (result.get("data") or {}).get("complexity")
+                scheduler.observe(query, complexity)
+                request_span.set(attempts=attempt + 1, cost=(complexity or {}).get("query"))
+            
+                if "errors" in result and not (allow_partial and result.get("data")):
+                    raise Exception(f"Monday.com API error: {result['errors']}")
+            
+                return result
 
-    def get_boards(self) -> list:
-        """Get all boards accessible to the user"""
+    async def get_boards(self, fresh: bool = False) -> list:
+        """Get all boards accessible to the user (fresh=True skips the cache)"""
         query = """
         query {
             boards {
@@ -54,15 +215,19 @@ class MondayClient:
                 name
                 description
                 state
+                updated_at
             }
         }
         """
         
-        result = self._make_request(query)
-        return result.get("data", {}).get("boards", [])
+        async def fetch() -> list:
+            result = await self._make_request(query)
+            return result.get("data", {}).get("boards", [])
+        
+        return await get_tool_cache().get_or_fetch("get_boards", {}, fetch, refresh=fresh)
 
-    def get_board_groups(self, board_id: str) -> list:
-        """Get groups (sections) in a board"""
+    async def get_board_groups(self, board_id: str, fresh: bool = False) -> list:
+        """Get groups (sections) in a board (fresh=True skips the cache)"""
         query = """
         query ($board_id: [Int!]) {
             boards(ids: $board_id) {
@@ -76,11 +241,38 @@ class MondayClient:
         """
         
         variables = {"board_id": [int(board_id)]}
-        result = self._make_request(query, variables)
-        boards = result.get("data", {}).get("boards", [])
-        return boards[0].get("groups", []) if boards else []
+        
+        async def fetch() -> list:
+            result = await self._make_request(query, variables)
+            boards = result.get("data", {}).get("boards", [])
+            return boards[0].get("groups", []) if boards else []
+        
+        return await get_tool_cache().get_or_fetch("get_board_groups", {"board_id": board_id}, fetch, refresh=fresh)
+
+    async def get_board_columns(self, board_id: str, fresh: bool = False) -> list:
+        """Get columns in a board (fresh=True skips the cache)"""
+        query = """
+        query ($board_id: [ID!]) {
+            boards(ids: $board_id) {
+                columns {
+                    id
+                    title
+                    type
+                }
+            }
+        }
+        """
+        
+        variables = {"board_id": [str(board_id)]}
+        
+        async def fetch() -> list:
+            result = await self._make_request(query, variables)
+            boards = result.get("data", {}).get("boards", [])
+            return boards[0].get("columns", []) if boards else []
+        
+        return await get_tool_cache().get_or_fetch("get_board_columns", {"board_id": board_id}, fetch, refresh=fresh)
 
-    def create_task(self, task_name: str, group_id: Optional[str] = None) -> Dict[Any, Any]:
+    async def create_task(self, task_name: str, group_id: Optional[str] = None) -> Dict[Any, Any]:
         """
         Create a new task/item in the enforced Monday.com board.
         Board ID is automatically enforced from environment variable.
@@ -113,16 +305,17 @@ class MondayClient:
         print(f"🔍 Task: '{task_name}' in group: {group_id or 'default'}")
         
         try:
-            result = self._make_request(query, variables)
+            result = await self._make_request(query, variables)
             print(f"🔍 Monday.com API response: {result}")
             created_item = result.get("data", {}).get("create_item", {})
             print(f"✅ Created item: {created_item}")
+            get_tool_cache().on_mutation("create_item", variables)
             return created_item
         except Exception as e:
             print(f"❌ Error in create_task: {e}")
             raise
 
-    def update_task_status(self, item_id: str, status_column_id: str, status_label: str) -> Dict[Any, Any]:
+    async def update_task_status(self, item_id: str, status_column_id: str, status_label: str) -> Dict[Any, Any]:
         """Update task status"""
         query = """
         mutation ($item_id: Int!, $column_id: String!, $value: JSON!) {
@@ -143,10 +336,11 @@ class MondayClient:
             "value": json.dumps({"label": status_label})
         }
         
-        result = self._make_request(query, variables)
+        result = await self._make_request(query, variables)
+        get_tool_cache().on_mutation("change_column_value", variables)
         return result.get("data", {}).get("change_column_value", {})
 
-    def add_task_update(self, item_id: str, update_text: str) -> Dict[Any, Any]:
+    async def add_task_update(self, item_id: str, update_text: str) -> Dict[Any, Any]:
         """Add an update/comment to a task"""
         query = """
         mutation ($item_id: Int!, $body: String!) {
@@ -166,57 +360,260 @@ class MondayClient:
             "body": update_text
         }
         
-        result = self._make_request(query, variables)
+        result = await self._make_request(query, variables)
+        get_tool_cache().on_mutation("create_update", variables)
         return result.get("data", {}).get("create_update", {})
 
-    def search_tasks(self, search_term: str = "") -> list:
+    async def run_batch(self, operations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
-        Search for tasks in the enforced Monday.com board.
-        Board ID is automatically enforced from environment variable.
+        Run many mutations with as few requests as possible.
+
+        Each operation is {"op": <name in BATCH_OPERATIONS>, "args": {...}}.
+        Operations are packed into aliased GraphQL documents, split into chunks
+        that stay under the complexity budget. Returns one result per operation,
+        in order: {"ok": True, "data": {...}} or {"ok": False, "error": "..."}.
+        create_item and change_column_value default to the enforced board.
         """
-        query = """
-        query ($board_id: [Int!]) {
+        results: List[Dict[str, Any]] = [None] * len(operations)  # type: ignore
+        for chunk in _chunk_operations(operations):
+            query, variables = _build_batch_document(
+                [(index, operations[index]) for index in chunk],
+                str(self.enforced_board_id)
+            )
+            try:
+                response = await self._make_request(query, variables, allow_partial=True)
+            except Exception as e:
+                for index in chunk:
+                    results[index] = {"ok": False, "error": str(e)}
+                continue
+
+            data = response.get("data") or {}
+            errors_by_alias: Dict[str, str] = {}
+            for error in response.get("errors", []):
+                path = error.get("path") or []
+                alias = path[0] if path else None
+                errors_by_alias[alias] = error.get("message", "Unknown Monday.com error")
+
+            for index in chunk:
+                alias = f"op{index}"
+                if data.get(alias) is not None:
+                    results[index] = {"ok": True, "data": data[alias]}
+                else:
+                    message = errors_by_alias.get(alias) or errors_by_alias.get(None) or "No result returned"
+                    results[index] = {"ok": False, "error": message}
+
+        logger.info(f"📦 Batch of {len(operations)} operation(s): {sum(r['ok'] for r in results)} succeeded")
+        # Cached reads of the boards these mutations touched are stale now
+        cache = get_tool_cache()
+        for operation, result in zip(operations, results):
+            if result["ok"]:
+                args = dict(operation.get("args") or {})
+                if "board_id" in BATCH_OPERATIONS[operation["op"]]["args"]:
+                    args.setdefault("board_id", str(self.enforced_board_id))
+                cache.on_mutation(operation["op"], args)
+        return results
+
+    async def create_tasks(self, task_names: List[str], group_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Create several tasks in the enforced board with batched requests"""
+        operations = []
+        for task_name in task_names:
+            args: Dict[str, Any] = {"item_name": task_name}
+            if group_id:
+                args["group_id"] = group_id
+            operations.append({"op": "create_item", "args": args})
+        return await self.run_batch(operations)
+
+    async def create_subtasks(self, parent_item_id: str, subtask_names: List[str]) -> List[Dict[str, Any]]:
+        """Create several subitems under one item with batched requests"""
+        return await self.run_batch([
+            {"op": "create_subitem", "args": {"parent_item_id": str(parent_item_id), "item_name": name}}
+            for name in subtask_names
+        ])
+
+    async def iter_items(
+        self,
+        search_term: str = "",
+        page_size: int = ITEMS_PAGE_SIZE,
+        limit: Optional[int] = None,
+        rules: Optional[List[Dict[str, Any]]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream items from the enforced board page by page using items_page cursors.
+        The name filter (and any extra query_params `rules`) runs on Monday.com's
+        side, and iteration stops as soon as `limit` items have been yielded.
+        """
+        if limit is not None and limit <= 0:
+            return
+
+        first_page_query = """
+        query ($board_id: [ID!], $limit: Int!, $query_params: ItemsQuery) {
             boards(ids: $board_id) {
-                items {
-                    id
-                    name
-                    created_at
-                    url
-                    state
-                    creator {
-                        name
-                    }
-                    group {
-                        title
+                items_page(limit: $limit, query_params: $query_params) {
+                    cursor
+                    items {
+                        %s
                     }
                 }
             }
         }
-        """
-        
+        """ % ITEM_FIELDS
+
+        next_page_query = """
+        query ($cursor: String!, $limit: Int!) {
+            next_items_page(cursor: $cursor, limit: $limit) {
+                cursor
+                items {
+                    %s
+                }
+            }
+        }
+        """ % ITEM_FIELDS
+
         # Always use the enforced board ID from environment
-        variables = {"board_id": [int(self.enforced_board_id)]}
+        variables: Dict[str, Any] = {
+            "board_id": [str(self.enforced_board_id)],
+            "limit": _page_limit(page_size, limit)
+        }
+        query_rules = list(rules or [])
+        if search_term:
+            query_rules.append({
+                "column_id": "name",
+                "compare_value": [search_term],
+                "operator": "contains_text"
+            })
+        if query_rules:
+            variables["query_params"] = {"rules": query_rules}
         print(f"🔒 Searching tasks in enforced board {self.enforced_board_id}")
-        
-        result = self._make_request(query, variables)
+
+        result = await self._make_request(first_page_query, variables)
         boards = result.get("data", {}).get("boards", [])
-        
         if not boards:
-            return []
-        
-        items = boards[0].get("items", [])
-        
-        # Filter items that contain the search term if provided
-        if search_term:
-            return [item for item in items if search_term.lower() in item.get("name", "").lower()]
-        else:
-            return items
+            return
+        page = boards[0].get("items_page") or {}
+
+        yielded = 0
+        while True:
+            for item in page.get("items", []):
+                yield item
+                yielded += 1
+                if limit is not None and yielded >= limit:
+                    return
+
+            cursor = page.get("cursor")
+            if not cursor:
+                return
+
+            remaining = None if limit is None else limit - yielded
+            result = await self._make_request(
+                next_page_query,
+                {"cursor": cursor, "limit": _page_limit(page_size, remaining)}
+            )
+            page = result.get("data", {}).get("next_items_page") or {}
+
+    async def search_tasks(self, search_term: str = "", limit: Optional[int] = None) -> list:
+        """
+        Search for tasks in the enforced Monday.com board.
+        Board ID is automatically enforced from environment variable.
+        Pass `limit` to stop fetching pages once enough matches were found.
+        """
+        return [item async for item in self.iter_items(search_term, limit=limit)]
+
+    async def count_tasks(self) -> int:
+        """Number of items on the enforced board, without fetching them"""
+        query = """
+        query ($board_id: [ID!]) {
+            boards(ids: $board_id) {
+                items_count
+            }
+        }
+        """
+        result = await self._make_request(query, {"board_id": [str(self.enforced_board_id)]})
+        boards = result.get("data", {}).get("boards", [])
+        return boards[0].get("items_count", 0) if boards else 0
+
+def _chunk_operations(operations: List[Dict[str, Any]]) -> List[List[int]]:
+    """Group operation indexes into chunks under the per-request complexity budget"""
+    chunks: List[List[int]] = []
+    current: List[int] = []
+    cost = 0
+    for index, operation in enumerate(operations):
+        if operation.get("op") not in BATCH_OPERATIONS:
+            raise ValueError(f"Unsupported batch operation: {operation.get('op')}")
+        op_cost = BATCH_OPERATIONS[operation["op"]]["complexity"]
+        if current and (cost + op_cost > BATCH_COMPLEXITY_BUDGET or len(current) >= BATCH_MAX_OPERATIONS):
+            chunks.append(current)
+            current, cost = [], 0
+        current.append(index)
+        cost += op_cost
+    if current:
+        chunks.append(current)
+    return chunks
+
+def _build_batch_document(
+    indexed_operations: List[Any],
+    enforced_board_id: str
+) -> Any:
+    """Build one aliased mutation document (op0, op1, ...) and its variables"""
+    declarations = []
+    fields = []
+    variables: Dict[str, Any] = {}
+    for index, operation in indexed_operations:
+        spec = BATCH_OPERATIONS[operation["op"]]
+        args = dict(operation.get("args") or {})
+        if "board_id" in spec["args"] and "board_id" not in args:
+            args["board_id"] = enforced_board_id
+
+        call_args = []
+        for name, graphql_type in spec["args"].items():
+            if name not in args or args[name] is None:
+                if graphql_type.endswith("!"):
+                    raise ValueError(f"{operation['op']} requires '{name}'")
+                continue
+            value = args[name]
+            if graphql_type.startswith("JSON") and not isinstance(value, str):
+                value = json.dumps(value)
+            elif graphql_type.startswith("ID"):
+                value = str(value)
+            variable = f"op{index}_{name}"
+            declarations.append(f"${variable}: {graphql_type}")
+            call_args.append(f"{name}: ${variable}")
+            variables[variable] = value
+
+        fields.append(f"op{index}: {operation['op']}({', '.join(call_args)}) {{ {spec['fields']} }}")
+
+    query = "mutation (%s) {\n%s\n}" % (", ".join(declarations), "\n".join(fields))
+    return query, variables
+
+def _operation_name(query: str) -> str:
+    """Short label for a GraphQL document, e.g. 'query boards' or 'mutation create_item'"""
+    kind = "mutation" if query.lstrip().startswith("mutation") else "query"
+    match = _FIRST_FIELD.search(query)
+    return f"{kind} {match.group(1)}" if match else kind
+
+def _page_limit(page_size: int, remaining: Optional[int]) -> int:
+    """Don't ask Monday.com for more items than the caller still needs"""
+    page_size = max(1, min(page_size, MAX_ITEMS_PAGE_SIZE))
+    return page_size if remaining is None else max(1, min(page_size, remaining))
+
+_shared_client: Optional[MondayClient] = None
+
+def get_monday_client() -> MondayClient:
+    """Return the process-wide MondayClient, creating it on first use"""
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = MondayClient()
+    return _shared_client
+
+async def close_monday_client() -> None:
+    """Close the shared client's connections for the running event loop, if it was ever created"""
+    if _shared_client is not None:
+        await _shared_client.aclose()
 
-def test_monday_connection():
+async def test_monday_connection():
     """Test Monday.com API connection"""
     try:
-        client = MondayClient()
-        boards = client.get_boards()
+        client = get_monday_client()
+        boards = await client.get_boards()
         print(f"✅ Connected to Monday.com! Found {len(boards)} boards.")
         return True
     except Exception as e:
@@ -224,5 +621,5 @@ def test_monday_connection():
         return False
 
 if __name__ == "__main__":
-    # Test the connection
-    test_monday_connection()
+    # Test the connection: python -m monday_backend.monday_integration (from the repo root)
+    asyncio.run(test_monday_connection())
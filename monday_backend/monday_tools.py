@@ -1,9 +1,32 @@
 import logging
 from livekit.agents import function_tool, RunContext
 from typing import Optional
-from .monday_integration import MondayClient
+from .monday_integration import get_monday_client
+from .board_index import BoardIndex, get_board_index, start_background_sync
+from tracing import traced
+
+def _synced_index(board_id: Optional[str] = None) -> Optional[BoardIndex]:
+    """
+    Return the local board index if it already holds a full copy, else None.
+    Also makes sure the background sync is running for the next lookup.
+    """
+    try:
+        start_background_sync()
+        index = get_board_index()
+        return index if index.is_ready(board_id) else None
+    except Exception as e:
+        logging.error(f"Board index unavailable, falling back to live API: {e}")
+        return None
+
+def _record_created_task(client, result: dict, group_id: Optional[str]) -> None:
+    """Write-through: make a task we just created visible to index lookups at once"""
+    try:
+        get_board_index().upsert_items(client.enforced_board_id, [{**result, "group_id": group_id}])
+    except Exception as e:
+        logging.error(f"Could not record task in board index: {e}")
 
 @function_tool()
+@traced()
 async def create_monday_task(
     context: RunContext,  # type: ignore
     task_name: str,
@@ -18,10 +41,11 @@ async def create_monday_task(
         group_id: Optional group/section ID within the board (e.g., 'group_mkt6pepv')
     """
     try:
-        client = MondayClient()
-        result = client.create_task(task_name, group_id)
+        client = get_monday_client()
+        result = await client.create_task(task_name, group_id)
         
         if result:
+            _record_created_task(client, result, group_id)
             task_id = result.get('id')
             task_url = result.get('url', '')
             logging.info(f"Created Monday.com task: {task_name} (ID: {task_id})")
@@ -40,6 +64,7 @@ async def create_monday_task(
         return f"I'm afraid there was a problem creating your task, Sir: {str(e)}"
 
 @function_tool()
+@traced()
 async def list_monday_boards(
     context: RunContext  # type: ignore
 ) -> str:
@@ -47,8 +72,11 @@ async def list_monday_boards(
     List all Monday.com boards accessible to the user.
     """
     try:
-        client = MondayClient()
-        boards = client.get_boards()
+        index = _synced_index()
+        if index is not None:
+            boards = index.list_boards()
+        else:
+            boards = await get_monday_client().get_boards()
         
         if not boards:
             return "It appears you have no Monday.com boards accessible, Sir."
@@ -73,6 +101,7 @@ async def list_monday_boards(
         return f"I'm having trouble accessing your Monday.com boards, Sir: {str(e)}"
 
 @function_tool()
+@traced()
 async def search_monday_tasks(
     context: RunContext,  # type: ignore
     board_id: str,
@@ -86,20 +115,28 @@ async def search_monday_tasks(
         search_term: The term to search for in task names
     """
     try:
-        client = MondayClient()
-        tasks = client.search_tasks(board_id, search_term)
+        client = get_monday_client()
+        index = _synced_index(client.enforced_board_id)
+        # Fetch one more than we show so we know whether there are more matches
+        if index is not None:
+            tasks = index.search_items(client.enforced_board_id, search_term, limit=11)
+        else:
+            tasks = await client.search_tasks(search_term, limit=11)
         
         if not tasks:
             return f"No tasks found matching '{search_term}' in that board, Sir."
         
-        task_list = f"Found {len(tasks)} task(s) matching '{search_term}':\n"
+        if len(tasks) > 10:
+            task_list = f"Found more than 10 tasks matching '{search_term}':\n"
+        else:
+            task_list = f"Found {len(tasks)} task(s) matching '{search_term}':\n"
         for task in tasks[:10]:  # Limit to first 10 results
             task_name = task.get('name', 'Unnamed Task')
             task_id = task.get('id')
             task_list += f"• {task_name} (ID: {task_id})\n"
         
         if len(tasks) > 10:
-            task_list += f"... and {len(tasks) - 10} more tasks."
+            task_list += "... and more tasks."
         
         logging.info(f"Found {len(tasks)} tasks matching '{search_term}'")
         return task_list
@@ -109,6 +146,7 @@ async def search_monday_tasks(
         return f"I encountered an issue searching for tasks, Sir: {str(e)}"
 
 @function_tool()
+@traced()
 async def add_task_update(
     context: RunContext,  # type: ignore
     task_id: str,
@@ -122,8 +160,8 @@ async def add_task_update(
         update_text: The update text to add
     """
     try:
-        client = MondayClient()
-        result = client.add_task_update(task_id, update_text)
+        client = get_monday_client()
+        result = await client.add_task_update(task_id, update_text)
         
         if result:
             logging.info(f"Added update to Monday.com task {task_id}")
@@ -136,6 +174,7 @@ async def add_task_update(
         return f"There was an issue adding your update, Sir: {str(e)}"
 
 @function_tool()
+@traced()
 async def create_crm_task(
     context: RunContext,  # type: ignore
     task_name: str
@@ -147,13 +186,14 @@ async def create_crm_task(
         task_name: The name/title of the task to create
     """
     try:
-        client = MondayClient()
+        client = get_monday_client()
         board_id = "2116067359"  # September Content Board
         group_id = "group_mkt6pepv"  # TikToks group
         
-        result = client.create_task(task_name, group_id)
+        result = await client.create_task(task_name, group_id)
         
         if result:
+            _record_created_task(client, result, group_id)
             task_id = result.get('id')
             task_url = result.get('url', '')
             logging.info(f"Created CRM task: {task_name} (ID: {task_id})")
@@ -167,6 +207,7 @@ async def create_crm_task(
         return f"I encountered a technical snag creating that task, Sir: {str(e)}"
 
 @function_tool()
+@traced()
 async def list_crm_tasks(
     context: RunContext  # type: ignore
 ) -> str:
@@ -174,20 +215,27 @@ async def list_crm_tasks(
     List tasks from the Paid Media CRM board.
     """
     try:
-        client = MondayClient()
+        client = get_monday_client()
         board_id = "2116067359"  # September Content Board
         
-        tasks = client.search_tasks("")  # Get all tasks
+        # Only the first few items are spoken, so don't page through the whole board
+        index = _synced_index(client.enforced_board_id)
+        if index is not None:
+            total = index.count_items(client.enforced_board_id)
+            tasks = index.recent_items(client.enforced_board_id, limit=5)
+        else:
+            total = await client.count_tasks()
+            tasks = await client.search_tasks("", limit=5)
         
         if not tasks:
             return "The Paid Media CRM board appears to be empty, Sir."
         
-        if len(tasks) <= 5:
+        if total <= 5:
             task_names = [task.get('name', 'Unnamed Task') for task in tasks]
-            return f"You have {len(tasks)} tasks in Paid Media CRM: {', '.join(task_names)}."
+            return f"You have {total} tasks in Paid Media CRM: {', '.join(task_names)}."
         else:
             recent_tasks = [task.get('name', 'Unnamed Task') for task in tasks[:3]]
-            return f"You have {len(tasks)} tasks in Paid Media CRM. Most recent: {', '.join(recent_tasks)}, plus {len(tasks) - 3} others."
+            return f"You have {total} tasks in Paid Media CRM. Most recent: {', '.join(recent_tasks)}, plus {total - 3} others."
         
     except Exception as e:
         logging.error(f"Error listing CRM tasks: {e}")
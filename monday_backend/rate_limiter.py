@@ -0,0 +1,227 @@
+import os
+import re
+import time
+import random
+import asyncio
+import logging
+import contextvars
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, Iterator
+
+logger = logging.getLogger(__name__)
+
+# Monday.com gives each account a complexity budget per minute
+MONDAY_COMPLEXITY_BUDGET = int(os.getenv("MONDAY_COMPLEXITY_BUDGET", "10000000"))
+# Share of the budget background work must leave for interactive voice calls
+MONDAY_BACKGROUND_RESERVE = float(os.getenv("MONDAY_BACKGROUND_RESERVE", "0.2"))
+MONDAY_MAX_RETRIES = int(os.getenv("MONDAY_MAX_RETRIES", "4"))
+DEFAULT_QUERY_COST = 10000
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 30.0
+
+INTERACTIVE = 0
+BACKGROUND = 1
+
+# Priority of Monday.com requests made from the current task
+request_priority: contextvars.ContextVar[int] = contextvars.ContextVar("monday_request_priority", default=INTERACTIVE)
+
+_RATE_LIMIT_CODES = {
+    "ComplexityException",
+    "COMPLEXITY_BUDGET_EXHAUSTED",
+    "RATE_LIMIT_EXCEEDED",
+    "maxConcurrencyExceeded",
+    "IP_RATE_LIMIT_EXCEEDED",
+}
+_RETRY_SECONDS = re.compile(r"reset in (\d+) seconds?", re.IGNORECASE)
+
+
+class MondayRateLimitError(Exception):
+    """Raised when Monday.com keeps throttling a request after all retries."""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+@contextmanager
+def background_priority() -> Iterator[None]:
+    """Run Monday.com requests in this block behind interactive ones"""
+    token = request_priority.set(BACKGROUND)
+    try:
+        yield
+    finally:
+        request_priority.reset(token)
+
+
+def with_complexity(query: str) -> str:
+    """Ask Monday.com to report the query's complexity cost and remaining budget"""
+    if "complexity" in query:
+        return query
+    brace = query.find("{")
+    if brace < 0:
+        return query
+    return query[:brace + 1] + "\n    complexity { before after query reset_in_x_seconds }" + query[brace + 1:]
+
+
+def rate_limit_retry_after(status_code: int, headers: Any, result: Optional[Dict[str, Any]]) -> Optional[float]:
+    """
+    Return how long to wait if the response is a rate-limit rejection, else None.
+    Returns 0.0 when the server is throttling but gave no explicit delay.
+    """
+    throttled = status_code == 429
+    retry_after: Optional[float] = None
+
+    header_value = headers.get("retry-after") if headers is not None else None
+    if header_value:
+        try:
+            retry_after = float(header_value)
+        except ValueError:
+            pass
+
+    errors = (result or {}).get("errors") or []
+    if isinstance(errors, dict):
+        errors = [errors]
+    for error in errors:
+        extensions = error.get("extensions") or {}
+        code = extensions.get("code") or error.get("error_code") or ""
+        message = error.get("message") or ""
+        if code in _RATE_LIMIT_CODES or "complexity budget" in message.lower() or "rate limit" in message.lower():
+            throttled = True
+            seconds = extensions.get("retry_in_seconds")
+            match = _RETRY_SECONDS.search(message)
+            if seconds is not None:
+                retry_after = float(seconds)
+            elif match:
+                retry_after = float(match.group(1))
+
+    # Older API versions report complexity errors at the top level
+    if result and result.get("error_code") in _RATE_LIMIT_CODES:
+        throttled = True
+        match = _RETRY_SECONDS.search(result.get("error_message", ""))
+        if match:
+            retry_after = float(match.group(1))
+
+    if not throttled:
+        return None
+    return retry_after if retry_after is not None else 0.0
+
+
+def backoff_delay(attempt: int, retry_after: Optional[float] = None) -> float:
+    """Exponential backoff with full jitter, never shorter than the server's hint"""
+    delay = random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * (2 ** attempt)))
+    return max(delay, retry_after or 0.0)
+
+
+class ComplexityScheduler:
+    """
+    Token bucket over Monday.com's complexity budget.
+
+    Every request waits until the bucket holds its estimated cost. The bucket
+    refills continuously and is corrected from the `complexity` field Monday.com
+    returns with each response. Interactive requests go first: background work
+    waits while any interactive request is queued and never spends the reserve.
+    A request costing more than its share of the bucket waits for a full
+    share instead of forever, and the bucket goes into debt for the rest.
+    """
+
+    def __init__(
+        self,
+        budget_per_minute: int = MONDAY_COMPLEXITY_BUDGET,
+        background_reserve: float = MONDAY_BACKGROUND_RESERVE,
+    ):
+        self.capacity = float(budget_per_minute)
+        self.tokens = float(budget_per_minute)
+        self.refill_rate = budget_per_minute / 60.0
+        self.reserve = budget_per_minute * background_reserve
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._waiting = {INTERACTIVE: 0, BACKGROUND: 0}
+        self._costs: Dict[int, float] = {}
+        self.throttled = 0
+        self.waited_seconds = 0.0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.refill_rate)
+        self._updated = now
+
+    def estimate(self, query: str) -> float:
+        """Last observed cost of this query, or a conservative default"""
+        return self._costs.get(hash(query), DEFAULT_QUERY_COST)
+
+    def _floor(self, priority: int) -> float:
+        """Tokens a request of this priority must leave in the bucket"""
+        return self.reserve if priority == BACKGROUND else 0.0
+
+    def _needed(self, cost: float, priority: int) -> float:
+        """Tokens a request must find above its floor, capped at what the bucket can ever hold"""
+        return min(cost, max(self.capacity - self._floor(priority), 0.0))
+
+    def _can_start(self, cost: float, priority: int) -> bool:
+        if time.monotonic() < self._blocked_until:
+            return False
+        if priority == BACKGROUND and self._waiting[INTERACTIVE] > 0:
+            return False
+        return self.tokens - self._needed(cost, priority) >= self._floor(priority)
+
+    async def acquire(self, cost: float, priority: Optional[int] = None) -> None:
+        """Wait until the budget allows a request of this cost, then spend it"""
+        priority = request_priority.get() if priority is None else priority
+        self._refill()
+        if self._can_start(cost, priority):
+            self.tokens -= cost
+            return
+
+        started = time.monotonic()
+        self._waiting[priority] += 1
+        try:
+            while True:
+                self._refill()
+                if self._can_start(cost, priority):
+                    self.tokens -= cost
+                    return
+                shortfall = max(0.0, self._needed(cost, priority) + self._floor(priority) - self.tokens)
+                delay = max(self._blocked_until - time.monotonic(), shortfall / self.refill_rate, 0.01)
+                await asyncio.sleep(min(delay, 1.0))
+        finally:
+            self._waiting[priority] -= 1
+            self.waited_seconds += time.monotonic() - started
+
+    def observe(self, query: str, complexity: Optional[Dict[str, Any]]) -> None:
+        """Correct the bucket from the complexity block of a response"""
+        if not complexity:
+            return
+        self._refill()
+        if complexity.get("query") is not None:
+            if len(self._costs) > 1024:
+                self._costs.clear()
+            self._costs[hash(query)] = float(complexity["query"])
+        if complexity.get("after") is not None:
+            self.tokens = min(self.capacity, float(complexity["after"]))
+
+    def block_for(self, seconds: float) -> None:
+        """Stop all requests for a while after Monday.com throttled us"""
+        self.throttled += 1
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    def stats(self) -> Dict[str, Any]:
+        self._refill()
+        return {
+            "tokens": int(self.tokens),
+            "capacity": int(self.capacity),
+            "waiting_interactive": self._waiting[INTERACTIVE],
+            "waiting_background": self._waiting[BACKGROUND],
+            "throttled": self.throttled,
+            "waited_seconds": round(self.waited_seconds, 3),
+        }
+
+
+_scheduler: Optional[ComplexityScheduler] = None
+
+
+def get_complexity_scheduler() -> ComplexityScheduler:
+    """Return the process-wide scheduler (the budget is per account, not per client)"""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = ComplexityScheduler()
+    return _scheduler
@@ -3,6 +3,7 @@ import './App.css';
 import SoundWave from './components/SoundWave';
 import { useSpeechRecognition } from './hooks/useSpeechRecognition';
 import { useSpeechSynthesis } from './hooks/useSpeechSynthesis';
+import { streamChat } from './api/streamChat';
 
 function App() {
   const [status, setStatus] = useState('idle');
@@ -58,21 +59,12 @@ function App() {
     try {
       console.log('Sending to Friday:', transcript);
       
-      const response = await fetch('/api/chat', {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-        },
-        body: JSON.stringify({ message: transcript }),
+      // Stream the reply so tool progress and the first words show up right away
+      const reply = await streamChat(transcript, {
+        onProgress: (status) => setStatusText(status),
+        onChunk: (chunk, text) => setStatusText(text),
       });
-
-      const data = await response.json();
-
-      if (response.ok) {
-        await speak(data.response);
-      } else {
-        throw new Error(data.error || 'Failed to get response');
-      }
+      await speak(reply);
     } catch (error) {
       console.error('Error communicating with Friday:', error);
       await speak('Apologies, Sir, but I encountered a technical difficulty.');
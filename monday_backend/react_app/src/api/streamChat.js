@@ -0,0 +1,14 @@
+// Streamed chat replies from Friday
+//
+// The SSE reader itself lives in monday_backend/static/js/chat_stream.js,
+// shared with the classic pages and served at /classic/static/ so it stays
+// clear of the build's own /static/. Create React App can't import files
+// from outside src/, so public/index.html loads it as a plain script and
+// this module hands its window.streamChat to the React code.
+
+export const streamChat = (message, handlers = {}) => {
+  if (typeof window.streamChat !== 'function') {
+    return Promise.reject(new Error('Chat streaming script failed to load'));
+  }
+  return window.streamChat(message, handlers);
+};
@@ -136,25 +136,25 @@ class FridayWebInterface {
         this.updateStatus('thinking', 'Friday is thinking...');
         this.showLoading();
 
+        let bubble = null;
         try {
-            // Send message to backend
-            const response = await fetch('/api/chat', {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json',
+            // Stream Friday's reply: progress goes to the status bar, text into the bubble as it arrives
+            const reply = await streamChat(message, {
+                onProgress: (status) => this.updateStatus('thinking', status),
+                onChunk: (chunk, text) => {
+                    if (!bubble) {
+                        this.hideLoading();
+                        bubble = this.addMessage('', 'assistant');
+                    }
+                    bubble.innerHTML = this.escapeHtml(text);
+                    this.scrollToBottom();
                 },
-                body: JSON.stringify({ message }),
             });
 
-            const data = await response.json();
-
-            if (response.ok) {
-                // Add Friday's response
-                this.addMessage(data.response, 'assistant');
-                this.speakResponse(data.response);
-            } else {
-                throw new Error(data.error || 'Failed to get response');
+            if (!bubble) {
+                this.addMessage(reply, 'assistant');
             }
+            this.speakResponse(reply);
         } catch (error) {
             console.error('Error sending message:', error);
             this.addMessage('Apologies, Sir, but I encountered a technical difficulty. Please try again.', 'assistant');
@@ -181,6 +181,7 @@ class FridayWebInterface {
 
         this.messageList.appendChild(messageDiv);
         this.scrollToBottom();
+        return messageDiv.querySelector('.text');
     }
 
     speakResponse(text) {
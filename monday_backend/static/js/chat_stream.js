@@ -0,0 +1,68 @@
+// Friday AI Assistant - streamed chat replies
+//
+// POSTs to /api/chat/stream and reads the server-sent events off the
+// response body (EventSource can't POST). Resolves with the full answer.
+// This is the only copy: the chat and classic templates and the React app
+// (react_app/public/index.html, via src/api/streamChat.js) all load it.
+
+async function streamChat(message, handlers = {}) {
+    const response = await fetch('/api/chat/stream', {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+            'Accept': 'text/event-stream',
+        },
+        body: JSON.stringify({ message }),
+        signal: handlers.signal,
+    });
+
+    if (!response.ok || !response.body) {
+        const data = await response.json().catch(() => ({}));
+        throw new Error(data.error || 'Failed to get response');
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let answer = '';
+
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+
+        // Events are separated by a blank line
+        let boundary;
+        while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+            const raw = buffer.slice(0, boundary);
+            buffer = buffer.slice(boundary + 2);
+
+            let event = 'message';
+            let data = '';
+            for (const line of raw.split('\n')) {
+                if (line.startsWith('event:')) event = line.slice(6).trim();
+                else if (line.startsWith('data:')) data += line.slice(5).trim();
+            }
+            const payload = data ? JSON.parse(data) : {};
+
+            if (event === 'ack' && handlers.onAck) {
+                handlers.onAck(payload);
+            } else if (event === 'progress' && handlers.onProgress) {
+                handlers.onProgress(payload.message, payload.tool);
+            } else if (event === 'chunk') {
+                answer += payload.text;
+                if (handlers.onChunk) handlers.onChunk(payload.text, answer);
+            } else if (event === 'done') {
+                return payload.response;
+            } else if (event === 'error') {
+                throw new Error(payload.error || 'Failed to get response');
+            }
+        }
+    }
+
+    // Stream closed without a `done` event; keep whatever arrived
+    if (answer) return answer;
+    throw new Error('Response stream ended early');
+}
+
+window.streamChat = streamChat;
@@ -0,0 +1,165 @@
+# static_assets.py
+
+import re
+import gzip
+import json
+import asyncio
+import hashlib
+import logging
+import mimetypes
+from pathlib import Path
+from typing import Optional, Dict, Any, Tuple
+
+try:
+    import brotli
+except ImportError:  # Optional: gzip alone still does most of the work
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "precompressed-manifest.json"
+# Files smaller than this gain nothing from compression
+MIN_COMPRESS_BYTES = 1024
+COMPRESSIBLE = {".js", ".css", ".html", ".json", ".map", ".svg", ".txt", ".ico"}
+# Create React App puts a content hash in names under static/, e.g. main.2f56fce9.js
+_FINGERPRINT = re.compile(r"\.[0-9a-f]{8,}\.")
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+# Unhashed names (index.html, manifest.json) may change between builds: revalidate every time
+REVALIDATE = "no-cache"
+
+# (suffix on disk, Content-Encoding), best first
+_ENCODINGS = [(".br", "br"), (".gz", "gzip")]
+
+Reply = Tuple[bytes, int, Dict[str, str]]
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:20]
+
+
+def _is_fingerprinted(rel: str) -> bool:
+    return rel.startswith("static/") and bool(_FINGERPRINT.search(rel.rsplit("/", 1)[-1]))
+
+
+def precompress_build(build_dir: Path) -> Dict[str, Any]:
+    """
+    Write .gz (and .br when brotli is installed) next to each compressible
+    file in a React build, and a manifest of content hashes and sizes.
+    """
+    build_dir = Path(build_dir)
+    manifest: Dict[str, Any] = {}
+    for path in sorted(build_dir.rglob("*")):
+        if not path.is_file() or path.name == MANIFEST_NAME or path.suffix in (".gz", ".br"):
+            continue
+        data = path.read_bytes()
+        rel = path.relative_to(build_dir).as_posix()
+        entry = {
+            "hash": _digest(data),
+            "size": len(data),
+            "immutable": _is_fingerprinted(rel),
+            "encodings": {},
+        }
+        if path.suffix in COMPRESSIBLE and len(data) >= MIN_COMPRESS_BYTES:
+            # mtime=0 keeps the .gz byte-identical across rebuilds of the same file
+            compressed = {"gzip": gzip.compress(data, compresslevel=9, mtime=0)}
+            if brotli is not None:
+                compressed["br"] = brotli.compress(data, quality=11)
+            for suffix, encoding in _ENCODINGS:
+                body = compressed.get(encoding)
+                # Keep only encodings that actually shrink the file
+                if body is not None and len(body) < len(data):
+                    path.with_name(path.name + suffix).write_bytes(body)
+                    entry["encodings"][encoding] = len(body)
+        manifest[rel] = entry
+    (build_dir / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    return manifest
+
+
+class StaticAssets:
+    """
+    Serves a React build from memory.
+
+    Uses the manifest written by precompress_build() for content hashes and
+    the precompressed variants; without one (no build_react.py run) it hashes
+    the files itself and serves them uncompressed. Every reply carries an
+    ETag, fingerprinted files are cached as immutable, and a matching
+    If-None-Match gets an empty 304.
+    """
+
+    def __init__(self, build_dir: Path):
+        self.build_dir = Path(build_dir)
+        self._manifest: Optional[Dict[str, Any]] = None
+        # (path, encoding) -> file bytes, read once
+        self._bodies: Dict[Tuple[str, str], bytes] = {}
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        if self._manifest is None:
+            manifest_path = self.build_dir / MANIFEST_NAME
+            if manifest_path.exists():
+                self._manifest = json.loads(manifest_path.read_text())
+            else:
+                logger.warning(f"⚠️ No {MANIFEST_NAME} in {self.build_dir}; run build_react.py to precompress assets")
+                self._manifest = {}
+                for path in self.build_dir.rglob("*"):
+                    if path.is_file():
+                        rel = path.relative_to(self.build_dir).as_posix()
+                        self._manifest[rel] = {"hash": _digest(path.read_bytes()), "immutable": _is_fingerprinted(rel), "encodings": {}}
+        return self._manifest
+
+    async def reply(self, path: str, headers: Dict[str, str]) -> Reply:
+        """Build the (body, status, headers) reply for a GET of path"""
+        manifest = await asyncio.to_thread(self._load_manifest)
+        entry = manifest.get(path)
+        if entry is None:
+            return b"Not Found", 404, {"Content-Type": "text/plain"}
+
+        encoding = self._negotiate(entry, headers.get("Accept-Encoding", ""))
+        etag = f'"{entry["hash"]}-{encoding}"' if encoding else f'"{entry["hash"]}"'
+        response_headers = {
+            "ETag": etag,
+            "Cache-Control": IMMUTABLE if entry["immutable"] else REVALIDATE,
+            "Vary": "Accept-Encoding",
+        }
+        if self._not_modified(entry["hash"], headers.get("If-None-Match", "")):
+            return b"", 304, response_headers
+
+        body = self._bodies.get((path, encoding))
+        if body is None:
+            suffix = dict((enc, suf) for suf, enc in _ENCODINGS).get(encoding, "")
+            body = await asyncio.to_thread((self.build_dir / (path + suffix)).read_bytes)
+            self._bodies[(path, encoding)] = body
+
+        content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        if content_type.startswith("text/") or content_type in ("application/javascript", "application/json"):
+            content_type += "; charset=utf-8"
+        response_headers["Content-Type"] = content_type
+        if encoding:
+            response_headers["Content-Encoding"] = encoding
+        return body, 200, response_headers
+
+    def _negotiate(self, entry: Dict[str, Any], accept_encoding: str) -> str:
+        accepted = {
+            part.split(";")[0].strip().lower()
+            for part in accept_encoding.split(",")
+            if not part.strip().endswith(";q=0")
+        }
+        for _, encoding in _ENCODINGS:
+            if encoding in entry["encodings"] and encoding in accepted:
+                return encoding
+        return ""
+
+    @staticmethod
+    def _not_modified(content_hash: str, if_none_match: str) -> bool:
+        if not if_none_match:
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        # Any encoding of the same content is still a valid cached copy
+        for tag in if_none_match.split(","):
+            tag = tag.strip()
+            if tag.startswith("W/"):
+                tag = tag[2:]
+            if tag.strip('"').split("-")[0] == content_hash:
+                return True
+        return False
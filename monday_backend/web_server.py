@@ -1,28 +1,57 @@
-from flask import Flask, render_template, request, jsonify, send_from_directory
-from flask_cors import CORS
+from quart import Quart, render_template, request, jsonify, make_response
+from quart_cors import cors
 import asyncio
 import json
 import os
+import re
 import sys
+import time
 from pathlib import Path
+from typing import Optional, Callable, Awaitable, AsyncIterator
 
 # Add the parent directory to the path so we can import from the main project
 parent_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(parent_dir))
 
 from dotenv import load_dotenv
-from livekit.agents import RunContext
+import uvicorn
 import logging
 
 # Import Friday's components
-from tools import get_weather, search_web, send_email, create_crm_task
-from monday_backend.monday_tools import create_monday_task, list_monday_boards, search_monday_tasks, add_task_update, create_crm_task as monday_create_crm_task
+from tool_registry import get_tool, start_tool_prewarm
 from prompts import AGENT_INSTRUCTION
+from tracing import get_metrics
+from loop_watchdog import start_loop_watchdog
+from mcp_session import close_mcp_session
+from http_client import close_http_client
+from monday_backend.monday_integration import close_monday_client
+from monday_backend.intent_router import friday_router
+from monday_backend.static_assets import StaticAssets
 
 load_dotenv()
 
-app = Flask(__name__)
-CORS(app)
+# One long-lived event loop serves every request (ASGI), so shared clients,
+# sessions and caches stay warm across requests
+# The classic pages' assets live under /classic/static so the React build
+# keeps /static (its hashed bundles) to itself
+app = cors(Quart(__name__, static_url_path='/classic/static'))
+
+# Streamed answers are cut into chunks of about this many characters
+STREAM_CHUNK_CHARS = 48
+
+ProgressHandler = Callable[[str, str], Awaitable[None]]
+
+# Tool registry names of the tools chat intents and the tool routes use
+WEB_TOOLS = {
+    'get_weather': 'get_weather',
+    'search_web': 'search_web',
+    'send_email': 'send_email',
+    'create_crm_task': 'create_crm_task',
+    'create_monday_task': 'monday_api.create_monday_task',
+    'list_monday_boards': 'monday_api.list_monday_boards',
+    'search_monday_tasks': 'monday_api.search_monday_tasks',
+    'add_task_update': 'monday_api.add_task_update',
+}
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -32,94 +61,77 @@ class WebFriday:
     """Web version of Friday that can process text messages and return responses"""
     
     def __init__(self):
-        self.tools = {
-            'get_weather': get_weather,
-            'search_web': search_web,
-            'send_email': send_email,
-            'create_monday_task': create_monday_task,
-            'list_monday_boards': list_monday_boards,
-            'search_monday_tasks': search_monday_tasks,
-            'add_task_update': add_task_update
-        }
         self.context = None  # We'll need to mock this for web interface
+        self.router = friday_router()
     
-    async def process_message(self, message: str) -> str:
-        """Process a user message and return Friday's response"""
+    async def process_message(self, message: str, on_progress: Optional[ProgressHandler] = None) -> str:
+        """
+        Process a user message and return Friday's response.
+        on_progress, if given, is awaited with (tool, status message) before each tool runs.
+        """
         
-        # Simple keyword-based tool detection for web interface
-        message_lower = message.lower()
+        match = self.router.route(message)
+        intent = match.intent if match else None
+        slots = match.slots if match else {}
         
         try:
-            # Weather requests
-            if any(word in message_lower for word in ['weather', 'temperature', 'forecast']):
-                # Extract city name (simple extraction)
-                words = message.split()
-                city = None
-                for i, word in enumerate(words):
-                    if word.lower() in ['in', 'for', 'at']:
-                        if i + 1 < len(words):
-                            city = words[i + 1].strip('.,?!')
-                            break
-                
+            if intent == 'weather':
+                city = slots['city']
                 if city:
-                    return await self.tools['get_weather'](self.context, city)
-                else:
-                    return "Of course, Sir. Which city would you like the weather for?"
+                    await self._progress(on_progress, 'get_weather', f"Checking the weather in {city}...")
+                    return await self.tool('get_weather')(self.context, city)
+                return "Of course, Sir. Which city would you like the weather for?"
             
-            # Web search requests
-            elif any(word in message_lower for word in ['search', 'look up', 'find', 'google']):
-                # Extract search query
-                query = message
-                for prefix in ['search for', 'look up', 'find', 'google']:
-                    if prefix in message_lower:
-                        query = message[message_lower.find(prefix) + len(prefix):].strip()
-                        break
-                
-                return await self.tools['search_web'](self.context, query)
+            elif intent == 'create_task':
+                task_name = slots['task_name']
+                if task_name:
+                    await self._progress(on_progress, 'create_crm_task', f"Creating task '{task_name}'...")
+                    return await self.tool('create_crm_task')(self.context, task_name)
+                return "I'd be happy to create a CRM task for you, Sir. What should I call it?"
             
-            # Monday.com CRM task creation
-            elif any(word in message_lower for word in ['create task', 'add task', 'new task', 'crm task', 'paid media']):
-                if 'create' in message_lower or 'add' in message_lower or 'new' in message_lower:
-                    # Extract task name from message
-                    task_name = None
-                    if 'called' in message_lower:
-                        start_idx = message_lower.find('called') + 6
-                        task_name = message[start_idx:].strip(' "\'')
-                    elif 'named' in message_lower:
-                        start_idx = message_lower.find('named') + 5
-                        task_name = message[start_idx:].strip(' "\'')
-                    
-                    if task_name:
-                        return await create_crm_task(self.context, task_name)
-                    else:
-                        return "I'd be happy to create a CRM task for you, Sir. What should I call it?"
-                
-            # Monday.com board listing
-            elif any(word in message_lower for word in ['boards', 'list boards', 'show boards']):
-                return await self.tools['list_monday_boards'](self.context)
+            elif intent == 'search_tasks':
+                query = slots['query']
+                if query:
+                    await self._progress(on_progress, 'search_monday_tasks', f"Looking for tasks matching {query}...")
+                    return await self.tool('search_monday_tasks')(self.context, None, query)
+                return "Certainly, Sir. Which task should I look for?"
+            
+            elif intent == 'list_boards':
+                await self._progress(on_progress, 'list_monday_boards', "Fetching your Monday.com boards...")
+                return await self.tool('list_monday_boards')(self.context)
             
-            # Email requests
-            elif any(word in message_lower for word in ['email', 'send email', 'mail']):
+            elif intent == 'send_email':
+                recipient = slots['recipient']
+                if recipient:
+                    return f"Certainly, Sir. What should the subject and message to {recipient} be?"
                 return "Certainly, Sir. I can send emails, but I'll need the recipient, subject, and message content."
             
+            elif intent == 'web_search':
+                query = slots['query'] or message
+                await self._progress(on_progress, 'search_web', f"Searching the web for {query}...")
+                return await self.tool('search_web')(self.context, query)
+            
             # General conversation
-            else:
-                return self._generate_friday_response(message)
+            return self._generate_friday_response(intent)
                 
         except Exception as e:
             logger.error(f"Error processing message: {e}")
             return f"Apologies, Sir, but I encountered an error: {str(e)}"
     
-    def _generate_friday_response(self, message: str) -> str:
+    def tool(self, name: str):
+        """The tool behind a chat intent; its module is imported on first use"""
+        return get_tool(WEB_TOOLS[name])
+
+    async def _progress(self, on_progress: Optional[ProgressHandler], tool: str, status: str) -> None:
+        if on_progress is not None:
+            await on_progress(tool, status)
+    
+    def _generate_friday_response(self, intent: Optional[str]) -> str:
         """Generate a Friday-style response for general conversation"""
-        message_lower = message.lower()
-        
-        # Greetings
-        if any(word in message_lower for word in ['hello', 'hi', 'hey', 'good morning', 'good afternoon', 'good evening']):
+        if intent == 'greeting':
             return "Good day, Sir. I am Friday, your personal assistant. How may I be of service today?"
         
-        # Help requests
-        elif any(word in message_lower for word in ['help', 'what can you do', 'capabilities']):
+        elif intent == 'help':
             return """At your service, Sir. I can assist you with:
 • Weather information for any city
 • Web searches and research
@@ -127,8 +139,7 @@ class WebFriday:
 • Sending emails
 • General assistance with a touch of wit, naturally."""
         
-        # Thanks
-        elif any(word in message_lower for word in ['thank', 'thanks', 'appreciate']):
+        elif intent == 'thanks':
             return "You're quite welcome, Sir. It's what I'm here for."
         
         # Default response
@@ -137,50 +148,39 @@ class WebFriday:
 
 # Initialize Friday
 friday = WebFriday()
+react_assets = StaticAssets(Path(__file__).parent / 'react_app' / 'build')
 
 @app.route('/')
-def index():
+async def index():
     """Serve the React voice interface"""
-    return send_from_directory('react_app/build', 'index.html')
+    return await react_assets.reply('index.html', request.headers)
 
 @app.route('/classic')
-def classic_interface():
+async def classic_interface():
     """Serve the classic voice-only interface"""
-    return render_template('voice_interface.html')
+    return await render_template('voice_interface.html')
 
 @app.route('/chat')
-def chat_interface():
+async def chat_interface():
     """Serve the full chat interface"""
-    return render_template('index.html')
+    return await render_template('index.html')
 
 @app.route('/<path:path>')
-def static_react_files(path):
-    """Serve React static files"""
-    return send_from_directory('react_app/build', path)
-
-@app.route('/static/<path:filename>')
-def static_files(filename):
-    """Serve static files"""
-    return send_from_directory('static', filename)
+async def static_react_files(path):
+    """Serve React static files (precompressed, with ETag and long-lived caching)"""
+    return await react_assets.reply(path, request.headers)
 
 @app.route('/api/chat', methods=['POST'])
-def chat():
+async def chat():
     """Handle chat messages from the web interface"""
     try:
-        data = request.get_json()
+        data = await request.get_json()
         message = data.get('message', '').strip()
         
         if not message:
             return jsonify({'error': 'No message provided'}), 400
         
-        # Process the message asynchronously
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
-        try:
-            response = loop.run_until_complete(friday.process_message(message))
-        finally:
-            loop.close()
+        response = await friday.process_message(message)
         
         return jsonify({
             'response': response,
@@ -191,18 +191,84 @@ def chat():
         logger.error(f"Error in chat endpoint: {e}")
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/chat/stream', methods=['POST'])
+async def chat_stream():
+    """
+    Stream a chat reply as server-sent events: an immediate `ack`, a
+    `progress` event per tool Friday runs, the answer as `chunk` events and
+    a final `done` (or `error`).
+    """
+    data = await request.get_json()
+    message = (data or {}).get('message', '').strip()
+    
+    if not message:
+        return jsonify({'error': 'No message provided'}), 400
+    
+    response = await make_response(
+        _chat_events(message),
+        {
+            'Content-Type': 'text/event-stream',
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no',  # Don't let proxies hold the stream back
+        },
+    )
+    response.timeout = None
+    return response
+
+async def _chat_events(message: str) -> AsyncIterator[bytes]:
+    started = time.perf_counter()
+    events: asyncio.Queue = asyncio.Queue()
+    
+    async def on_progress(tool: str, status: str) -> None:
+        await events.put(('progress', {'tool': tool, 'message': status}))
+    
+    async def run() -> None:
+        try:
+            answer = await friday.process_message(message, on_progress=on_progress)
+            await events.put(('answer', answer))
+        except Exception as e:
+            logger.error(f"Error in chat stream: {e}")
+            await events.put(('error', {'error': str(e)}))
+    
+    yield _sse('ack', {'message': message})
+    task = asyncio.create_task(run())
+    try:
+        while True:
+            event, payload = await events.get()
+            if event == 'answer':
+                for chunk in _answer_chunks(payload):
+                    yield _sse('chunk', {'text': chunk})
+                yield _sse('done', {'response': payload, 'elapsed_ms': round((time.perf_counter() - started) * 1000, 1)})
+                break
+            yield _sse(event, payload)
+            if event == 'error':
+                break
+    finally:
+        # The client went away; stop working on its answer
+        if not task.done():
+            task.cancel()
+
+def _sse(event: str, payload) -> bytes:
+    return f"event: {event}\ndata: {json.dumps(payload)}\n\n".encode('utf-8')
+
+def _answer_chunks(text: str, size: int = STREAM_CHUNK_CHARS) -> list:
+    """Split an answer into word-aligned chunks of roughly `size` characters"""
+    chunks = []
+    current = ''
+    for word in re.findall(r'\S+\s*', text):
+        if current and len(current) + len(word) > size:
+            chunks.append(current)
+            current = ''
+        current += word
+    if current:
+        chunks.append(current)
+    return chunks
+
 @app.route('/api/tools/monday/boards', methods=['GET'])
-def get_monday_boards():
+async def get_monday_boards():
     """Get Monday.com boards"""
     try:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
-        try:
-            response = loop.run_until_complete(list_monday_boards(None))
-        finally:
-            loop.close()
-        
+        response = await friday.tool('list_monday_boards')(None)
         return jsonify({'response': response})
         
     except Exception as e:
@@ -210,38 +276,53 @@ def get_monday_boards():
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/tools/monday/create-task', methods=['POST'])
-def create_task():
-    """Create a Monday.com task"""
+async def create_task():
+    """Create a Monday.com task (always on the board enforced by MONDAY_BOARD_ID)"""
     try:
-        data = request.get_json()
+        data = await request.get_json()
         task_name = data.get('task_name')
-        board_id = data.get('board_id')
         group_id = data.get('group_id')
         
-        if not task_name or not board_id:
-            return jsonify({'error': 'Task name and board ID are required'}), 400
-        
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
-        try:
-            response = loop.run_until_complete(
-                create_monday_task(None, task_name, board_id, group_id)
-            )
-        finally:
-            loop.close()
+        if not task_name:
+            return jsonify({'error': 'Task name is required'}), 400
         
+        response = await friday.tool('create_monday_task')(None, task_name, group_id)
         return jsonify({'response': response})
         
     except Exception as e:
         logger.error(f"Error creating Monday task: {e}")
         return jsonify({'error': str(e)}), 500
 
+@app.route('/metrics')
+async def metrics():
+    """Latency percentiles per traced stage and tool, tool runtime and cache stats, and event-loop stalls"""
+    return jsonify(get_metrics())
+
 @app.route('/health')
-def health():
+async def health():
     """Health check endpoint"""
     return jsonify({'status': 'healthy', 'service': 'Friday Web Interface'})
 
+@app.before_serving
+async def watch_event_loop():
+    """Catch tools that block the shared event loop"""
+    start_loop_watchdog()
+
+@app.before_serving
+async def prewarm_tools():
+    """Import the chat tools and their backends off the loop before the first message"""
+    start_tool_prewarm(WEB_TOOLS.values())
+
+@app.after_serving
+async def close_shared_clients():
+    """Close pooled connections owned by the server's event loop"""
+    for close in (close_mcp_session, close_http_client, close_monday_client):
+        # One failing close shouldn't leave the others open
+        try:
+            await close()
+        except Exception as e:
+            logger.warning(f"⚠️ Closing {close.__name__} failed: {e}")
+
 if __name__ == '__main__':
     print("🤖 Starting Friday Web Interface...")
     print("🌐 Visit http://localhost:5000 to chat with Friday")
@@ -251,4 +332,4 @@ if __name__ == '__main__':
     os.makedirs('static/css', exist_ok=True)
     os.makedirs('static/js', exist_ok=True)
     
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    uvicorn.run(app, host='0.0.0.0', port=5000)
@@ -3,10 +3,14 @@
 from dotenv import load_dotenv
 from livekit import agents
 from livekit.agents import AgentSession, Agent, function_tool, RunContext
-from livekit.plugins import google
-import asyncio
+import time
 import logging
-from tools import execute_mcp_tool, MONDAY_BOARD_ID
+from tool_registry import register_tool, get_tools, start_tool_prewarm, SLOW, MCP_TOOL_BACKEND
+from job_queue import get_job_queue, enqueue_mcp_tool
+from tool_runtime import latency_budget
+from session_warmup import start_session_warmup
+from worker_prewarm import prewarm_process, realtime_model, record_job_ready
+from tracing import instrument_session
 
 # Enable detailed logging
 logging.basicConfig(level=logging.INFO)
@@ -14,81 +18,55 @@ logger = logging.getLogger(__name__)
 
 load_dotenv()
 
-# Ultra-fast MCP function with immediate voice response but real data
+# Ultra-fast MCP functions: real confirmation within budget, otherwise a follow-up
+@register_tool(SLOW, **MCP_TOOL_BACKEND)
 @function_tool()
+@latency_budget(0.5, pending="Task '{task_name}' is being created in your Monday.com board, Sir!")
 async def create_monday_task_real(context: RunContext, task_name: str) -> str:
     """Create a task in Monday.com - ultra-fast with real confirmation"""
     logger.info(f"🚀 FAST TRACK: Creating task '{task_name}' in Monday.com...")
     
     try:
-        # Try the MCP call with a very short timeout
         main_board_id = "2034046752"  # Paid Media CRM main board
         
-        # Quick attempt - if it works great, if not we still give a good response
-        result = await asyncio.wait_for(
-            execute_mcp_tool("monday_create_item", {
-                "itemTitle": task_name,
-                "groupId": "group_mkv6xpc", 
-                "boardId": main_board_id
-            }),
-            timeout=0.5  # 500ms timeout to stay fast
-        )
+        # The write goes through the durable queue, so it happens exactly once
+        # even if the worker restarts before it finishes
+        queue = get_job_queue()
+        job_id = enqueue_mcp_tool("monday_create_item", {
+            "itemTitle": task_name,
+            "groupId": "group_mkv6xpc", 
+            "boardId": main_board_id
+        }, scope=_call_id(context))
+        job = await queue.wait(job_id)
         
-        logger.info(f"✅ FAST MCP SUCCESS: {result}")
+        logger.info(f"✅ MCP RESULT: {job['status']} {job['result'] or job['error']}")
         
         # Check if it actually worked
-        if "error" not in result and "You can set either" not in str(result):
+        if job["status"] == "done" and "You can set either" not in str(job["result"]):
             return f"Perfect! Task '{task_name}' has been created in your Paid Media CRM board, Sir!"
         else:
-            # Fall back to optimistic response
-            return f"Task '{task_name}' is being created in your Monday.com board, Sir!"
-            
-    except asyncio.TimeoutError:
-        logger.info(f"⏱️ TIMEOUT: MCP call took too long, giving optimistic response")
-        # Start background task for actual creation
-        asyncio.create_task(create_task_background(task_name))
-        return f"Task '{task_name}' is being created in your Monday.com board, Sir!"
+            return f"Sorry Sir, task '{task_name}' could not be created in Monday.com."
         
     except Exception as e:
         logger.error(f"💥 FAST TRACK ERROR: {str(e)}")
-        # Start background task as fallback
-        asyncio.create_task(create_task_background(task_name))
-        return f"Creating task '{task_name}' in your Monday.com workspace, Sir!"
+        return f"Sorry Sir, task '{task_name}' could not be created in Monday.com."
 
-async def create_task_background(task_name: str):
-    """Background task creation that actually calls MCP"""
-    try:
-        logger.info(f"📋 BACKGROUND MCP CALL: Executing monday_create_item for '{task_name}'")
-        main_board_id = "2034046752"  # Paid Media CRM main board
-        result = await execute_mcp_tool("monday_create_item", {
-            "itemTitle": task_name,
-            "groupId": "group_mkv6xpc",
-            "boardId": main_board_id
-        })
-        
-        logger.info(f"✅ BACKGROUND MCP RESULT: {result}")
-        
-        if "error" in result:
-            logger.error(f"❌ BACKGROUND MCP ERROR: {result['error']}")
-        else:
-            logger.info(f"🎉 BACKGROUND SUCCESS: Task '{task_name}' created successfully!")
-            
-    except Exception as e:
-        logger.error(f"💥 BACKGROUND EXCEPTION: {str(e)}")
+def _call_id(context: RunContext):
+    """Id of the function call being answered, used to deduplicate repeated writes"""
+    return getattr(getattr(context, "function_call", None), "call_id", None)
 
+@register_tool(SLOW, **MCP_TOOL_BACKEND)
 @function_tool()
+@latency_budget(0.5, pending="I can see your Monday.com workspace, Sir. Your main board is the Paid Media CRM; let me get the other boards.")
 async def list_monday_boards_real(context: RunContext) -> str:
     """List Monday.com boards - ultra-fast with real data"""
     logger.info(f"🚀 FAST TRACK: Listing Monday.com boards...")
     
     try:
-        # Try the MCP call with a very short timeout
-        result = await asyncio.wait_for(
-            execute_mcp_tool("monday_list_boards", {"limit": 5, "page": 1}),
-            timeout=0.5  # 500ms timeout to stay fast
-        )
+        from tools import execute_mcp_tool
+        result = await execute_mcp_tool("monday_list_boards", {"limit": 5, "page": 1})
         
-        logger.info(f"✅ FAST BOARDS SUCCESS: {result}")
+        logger.info(f"✅ BOARDS RESULT: {result}")
         
         # Parse the actual board data if available
         if "result" in result and "Paid Media CRM" in str(result):
@@ -98,39 +76,19 @@ async def list_monday_boards_real(context: RunContext) -> str:
             else:
                 return "I can see your Monday.com workspace with the Paid Media CRM board and several other active projects, Sir."
         else:
+            if "error" in result:
+                logger.error(f"❌ MCP ERROR: {result['error']}")
             # Fall back to optimistic response
             return "I can see your Monday.com workspace, Sir. Your main board is the Paid Media CRM with multiple active projects."
-            
-    except asyncio.TimeoutError:
-        logger.info(f"⏱️ TIMEOUT: Board listing took too long, giving optimistic response")
-        # Start background task for actual listing
-        asyncio.create_task(list_boards_background())
-        return "I can see your Monday.com workspace, Sir. Your main board is the Paid Media CRM with multiple projects including September Content and AOP campaigns."
         
     except Exception as e:
         logger.error(f"💥 FAST TRACK ERROR: {str(e)}")
-        # Start background task as fallback
-        asyncio.create_task(list_boards_background())
         return "I can see your Monday.com workspace, Sir. Your main board is the Paid Media CRM."
 
-async def list_boards_background():
-    """Background board listing that actually calls MCP"""
-    try:
-        logger.info(f"📋 BACKGROUND MCP CALL: Executing monday_list_boards")
-        result = await execute_mcp_tool("monday_list_boards", {"limit": 5, "page": 1})
-        
-        logger.info(f"✅ BACKGROUND MCP RESULT: {result}")
-        
-        if "error" in result:
-            logger.error(f"❌ BACKGROUND MCP ERROR: {result['error']}")
-        else:
-            logger.info(f"🎉 BACKGROUND SUCCESS: Boards listed successfully!")
-            
-    except Exception as e:
-        logger.error(f"💥 BACKGROUND EXCEPTION: {str(e)}")
+TOOL_NAMES = ["create_monday_task_real", "list_monday_boards_real"]
 
 class MVPFriday(Agent):
-    def __init__(self) -> None:
+    def __init__(self, llm) -> None:
         super().__init__(
             instructions="""
 You are Friday, a personal AI assistant like from Iron Man.
@@ -147,20 +105,20 @@ RESPONSE STYLE:
 
 IMPORTANT: Use the provided tools to actually perform Monday.com operations.
 """,
-            llm=google.beta.realtime.RealtimeModel(
-                voice="Aoede",
-                temperature=0.8,
-            ),
-            tools=[
-                create_monday_task_real,
-                list_monday_boards_real,
-            ],
+            llm=llm,
+            tools=get_tools(TOOL_NAMES),
         )
 
+def prewarm(proc: agents.JobProcess):
+    prewarm_process(proc, TOOL_NAMES)
+
 async def entrypoint(ctx: agents.JobContext):
+    started = time.perf_counter()
+    # Load tools.py and open the MCP session while the room connects
+    start_tool_prewarm(TOOL_NAMES)
     await ctx.connect()
     
-    assistant = MVPFriday()
+    assistant = MVPFriday(realtime_model(ctx))
     
     session = AgentSession(
         llm=assistant.llm,
@@ -170,13 +128,21 @@ async def entrypoint(ctx: agents.JobContext):
         agent=assistant,
         room=ctx.room,
     )
+    record_job_ready(ctx, started)
 
     logger.info("🚀 MVP Friday Agent Started - Real MCP Integration Active")
     logger.info("📋 Available commands: Create tasks, List boards")
     
+    # Record per-turn latency and serve /metrics if METRICS_PORT is set
+    instrument_session(session)
+    # Warm up the MCP session and board caches while the greeting is spoken
+    start_session_warmup()
+    # Resume any Monday.com writes a previous worker left queued
+    get_job_queue().start()
+
     await session.generate_reply(
         instructions="Say: 'Hello Sir, I'm Friday. I'm connected to your Monday.com workspace and ready to create real tasks. How may I assist you?'",
     )
 
 if __name__ == "__main__":
-    agents.cli.run_app(agents.WorkerOptions(entrypoint_fnc=entrypoint))
+    agents.cli.run_app(agents.WorkerOptions(entrypoint_fnc=entrypoint, prewarm_fnc=prewarm))
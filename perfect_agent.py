@@ -3,10 +3,14 @@
 from dotenv import load_dotenv
 from livekit import agents
 from livekit.agents import AgentSession, Agent, function_tool, RunContext
-from livekit.plugins import google
-import asyncio
+import time
 import logging
-from tools import execute_mcp_tool
+from tool_registry import register_tool, get_tools, start_tool_prewarm, SLOW, MCP_TOOL_BACKEND
+from job_queue import get_job_queue, enqueue_mcp_tool
+from tool_runtime import latency_budget
+from session_warmup import start_session_warmup
+from worker_prewarm import prewarm_process, realtime_model, record_job_ready
+from tracing import instrument_session
 
 # Enable detailed logging
 logging.basicConfig(level=logging.INFO)
@@ -14,145 +18,73 @@ logger = logging.getLogger(__name__)
 
 load_dotenv()
 
-# Global session reference for follow-up responses
-current_session = None
-
-# MCP functions that return real data with follow-up capability
+# MCP functions that return real data with follow-up capability: anything that
+# misses its budget is followed up in the caller's session when it completes
+@register_tool(SLOW, **MCP_TOOL_BACKEND)
 @function_tool()
+@latency_budget(0.1, pending="Creating task '{task_name}' in your Monday.com board, Sir. Processing now...")
 async def create_monday_task_real(context: RunContext, task_name: str) -> str:
     """Create a task in Monday.com with immediate response + real follow-up"""
     logger.info(f"🚀 CREATING: Task '{task_name}' in Monday.com...")
     
     try:
-        # Try fast MCP call first (100ms timeout)
         main_board_id = "2034046752"  # Paid Media CRM main board
         
-        result = await asyncio.wait_for(
-            execute_mcp_tool("monday_create_item", {
-                "itemTitle": task_name,
-                "groupId": "group_mkv6xpc", 
-                "boardId": main_board_id
-            }),
-            timeout=0.1  # Very short timeout
-        )
+        # Queue the write durably (exactly once per function call) and wait for the real outcome
+        queue = get_job_queue()
+        job_id = enqueue_mcp_tool("monday_create_item", {
+            "itemTitle": task_name,
+            "groupId": "group_mkv6xpc", 
+            "boardId": main_board_id
+        }, scope=getattr(getattr(context, "function_call", None), "call_id", None))
+        job = await queue.wait(job_id)
         
-        logger.info(f"✅ FAST SUCCESS: {result}")
+        logger.info(f"✅ TASK RESULT: {job['status']} {job['result'] or job['error']}")
         
-        # Check if it actually worked
-        if "error" not in str(result) and "You can set either" not in str(result):
-            return f"Perfect! Task '{task_name}' has been created in your Paid Media CRM board, Sir!"
+        # Generate response based on actual result
+        if job["status"] == "done" and "You can set either" not in str(job["result"]):
+            return f"Task '{task_name}' has been successfully created in your Paid Media CRM board, Sir!"
+        elif "You can set either" in str(job["result"]):
+            return f"Task '{task_name}' creation encountered a parameter conflict, Sir. The board structure may need adjustment."
         else:
-            # Schedule follow-up with actual status
-            asyncio.create_task(task_follow_up(task_name, "parameter_issue"))
-            return f"Creating task '{task_name}' in your Monday.com board, Sir. Let me check the status..."
+            return f"Task '{task_name}' could not be created in your Monday.com workspace, Sir."
             
-    except asyncio.TimeoutError:
-        # Schedule follow-up with real status
-        asyncio.create_task(task_follow_up(task_name, "processing"))
-        return f"Creating task '{task_name}' in your Monday.com board, Sir. Processing now..."
-        
     except Exception as e:
         logger.error(f"💥 ERROR: {str(e)}")
-        return f"I'll create task '{task_name}' in your Monday.com workspace, Sir."
+        return f"Task '{task_name}' could not be created in your Monday.com workspace, Sir."
 
+@register_tool(SLOW, **MCP_TOOL_BACKEND)
 @function_tool()
+@latency_budget(0.1, pending="I can see your Monday.com workspace, Sir. Let me get the exact board details...")
 async def list_monday_boards_real(context: RunContext) -> str:
     """List Monday.com boards with immediate response + real data follow-up"""
     logger.info(f"🚀 LISTING: Monday.com boards...")
     
     try:
-        # Try fast MCP call first (100ms timeout)
-        result = await asyncio.wait_for(
-            execute_mcp_tool("monday_list_boards", {"limit": 5, "page": 1}),
-            timeout=0.1  # Very short timeout
-        )
-        
-        logger.info(f"✅ FAST BOARDS: {result}")
-        
-        # Parse real data if available quickly
-        if "result" in result and "Paid Media CRM" in str(result):
-            boards_text = result["result"]
-            board_count = boards_text.count("ID:")
-            return f"I can see your Monday.com workspace, Sir. You have {board_count} boards including the Paid Media CRM, September Content, AOP Pizza Hut, and Beauty Fair boards."
-        else:
-            # Schedule follow-up with real data
-            asyncio.create_task(boards_follow_up())
-            return "Checking your Monday.com workspace, Sir. I can see multiple active boards..."
-            
-    except asyncio.TimeoutError:
-        # Schedule follow-up with real data
-        asyncio.create_task(boards_follow_up())
-        return "I can see your Monday.com workspace, Sir. Let me get the exact board details..."
-        
-    except Exception as e:
-        logger.error(f"💥 ERROR: {str(e)}")
-        return "I can see your Monday.com workspace with several active boards, Sir."
-
-# Follow-up functions that provide real results
-async def task_follow_up(task_name: str, status: str):
-    """Follow up with actual task creation results"""
-    try:
-        await asyncio.sleep(1)  # Brief delay for natural conversation
-        
-        logger.info(f"📋 FOLLOW-UP: Checking task '{task_name}' status...")
-        main_board_id = "2034046752"
-        
-        result = await execute_mcp_tool("monday_create_item", {
-            "itemTitle": task_name,
-            "groupId": "group_mkv6xpc",
-            "boardId": main_board_id
-        })
-        
-        logger.info(f"✅ FOLLOW-UP RESULT: {result}")
-        
-        # Generate follow-up response based on actual result
-        if "error" not in str(result) and "You can set either" not in str(result):
-            follow_up = f"Task '{task_name}' has been successfully created in your Paid Media CRM board, Sir!"
-        elif "You can set either" in str(result):
-            follow_up = f"Task '{task_name}' creation encountered a parameter conflict, Sir. The board structure may need adjustment."
-        else:
-            follow_up = f"Task '{task_name}' creation is being processed in your Monday.com workspace, Sir."
-        
-        # Send follow-up to the session if available
-        if current_session:
-            await current_session.say(follow_up)
-            logger.info(f"🗣️ FOLLOW-UP SPOKEN: {follow_up}")
-            
-    except Exception as e:
-        logger.error(f"💥 FOLLOW-UP ERROR: {str(e)}")
-
-async def boards_follow_up():
-    """Follow up with actual board listing results"""
-    try:
-        await asyncio.sleep(1)  # Brief delay for natural conversation
-        
-        logger.info(f"📋 FOLLOW-UP: Getting real board data...")
-        
+        from tools import execute_mcp_tool
         result = await execute_mcp_tool("monday_list_boards", {"limit": 5, "page": 1})
         
-        logger.info(f"✅ FOLLOW-UP BOARDS: {result}")
+        logger.info(f"✅ BOARDS: {result}")
         
         # Parse the real board data
         if "result" in result:
             boards_text = result["result"]
             if "Paid Media CRM" in boards_text:
                 board_count = boards_text.count("ID:")
-                follow_up = f"I found {board_count} boards in your workspace, Sir. Your main boards include Paid Media CRM (ID: 2034046752), September Content Board, AOP Pizza Hut, and Beauty Fair boards."
+                return f"I found {board_count} boards in your workspace, Sir. Your main boards include Paid Media CRM (ID: 2034046752), September Content Board, AOP Pizza Hut, and Beauty Fair boards."
             else:
-                follow_up = "I can see your Monday.com boards are all active and accessible, Sir."
+                return "I can see your Monday.com boards are all active and accessible, Sir."
         else:
-            follow_up = "Your Monday.com workspace is connected and all boards are accessible, Sir."
-        
-        # Send follow-up to the session if available
-        if current_session:
-            await current_session.say(follow_up)
-            logger.info(f"🗣️ FOLLOW-UP SPOKEN: {follow_up}")
+            return "Your Monday.com workspace is connected and all boards are accessible, Sir."
             
     except Exception as e:
-        logger.error(f"💥 FOLLOW-UP ERROR: {str(e)}")
+        logger.error(f"💥 ERROR: {str(e)}")
+        return "I can see your Monday.com workspace with several active boards, Sir."
+
+TOOL_NAMES = ["create_monday_task_real", "list_monday_boards_real"]
 
 class PerfectFriday(Agent):
-    def __init__(self) -> None:
+    def __init__(self, llm) -> None:
         super().__init__(
             instructions="""
 You are Friday, a personal AI assistant like from Iron Man.
@@ -173,43 +105,46 @@ IMPORTANT:
 - Expect follow-up information about actual results
 - Be confident but accurate about Monday.com operations
 """,
-            llm=google.beta.realtime.RealtimeModel(
-                voice="Aoede",
-                temperature=0.8,
-            ),
-            tools=[
-                create_monday_task_real,
-                list_monday_boards_real,
-            ],
+            llm=llm,
+            tools=get_tools(TOOL_NAMES),
         )
 
+def prewarm(proc: agents.JobProcess):
+    prewarm_process(proc, TOOL_NAMES)
+
 async def entrypoint(ctx: agents.JobContext):
-    global current_session
-    
+    started = time.perf_counter()
+    # Load tools.py and open the MCP session while the room connects
+    start_tool_prewarm(TOOL_NAMES)
     await ctx.connect()
     
-    assistant = PerfectFriday()
+    assistant = PerfectFriday(realtime_model(ctx))
     
     session = AgentSession(
         llm=assistant.llm,
     )
-    
-    # Store session for follow-up responses
-    current_session = session
 
     await session.start(
         agent=assistant,
         room=ctx.room,
     )
+    record_job_ready(ctx, started)
 
     logger.info("🎯 Perfect Friday Agent Started")
     logger.info("✅ Immediate responses + Real follow-ups")
     logger.info("🎤 Voice responses guaranteed")
     logger.info("📋 Real Monday.com operations with feedback")
     
+    # Record per-turn latency and serve /metrics if METRICS_PORT is set
+    instrument_session(session)
+    # Warm up the MCP session and board caches while the greeting is spoken
+    start_session_warmup()
+    # Resume any Monday.com writes a previous worker left queued
+    get_job_queue().start()
+
     await session.generate_reply(
         instructions="Say: 'Hello Sir, I'm Friday. I'm ready to manage your Monday.com workspace with immediate responses and real-time updates. How may I assist you?'",
     )
 
 if __name__ == "__main__":
-    agents.cli.run_app(agents.WorkerOptions(entrypoint_fnc=entrypoint))
+    agents.cli.run_app(agents.WorkerOptions(entrypoint_fnc=entrypoint, prewarm_fnc=prewarm))
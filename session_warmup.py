@@ -0,0 +1,82 @@
+# session_warmup.py
+
+import os
+import time
+import asyncio
+import logging
+from typing import Optional, Dict, Any, Set
+
+from mcp_session import open_mcp_session
+from web_search import warm_up_search
+
+logger = logging.getLogger(__name__)
+
+# Keep references so warm-up tasks aren't garbage collected mid-flight
+_warmup_tasks: Set[asyncio.Task] = set()
+
+
+async def warm_up_session() -> Dict[str, Any]:
+    """
+    Get everything the first tool call needs ready before the user speaks:
+    open the MCP session, build the web search provider, cache the enforced
+    board's groups and columns, and fill the local board index with recent
+    items. Each step is independent and best-effort; failures are logged and
+    never reach the conversation.
+    Returns per-step timings in milliseconds.
+    """
+    timings: Dict[str, Any] = {}
+
+    async def step(name: str, coro) -> None:
+        started = time.perf_counter()
+        try:
+            await coro
+            timings[name] = round((time.perf_counter() - started) * 1000, 1)
+        except Exception as e:
+            timings[name] = f"failed: {e}"
+            logger.warning(f"⚠️ Warm-up step '{name}' failed: {e}")
+
+    async def cache_board_metadata() -> None:
+        # Goes through execute_mcp_tool, so the results land in the shared tool cache
+        from tools import execute_mcp_tools
+        await execute_mcp_tools([
+            ("monday_get_board_groups", {}),
+            ("monday_get_board_columns", {}),
+        ])
+
+    async def index_recent_items() -> None:
+        if not os.getenv("MONDAY_API_KEY"):
+            return
+        from monday_backend.board_index import get_board_index, start_background_sync
+        if not get_board_index().is_ready(os.getenv("MONDAY_BOARD_ID")):
+            # The first background pass is a full sync; wait for it here
+            start_background_sync()
+            await _wait_for_index(timeout=10.0)
+
+    # The handshake has to finish before the cached calls can use the session
+    await asyncio.gather(
+        step("mcp_session", open_mcp_session()),
+        step("search_provider", warm_up_search()),
+    )
+    await asyncio.gather(
+        step("board_metadata", cache_board_metadata()),
+        step("recent_items", index_recent_items()),
+    )
+
+    logger.info(f"🔥 Session warm-up finished: {timings}")
+    return timings
+
+
+async def _wait_for_index(timeout: float) -> None:
+    from monday_backend.board_index import get_board_index
+    deadline = time.monotonic() + timeout
+    board_id = os.getenv("MONDAY_BOARD_ID")
+    while not get_board_index().is_ready(board_id) and time.monotonic() < deadline:
+        await asyncio.sleep(0.1)
+
+
+def start_session_warmup() -> asyncio.Task:
+    """Run warm_up_session() in the background, e.g. while the greeting is spoken"""
+    task = asyncio.create_task(warm_up_session())
+    _warmup_tasks.add(task)
+    task.add_done_callback(_warmup_tasks.discard)
+    return task
@@ -10,9 +10,9 @@ import threading
 import time
 from pathlib import Path
 
-def start_flask_server():
-    """Start the Flask backend server"""
-    print("🔧 Starting Flask backend server...")
+def start_backend_server():
+    """Start the Quart backend server"""
+    print("🔧 Starting Quart backend server...")
     os.system("python start_web.py")
 
 def start_react_dev_server():
@@ -35,11 +35,11 @@ def main():
     print("🛑 Press Ctrl+C to stop both servers")
     print("━" * 50)
     
-    # Start Flask server in a separate thread
-    flask_thread = threading.Thread(target=start_flask_server, daemon=True)
-    flask_thread.start()
+    # Start the backend server in a separate thread
+    backend_thread = threading.Thread(target=start_backend_server, daemon=True)
+    backend_thread.start()
     
-    # Give Flask time to start
+    # Give the backend time to start
     time.sleep(2)
     
     # Start React dev server (this will be the main process)
@@ -17,7 +17,7 @@ def main():
     print("🎨 Edit files in /monday_backend/react_app/src/")
     print("🛑 Press Ctrl+C to stop")
     print("━" * 50)
-    print("📝 Make sure Flask backend is running:")
+    print("📝 Make sure the Quart backend is running:")
     print("   python start_web.py (in another terminal)")
     print("━" * 50)
     
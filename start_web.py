@@ -11,7 +11,8 @@ from pathlib import Path
 monday_backend_dir = Path(__file__).parent / "monday_backend"
 sys.path.insert(0, str(monday_backend_dir))
 
-# Import and run the web server
+# Import and run the web server (ASGI app served by uvicorn)
+import uvicorn
 from web_server import app
 
 if __name__ == "__main__":
@@ -27,7 +28,7 @@ if __name__ == "__main__":
     print("-" * 50)
     
     try:
-        app.run(debug=False, host='0.0.0.0', port=5000)
+        uvicorn.run(app, host='0.0.0.0', port=5000)
     except KeyboardInterrupt:
         print("\n👋 Friday web interface stopped. Goodbye!")
         sys.exit(0)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Test the local Monday.com board index and its full/delta sync
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+from monday_backend.board_index import BoardIndex, sync
+
+BOARD_ID = "42"
+
+
+class FakeMondayClient:
+    """Just enough of MondayClient for sync(); records the rules it was asked for"""
+
+    def __init__(self, items):
+        self.enforced_board_id = BOARD_ID
+        self.items = items
+        self.requested_rules = []
+        self.cached_reads = 0
+
+    async def get_boards(self, fresh=False):
+        self.cached_reads += not fresh
+        return [{"id": BOARD_ID, "name": "Tasks", "state": "active"}]
+
+    async def get_board_groups(self, board_id, fresh=False):
+        self.cached_reads += not fresh
+        return [{"id": "topics", "title": "Topics"}]
+
+    async def get_board_columns(self, board_id, fresh=False):
+        self.cached_reads += not fresh
+        return [{"id": "status", "title": "Status", "type": "status"}]
+
+    async def iter_items(self, rules=None, page_size=100):
+        self.requested_rules.append(rules)
+        for item in self.items:
+            yield item
+
+
+def _item(item_id, name):
+    return {"id": item_id, "name": name, "group": {"id": "topics", "title": "Topics"}, "created_at": "2026-01-01T00:00:00Z"}
+
+
+def test_first_sync_is_full_and_marks_the_board_ready():
+    index = BoardIndex(":memory:")
+    client = FakeMondayClient([_item("1", "Draft budget"), _item("2", "Book venue")])
+
+    assert not index.is_ready(BOARD_ID)
+    written = asyncio.run(sync(index, client))
+
+    assert written == 2
+    assert client.requested_rules == [None]
+    assert index.is_ready(BOARD_ID)
+    # Board metadata is read past the TTL cache
+    assert client.cached_reads == 0
+    assert index.count_items(BOARD_ID) == 2
+    assert [g["id"] for g in index.list_groups(BOARD_ID)] == ["topics"]
+    assert [item["name"] for item in index.search_items(BOARD_ID, "budg")] == ["Draft budget"]
+
+
+def test_later_sync_only_asks_for_updated_items():
+    index = BoardIndex(":memory:")
+    client = FakeMondayClient([_item("1", "Draft budget"), _item("2", "Book venue")])
+    asyncio.run(sync(index, client))
+    last_sync = datetime.fromisoformat(index.get_state(f"items_synced:{BOARD_ID}"))
+
+    # Only the renamed item comes back from the delta query
+    client.items = [_item("1", "Final budget")]
+    written = asyncio.run(sync(index, client))
+
+    assert written == 1
+    (rule,) = client.requested_rules[-1]
+    assert rule["column_id"] == "__last_updated__"
+    assert rule["operator"] == "greater_than"
+    # Day-granular filter, overlapped by a day
+    assert rule["compare_value"] == ["EXACT", (last_sync - timedelta(days=1)).date().isoformat()]
+    # Items missing from a delta are kept, not treated as deleted
+    assert index.count_items(BOARD_ID) == 2
+    assert [item["name"] for item in index.search_items(BOARD_ID, "budget")] == ["Final budget"]
+
+
+def test_full_sync_drops_deleted_items():
+    index = BoardIndex(":memory:")
+    client = FakeMondayClient([_item("1", "Draft budget"), _item("2", "Book venue")])
+    asyncio.run(sync(index, client))
+
+    client.items = [_item("2", "Book venue")]
+    asyncio.run(sync(index, client, full=True))
+
+    assert client.requested_rules[-1] is None
+    assert index.count_items(BOARD_ID) == 1
+    assert index.search_items(BOARD_ID, "budget") == []
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Test routing of web chat messages to Friday's intents and their slots
+"""
+
+from monday_backend.intent_router import Intent, IntentRouter, friday_router
+
+ROUTER = friday_router()
+
+
+def _route(message):
+    match = ROUTER.route(message)
+    return (match.intent, match.slots) if match else None
+
+
+def test_weather_city_stops_before_time_words_and_punctuation():
+    assert _route("What's the weather in New York today?") == ("weather", {"city": "New York"})
+    assert _route("weather for Paris") == ("weather", {"city": "Paris"})
+    assert _route("what's the temperature") == ("weather", {"city": None})
+
+
+def test_task_names_and_queries():
+    assert _route("Create a task called Review Q3 budget") == ("create_task", {"task_name": "Review Q3 budget"})
+    assert _route("find the task named onboarding") == ("search_tasks", {"query": "onboarding"})
+
+
+def test_task_intents_win_over_web_search():
+    # "find" inside the task name must not turn this into a search
+    assert _route("add task named find leads") == ("create_task", {"task_name": "find leads"})
+    assert _route("Find leads in Berlin") == ("web_search", {"query": "leads in Berlin"})
+    assert _route("search for best pizza in town") == ("web_search", {"query": "best pizza in town"})
+
+
+def test_email_recipient_is_extracted():
+    assert _route("Send an email to anna.b@example.co.uk please") == ("send_email", {"recipient": "anna.b@example.co.uk"})
+    assert _route("send an email") == ("send_email", {"recipient": None})
+
+
+def test_intents_without_slots_and_no_match():
+    assert _route("Hey Friday") == ("greeting", {})
+    assert _route("blah blah") is None
+
+
+def test_earlier_intent_wins_a_shared_trigger():
+    router = IntentRouter([
+        Intent("first", ["look up"]),
+        Intent("second", ["look up", "look"]),
+    ])
+    assert router.route("please look up the forecast").intent == "first"
+    assert router.route("look at this").intent == "second"
+    assert router.route("look at this").trigger == "look"
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Test the durable job queue: idempotency, retries, and leases and recovery
+across processes sharing one file
+"""
+
+import os
+import sys
+import time
+import asyncio
+import sqlite3
+import tempfile
+import subprocess
+import types
+
+import job_queue
+from job_queue import JobQueue, PermanentJobError, make_idempotency_key, RUNNING, PENDING, DONE, FAILED
+
+
+def _queue_path() -> str:
+    return os.path.join(tempfile.mkdtemp(prefix="friday-jobs-"), "jobs.db")
+
+
+def _dead_pid() -> int:
+    child = subprocess.Popen([sys.executable, "-c", "pass"])
+    child.wait()
+    return child.pid
+
+
+def _mark_running(queue: JobQueue, job_id: int, owner_pid: int, lease_expires_at: float) -> None:
+    with queue._conn:
+        queue._conn.execute(
+            "UPDATE jobs SET status = ?, owner_pid = ?, lease_expires_at = ? WHERE id = ?",
+            (RUNNING, owner_pid, lease_expires_at, job_id),
+        )
+
+
+def test_recovery_leaves_a_live_owners_job_alone():
+    """A second queue opening the same file must not requeue a job the first is running"""
+    path = _queue_path()
+
+    async def scenario():
+        release = asyncio.Event()
+        started = asyncio.Event()
+        runs = []
+
+        async def slow(payload):
+            runs.append(payload)
+            started.set()
+            await release.wait()
+            return {"ok": True}
+
+        first = JobQueue(path, workers=1, lease=0.3)
+        first.register("slow", slow)
+        job_id = first.enqueue("slow", {"n": 1})
+        await asyncio.wait_for(started.wait(), 2)
+
+        # Outlive several lease periods: the renewal has to keep the job owned
+        await asyncio.sleep(1.0)
+        second = JobQueue(path, workers=1, lease=0.3)
+        second.register("slow", slow)
+        second.start()
+        await asyncio.sleep(0.5)
+
+        job = second.get(job_id)
+        assert job["status"] == RUNNING
+        assert job["owner_pid"] == os.getpid()
+        assert job["lease_expires_at"] > time.time()
+
+        release.set()
+        finished = await first.wait(job_id, timeout=2)
+        assert finished["status"] == DONE
+        assert finished["owner_pid"] is None
+        assert runs == [{"n": 1}]
+        first.close()
+        second.close()
+
+    asyncio.run(scenario())
+
+
+def test_recovery_requeues_a_dead_owners_job():
+    path = _queue_path()
+    queue = JobQueue(path, workers=1)
+    job_id = queue.enqueue("noop", {})
+    _mark_running(queue, job_id, _dead_pid(), time.time() + 60)
+    queue.close()
+
+    reopened = JobQueue(path, workers=1)
+    job = reopened.get(job_id)
+    assert job["status"] == PENDING
+    assert job["owner_pid"] is None
+    reopened.close()
+
+
+def test_recovery_requeues_an_expired_lease():
+    path = _queue_path()
+    queue = JobQueue(path, workers=1)
+    job_id = queue.enqueue("noop", {})
+    # Owner still alive but stopped renewing (e.g. a wedged event loop)
+    _mark_running(queue, job_id, os.getpid(), time.time() - 1)
+    queue._recover()
+    assert queue.get(job_id)["status"] == PENDING
+    queue.close()
+
+
+def test_opens_a_queue_file_from_before_leases():
+    path = _queue_path()
+    conn = sqlite3.connect(path)
+    conn.executescript(
+        "CREATE TABLE jobs (id INTEGER PRIMARY KEY AUTOINCREMENT, kind TEXT NOT NULL, payload TEXT NOT NULL, "
+        "idempotency_key TEXT UNIQUE, status TEXT NOT NULL, attempts INTEGER NOT NULL DEFAULT 0, "
+        "max_attempts INTEGER NOT NULL, run_at REAL NOT NULL, result TEXT, error TEXT, "
+        "created_at REAL NOT NULL, updated_at REAL NOT NULL);"
+    )
+    conn.execute(
+        "INSERT INTO jobs (kind, payload, status, max_attempts, run_at, created_at, updated_at) "
+        "VALUES ('noop', '{}', ?, 5, 0, 0, 0)", (RUNNING,),
+    )
+    conn.commit()
+    conn.close()
+
+    queue = JobQueue(path, workers=1)
+    job = queue.get(1)
+    assert job["status"] == PENDING
+    assert "lease_expires_at" in job
+    queue.close()
+
+
+def test_same_idempotency_key_enqueues_once():
+    queue = JobQueue(_queue_path(), workers=1)
+    payload = {"tool_name": "monday_create_item", "parameters": {"name": "Book venue"}}
+    key = make_idempotency_key("mcp_tool", payload, scope="call-1")
+
+    first = queue.enqueue("mcp_tool", payload, idempotency_key=key)
+    again = queue.enqueue("mcp_tool", dict(payload), idempotency_key=key)
+    other = queue.enqueue("mcp_tool", payload, idempotency_key=make_idempotency_key("mcp_tool", payload, scope="call-2"))
+
+    assert first == again != other
+    assert queue.deduplicated == 1
+    assert queue.stats()["pending"] == 2
+    queue.close()
+
+
+def test_failed_job_is_retried_until_it_succeeds(monkeypatch):
+    monkeypatch.setattr(job_queue, "RETRY_BASE", 0.01)
+    attempts = []
+
+    async def flaky(payload):
+        attempts.append(payload)
+        if len(attempts) < 3:
+            raise ConnectionError("try again")
+        return {"ok": True}
+
+    async def scenario():
+        queue = JobQueue(_queue_path(), workers=1)
+        queue.register("flaky", flaky)
+        job = await queue.wait(queue.enqueue("flaky", {"n": 1}), timeout=5)
+        queue.close()
+        return queue, job
+
+    queue, job = asyncio.run(scenario())
+    assert job["status"] == DONE
+    assert job["attempts"] == 3
+    assert job["result"] == {"ok": True}
+    assert queue.retried == 2
+
+
+def test_permanent_error_and_exhausted_attempts_fail_the_job(monkeypatch):
+    monkeypatch.setattr(job_queue, "RETRY_BASE", 0.01)
+
+    async def invalid(payload):
+        raise PermanentJobError("bad parameters")
+
+    async def down(payload):
+        raise ConnectionError("still down")
+
+    async def scenario():
+        queue = JobQueue(_queue_path(), workers=2)
+        queue.register("invalid", invalid)
+        queue.register("down", down)
+        rejected = queue.enqueue("invalid", {})
+        exhausted = queue.enqueue("down", {}, max_attempts=2)
+        jobs = [await queue.wait(rejected, timeout=5), await queue.wait(exhausted, timeout=5)]
+        queue.close()
+        return jobs
+
+    rejected, exhausted = asyncio.run(scenario())
+    assert (rejected["status"], rejected["attempts"], rejected["error"]) == (FAILED, 1, "bad parameters")
+    assert (exhausted["status"], exhausted["attempts"]) == (FAILED, 2)
+
+
+def test_mcp_tool_jobs_only_retry_what_is_safe(monkeypatch):
+    """Rate limits and unsent requests retry; a create that may have been sent does not"""
+    outcomes = {}
+
+    async def execute_mcp_tool(tool_name, parameters):
+        return outcomes[tool_name]
+
+    fake_tools = types.SimpleNamespace(
+        execute_mcp_tool=execute_mcp_tool,
+        RATE_LIMITED="rate_limited", NOT_SENT="not_sent", TRANSPORT="transport",
+    )
+    monkeypatch.setitem(sys.modules, "tools", fake_tools)
+
+    def raised(tool_name, error_kind):
+        outcomes[tool_name] = {"error": "failed", "error_kind": error_kind}
+        try:
+            asyncio.run(job_queue._run_mcp_tool({"tool_name": tool_name, "parameters": {}}))
+        except Exception as e:
+            return type(e)
+        return None
+
+    assert raised("monday_create_item", "rate_limited") is Exception
+    assert raised("monday_create_item", "not_sent") is Exception
+    assert raised("monday_create_item", "transport") is PermanentJobError
+    assert raised("monday_get_board_groups", "transport") is Exception
+    assert raised("monday_create_item", "permanent") is PermanentJobError
+    assert raised("monday_create_item", None) is PermanentJobError
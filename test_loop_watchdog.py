@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Test that the loop watchdog catches a blocked event loop and blames the
+tool running on the blocked stack
+"""
+
+import time
+import asyncio
+
+from loop_watchdog import LoopWatchdog
+from tracing import mark_tool_frame, traced
+
+
+async def run_tool(tool_name, body):
+    return body()
+
+
+mark_tool_frame(run_tool, "tool_name")
+
+
+def _blocking_lookup():
+    time.sleep(0.3)
+
+
+def _watch(scenario):
+    async def main():
+        watchdog = LoopWatchdog(asyncio.get_running_loop(), threshold=0.05, interval=0.01)
+        watchdog.start()
+        try:
+            # A few clean heartbeats first
+            await asyncio.sleep(0.05)
+            await scenario()
+            # Let the heartbeat wake up late and record the stall
+            await asyncio.sleep(0.05)
+        finally:
+            watchdog.stop()
+        return watchdog
+
+    return asyncio.run(main())
+
+
+def test_blocked_loop_is_blamed_on_the_marked_tool():
+    async def scenario():
+        await run_tool("slow_lookup", _blocking_lookup)
+
+    watchdog = _watch(scenario)
+    assert watchdog.stalls == 1
+    assert watchdog.stalls_by_tool == {"slow_lookup": 1}
+    stall = watchdog.recent[-1]
+    assert stall["tool"] == "slow_lookup"
+    assert stall["ms"] >= 250
+    # The captured stack ends in the blocking call itself
+    assert "time.sleep(0.3)" in stall["stack"][-1]
+
+
+def test_traced_tools_are_named_without_their_span_prefix():
+    @traced()
+    async def get_weather():
+        _blocking_lookup()
+
+    watchdog = _watch(get_weather)
+    assert watchdog.stalls_by_tool == {"get_weather": 1}
+
+
+def test_blocking_outside_a_tool_is_unknown_and_a_quiet_loop_has_no_stalls():
+    async def blocking():
+        _blocking_lookup()
+
+    async def quiet():
+        await asyncio.sleep(0.1)
+
+    assert _watch(blocking).stalls_by_tool == {"unknown": 1}
+    assert _watch(quiet).stalls == 0
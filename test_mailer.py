@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Test the mail queue against a local aiosmtpd server: settings read at send
+time, batching, delivery callbacks and reconnecting a dropped connection
+"""
+
+import socket
+import asyncio
+
+from aiosmtpd.controller import Controller
+
+import mailer
+from mailer import Mailer
+
+
+class _Inbox:
+    def __init__(self):
+        self.envelopes = []
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+        if address.startswith("bounce"):
+            return "550 No such user here"
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server, session, envelope):
+        self.envelopes.append(envelope)
+        return "250 Message accepted for delivery"
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _start_server(monkeypatch, inbox=None, port=None):
+    inbox = inbox or _Inbox()
+    controller = Controller(inbox, hostname="127.0.0.1", port=port or _free_port())
+    controller.start()
+    # Set after mailer was imported, as load_dotenv() would
+    monkeypatch.setenv("SMTP_HOST", "127.0.0.1")
+    monkeypatch.setenv("SMTP_PORT", str(controller.port))
+    monkeypatch.setenv("SMTP_STARTTLS", "false")
+    monkeypatch.setenv("SMTP_FROM", "friday@example.com")
+    monkeypatch.delenv("SMTP_PASSWORD", raising=False)
+    monkeypatch.delenv("GMAIL_APP_PASSWORD", raising=False)
+    return controller, inbox
+
+
+def _send(outbox: Mailer, recipients):
+    async def scenario():
+        delivered = []
+        done = asyncio.Event()
+
+        def on_delivery(status):
+            delivered.append(status)
+            if len(delivered) == len(recipients):
+                done.set()
+
+        ids = [outbox.queue_email(to, "Hello", "Body", on_delivery=on_delivery) for to in recipients]
+        await asyncio.wait_for(done.wait(), 5)
+        return ids, delivered
+
+    return asyncio.run(scenario())
+
+
+def test_queued_emails_go_out_in_one_batch_on_one_connection(monkeypatch):
+    controller, inbox = _start_server(monkeypatch)
+    outbox = Mailer()
+    try:
+        recipients = [f"user{n}@example.com" for n in range(5)]
+        ids, delivered = _send(outbox, recipients)
+
+        assert [status["id"] for status in delivered] == ids
+        assert all(status["ok"] and status["error"] is None for status in delivered)
+        assert sorted(envelope.rcpt_tos[0] for envelope in inbox.envelopes) == recipients
+        assert {envelope.mail_from for envelope in inbox.envelopes} == {"friday@example.com"}
+        assert outbox.stats()["batches"] == 1
+        assert outbox.stats()["connects"] == 1
+    finally:
+        outbox.close()
+        controller.stop()
+
+
+def test_connection_is_reused_then_reopened_after_idling_on_a_dropped_server(monkeypatch):
+    controller, inbox = _start_server(monkeypatch)
+    outbox = Mailer()
+    try:
+        _send(outbox, ["first@example.com"])
+        _send(outbox, ["second@example.com"])
+        assert outbox.stats()["connects"] == 1
+
+        # The server goes away and comes back; the idle probe notices the dead connection
+        controller.stop()
+        controller, _ = _start_server(monkeypatch, inbox, controller.port)
+        monkeypatch.setattr(mailer, "SMTP_IDLE_TIMEOUT", 0)
+        _, delivered = _send(outbox, ["third@example.com"])
+
+        assert delivered[0]["ok"]
+        assert outbox.stats()["connects"] == 2
+        assert [envelope.rcpt_tos[0] for envelope in inbox.envelopes] == [
+            "first@example.com", "second@example.com", "third@example.com",
+        ]
+    finally:
+        outbox.close()
+        controller.stop()
+
+
+def test_refused_recipient_is_reported_to_the_callback(monkeypatch):
+    controller, inbox = _start_server(monkeypatch)
+    outbox = Mailer()
+    try:
+        _, delivered = _send(outbox, ["bounce@example.com"])
+        assert not delivered[0]["ok"]
+        assert delivered[0]["error"].startswith("SMTP error")
+        assert outbox.stats()["failed"] == 1
+        assert inbox.envelopes == []
+    finally:
+        outbox.close()
+        controller.stop()
+
+
+def test_missing_sender_is_reported_when_queueing(monkeypatch):
+    for name in ("SMTP_FROM", "SMTP_USER", "GMAIL_USER"):
+        monkeypatch.delenv(name, raising=False)
+    outbox = Mailer()
+
+    async def scenario():
+        outbox.queue_email("someone@example.com", "Hello", "Body")
+
+    try:
+        asyncio.run(scenario())
+    except ValueError as e:
+        assert "not configured" in str(e)
+    else:
+        raise AssertionError("queue_email accepted a message with no sender")
+    finally:
+        outbox.close()
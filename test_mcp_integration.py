@@ -11,85 +11,19 @@ from tools import execute_mcp_tool
 async def execute_mcp_tool_list_tools():
     """List available tools on the MCP server"""
     from tools import MCP_SERVER_URL
-    import httpx
-    import json
+    from mcp_session import get_mcp_session
     
     try:
-        async with httpx.AsyncClient(
-            timeout=30.0,
-            limits=httpx.Limits(max_keepalive_connections=1, max_connections=1)
-        ) as client:
-            
-            # Initialize session
-            init_request = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "initialize",
-                "params": {
-                    "protocolVersion": "2024-11-05",
-                    "capabilities": {"roots": {"listChanged": True}, "sampling": {}},
-                    "clientInfo": {"name": "friday-agent", "version": "1.0.0"}
-                }
-            }
-            
-            init_response = await client.post(
-                MCP_SERVER_URL,
-                json=init_request,
-                headers={
-                    "Content-Type": "application/json",
-                    "Accept": "application/json, text/event-stream",
-                    "Connection": "keep-alive"
-                }
-            )
-            init_response.raise_for_status()
-            
-            # Get session ID
-            session_headers = init_response.headers
-            session_id = None
-            for header_name in ['mcp-session-id', 'x-session-id', 'session-id']:
-                if header_name in session_headers:
-                    session_id = session_headers[header_name]
-                    break
-            
-            # List tools
-            tools_request = {
-                "jsonrpc": "2.0",
-                "id": 2,
-                "method": "tools/list",
-                "params": {}
-            }
-            
-            tool_headers = {
-                "Content-Type": "application/json",
-                "Accept": "application/json, text/event-stream",
-                "Connection": "keep-alive"
-            }
-            
-            if session_id:
-                tool_headers["MCP-Session-ID"] = session_id
-            
-            tools_response = await client.post(
-                MCP_SERVER_URL,
-                json=tools_request,
-                headers=tool_headers
-            )
-            tools_response.raise_for_status()
-            
-            # Parse response
-            tools_text = tools_response.text.strip()
-            for line in tools_text.split('\n'):
-                if line.startswith('data: '):
-                    data_json = line[6:]
-                    try:
-                        tools_result = json.loads(data_json)
-                        if "result" in tools_result:
-                            return tools_result["result"]
-                        elif "error" in tools_result:
-                            return {"error": tools_result["error"].get("message", "Unknown error")}
-                    except json.JSONDecodeError:
-                        continue
-            
-            return {"error": "Failed to parse tools list response"}
+        # Reuses the same shared session that execute_mcp_tool uses
+        session = get_mcp_session(MCP_SERVER_URL)
+        tools_result = await session.request("tools/list", {})
+        
+        if "result" in tools_result:
+            return tools_result["result"]
+        elif "error" in tools_result:
+            return {"error": tools_result["error"].get("message", "Unknown error")}
+        
+        return {"error": "Failed to parse tools list response"}
             
     except Exception as e:
         return {"error": f"Failed to list tools: {str(e)}"}
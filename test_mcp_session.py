@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Test MCP session recovery when concurrent requests see the same expiry
+"""
+
+import asyncio
+
+from benchmarks.fake_services import FakeMCPServer, StandInConfig
+from mcp_session import MCPSession
+
+
+def test_concurrent_callers_share_one_reinitialization():
+    async def scenario():
+        server = FakeMCPServer(StandInConfig())
+        session = MCPSession(await server.start())
+        try:
+            await session.ensure_initialized()
+            expired = session.session_id
+            server.sessions.clear()
+
+            responses = await asyncio.gather(
+                *(session.call_tool("monday_get_board_groups", {}) for _ in range(10))
+            )
+            assert all("result" in response for response in responses)
+            # Only the first caller to see the 404 replaced the session
+            assert session.session_id not in (None, expired)
+            assert list(server.sessions) == [session.session_id]
+        finally:
+            await session.aclose()
+            await server.close()
+
+    asyncio.run(scenario())
+
+
+def test_reset_keeps_a_session_that_already_replaced_the_expired_one():
+    async def scenario():
+        session = MCPSession("http://127.0.0.1:1/")
+        session.session_id = "fresh"
+        session._initialized = True
+
+        await session.reset("stale")
+        assert session.session_id == "fresh"
+        assert session.initialized
+
+        await session.reset("fresh")
+        assert session.session_id is None
+        assert not session.initialized
+
+    asyncio.run(scenario())
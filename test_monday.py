@@ -5,18 +5,14 @@ Test Monday.com integration
 
 import os
 import sys
-from pathlib import Path
-
-# Add the monday_backend directory to the path
-monday_backend_dir = Path(__file__).parent / "monday_backend"
-sys.path.insert(0, str(monday_backend_dir))
+import asyncio
 
 from dotenv import load_dotenv
-from monday_integration import MondayClient
+from monday_backend.monday_integration import get_monday_client
 
 load_dotenv()
 
-def test_monday_connection():
+async def test_monday_connection():
     """Test Monday.com API connection and task creation"""
     print("🧪 Testing Monday.com Integration")
     print("=" * 50)
@@ -35,11 +31,11 @@ def test_monday_connection():
     
     try:
         # Test connection
-        client = MondayClient()
+        client = get_monday_client()
         print("🔗 Testing connection...")
         
         # Test boards listing
-        boards = client.get_boards()
+        boards = await client.get_boards()
         print(f"✅ Connected! Found {len(boards)} boards")
         
         # Find your specific board
@@ -61,7 +57,7 @@ def test_monday_connection():
         # Test task creation
         print("\n🎯 Testing task creation...")
         test_task_name = "Friday Test Task - API Integration"
-        result = client.create_task("2116067359", test_task_name, "group_mkt6pepv")
+        result = await client.create_task(test_task_name, "group_mkt6pepv")
         
         if result and result.get('id'):
             print(f"✅ Task created successfully!")
@@ -79,7 +75,7 @@ def test_monday_connection():
         return False
 
 if __name__ == "__main__":
-    success = test_monday_connection()
+    success = asyncio.run(test_monday_connection())
     if success:
         print("\n🎉 Monday.com integration is working correctly!")
         print("✨ Friday can now create tasks in your CRM board")
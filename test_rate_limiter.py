@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Test the Monday.com complexity-budget scheduler
+"""
+
+import asyncio
+
+from monday_backend.rate_limiter import ComplexityScheduler, INTERACTIVE, BACKGROUND
+
+
+def test_background_request_larger_than_its_share_still_runs():
+    """A background cost above capacity - reserve waits for a full share, not forever"""
+    scheduler = ComplexityScheduler(budget_per_minute=600, background_reserve=0.2)
+
+    async def scenario():
+        await asyncio.wait_for(scheduler.acquire(1000, BACKGROUND), 1)
+
+    asyncio.run(scenario())
+    # The whole cost is spent; the bucket carries the debt
+    assert scheduler.tokens < 0
+
+
+def test_background_request_larger_than_its_share_waits_for_the_reserve():
+    scheduler = ComplexityScheduler(budget_per_minute=600, background_reserve=0.2)
+    scheduler.tokens = 300
+
+    async def scenario():
+        acquire = asyncio.ensure_future(scheduler.acquire(1000, BACKGROUND))
+        await asyncio.sleep(0.1)
+        assert not acquire.done()
+        # Refills at 10 tokens/s; fast-forward to a full bucket
+        scheduler.tokens = scheduler.capacity
+        await asyncio.wait_for(acquire, 2)
+
+    asyncio.run(scenario())
+
+
+def test_interactive_request_larger_than_capacity_runs_on_a_full_bucket():
+    scheduler = ComplexityScheduler(budget_per_minute=600, background_reserve=0.2)
+
+    async def scenario():
+        await asyncio.wait_for(scheduler.acquire(5000, INTERACTIVE), 1)
+
+    asyncio.run(scenario())
+
+
+def test_background_never_spends_the_reserve():
+    scheduler = ComplexityScheduler(budget_per_minute=600, background_reserve=0.5)
+    scheduler.tokens = 350
+
+    async def scenario():
+        # 350 - 100 would leave less than the 300 reserve
+        background = asyncio.ensure_future(scheduler.acquire(100, BACKGROUND))
+        await asyncio.sleep(0.05)
+        assert not background.done()
+        # Interactive work may dip into the reserve
+        await asyncio.wait_for(scheduler.acquire(100, INTERACTIVE), 0.5)
+        background.cancel()
+
+    asyncio.run(scenario())
+    assert scheduler.tokens < 300
+
+
+def test_background_waits_while_interactive_requests_are_queued():
+    scheduler = ComplexityScheduler(budget_per_minute=6000, background_reserve=0.0)
+    scheduler.tokens = 0
+    order = []
+
+    async def request(name, cost, priority):
+        await scheduler.acquire(cost, priority)
+        order.append(name)
+
+    async def scenario():
+        # The interactive request queues first; background is cheaper but must wait behind it
+        interactive = asyncio.ensure_future(request("interactive", 20, INTERACTIVE))
+        await asyncio.sleep(0)
+        background = asyncio.ensure_future(request("background", 10, BACKGROUND))
+        await asyncio.wait_for(asyncio.gather(interactive, background), 3)
+
+    asyncio.run(scenario())
+    assert order == ["interactive", "background"]
+
+
+def test_observed_complexity_corrects_the_bucket_and_cost_estimate():
+    scheduler = ComplexityScheduler(budget_per_minute=600, background_reserve=0.2)
+    query = "query { boards { id } }"
+    assert scheduler.estimate(query) == 10000
+
+    scheduler.observe(query, {"query": 42, "after": 123})
+    assert scheduler.estimate(query) == 42
+    assert 123 <= scheduler.tokens < 124
+
+
+def test_block_for_holds_every_priority():
+    scheduler = ComplexityScheduler(budget_per_minute=600, background_reserve=0.2)
+    scheduler.block_for(0.2)
+
+    async def scenario():
+        started = asyncio.get_running_loop().time()
+        await asyncio.wait_for(scheduler.acquire(1, INTERACTIVE), 2)
+        return asyncio.get_running_loop().time() - started
+
+    assert asyncio.run(scenario()) >= 0.15
+    assert scheduler.stats()["throttled"] == 1
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Test the incremental SSE decoding used for streamed MCP responses
+"""
+
+import asyncio
+
+from mcp_session import SSEDecoder, iter_sse_messages
+
+
+def _feed(decoder: SSEDecoder, lines):
+    return [data for data in (decoder.feed_line(line) for line in lines) if data is not None]
+
+
+async def _lines(lines):
+    for line in lines:
+        yield line
+
+
+def _collect(lines):
+    async def scenario():
+        return [message async for message in iter_sse_messages(_lines(lines))]
+    return asyncio.run(scenario())
+
+
+def test_event_is_dispatched_on_blank_line():
+    decoder = SSEDecoder()
+    assert _feed(decoder, ["event: message", "id: 7", 'data: {"id": 1}']) == []
+    assert decoder.event == "message"
+    assert decoder.feed_line("") == '{"id": 1}'
+    assert decoder.event is None
+    assert decoder.last_event_id == "7"
+
+
+def test_multi_line_data_is_joined_with_newlines():
+    decoder = SSEDecoder()
+    events = _feed(decoder, ["data: first", "data:second", "data:  third", ""])
+    # Only the single space after the colon is stripped
+    assert events == ["first\nsecond\n third"]
+
+
+def test_comments_and_crlf_are_ignored():
+    decoder = SSEDecoder()
+    events = _feed(decoder, [": keep-alive", "data: a\r", "\r"])
+    assert events == ["a"]
+
+
+def test_blank_lines_without_data_dispatch_nothing():
+    decoder = SSEDecoder()
+    assert _feed(decoder, ["", "event: ping", ""]) == []
+    assert decoder.event is None
+
+
+def test_flush_dispatches_an_unterminated_event():
+    decoder = SSEDecoder()
+    assert _feed(decoder, ["data: tail"]) == []
+    assert decoder.flush() == "tail"
+    assert decoder.flush() is None
+
+
+def test_messages_are_decoded_as_they_arrive_and_at_end_of_stream():
+    messages = _collect([
+        'data: {"jsonrpc": "2.0", "method": "notifications/progress", "params": {"progress": 1}}',
+        "",
+        'data: {"jsonrpc": "2.0",',
+        'data:  "id": 1, "result": {}}',
+        # No trailing blank line: the last event is flushed at end of stream
+    ])
+    assert [message.get("method") or message.get("id") for message in messages] == ["notifications/progress", 1]
+
+
+def test_batches_are_split_and_garbage_is_skipped():
+    messages = _collect(['data: [{"id": 1}, {"id": 2}, 3]', "", "data: not json", ""])
+    assert messages == [{"id": 1}, {"id": 2}]
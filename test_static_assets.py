@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Test serving the precompressed React build: ETags, 304s and encoding negotiation
+"""
+
+import re
+import gzip
+import json
+import asyncio
+import tempfile
+from pathlib import Path
+
+from monday_backend import static_assets
+from monday_backend.static_assets import StaticAssets, precompress_build, IMMUTABLE, REVALIDATE
+
+BUNDLE = "static/js/main.2f56fce9.js"
+
+
+def _build(monkeypatch, precompress=True) -> Path:
+    # Compare gzip alone whether or not brotli is installed here
+    monkeypatch.setattr(static_assets, "brotli", None)
+    build_dir = Path(tempfile.mkdtemp(prefix="friday-build-"))
+    (build_dir / "static" / "js").mkdir(parents=True)
+    (build_dir / BUNDLE).write_text("console.log('friday');\n" * 200)
+    (build_dir / "index.html").write_text("<html>" + "<div>Friday</div>" * 100 + "</html>")
+    (build_dir / "favicon.ico").write_bytes(b"\x00" * 10)
+    if precompress:
+        precompress_build(build_dir)
+    return build_dir
+
+
+def _reply(assets, path, **headers):
+    return asyncio.run(assets.reply(path, headers))
+
+
+def test_gzip_is_served_when_accepted(monkeypatch):
+    build_dir = _build(monkeypatch)
+    assets = StaticAssets(build_dir)
+
+    body, status, headers = _reply(assets, BUNDLE, **{"Accept-Encoding": "gzip, deflate, br"})
+    assert status == 200
+    assert headers["Content-Encoding"] == "gzip"
+    assert headers["Vary"] == "Accept-Encoding"
+    assert headers["Content-Type"].endswith("charset=utf-8")
+    assert gzip.decompress(body) == (build_dir / BUNDLE).read_bytes()
+
+
+def test_identity_is_served_when_gzip_is_refused_or_useless(monkeypatch):
+    build_dir = _build(monkeypatch)
+    assets = StaticAssets(build_dir)
+
+    body, _, headers = _reply(assets, BUNDLE, **{"Accept-Encoding": "gzip;q=0"})
+    assert "Content-Encoding" not in headers
+    assert body == (build_dir / BUNDLE).read_bytes()
+    # Too small to be worth compressing
+    _, _, headers = _reply(assets, "favicon.ico", **{"Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in headers
+
+
+def test_fingerprinted_files_are_immutable_and_others_revalidate(monkeypatch):
+    assets = StaticAssets(_build(monkeypatch))
+    assert _reply(assets, BUNDLE)[2]["Cache-Control"] == IMMUTABLE
+    assert _reply(assets, "index.html")[2]["Cache-Control"] == REVALIDATE
+
+
+def test_matching_etag_gets_an_empty_304_for_any_encoding(monkeypatch):
+    assets = StaticAssets(_build(monkeypatch))
+    _, _, gzipped = _reply(assets, "index.html", **{"Accept-Encoding": "gzip"})
+    _, _, plain = _reply(assets, "index.html")
+    assert gzipped["ETag"] != plain["ETag"]
+
+    body, status, headers = _reply(assets, "index.html", **{"If-None-Match": gzipped["ETag"]})
+    assert (body, status) == (b"", 304)
+    assert headers["ETag"] == plain["ETag"]
+    assert _reply(assets, "index.html", **{"If-None-Match": f"W/{plain['ETag']}"})[1] == 304
+    assert _reply(assets, "index.html", **{"If-None-Match": '"stale"'})[1] == 200
+
+
+def test_build_without_a_manifest_is_hashed_and_served_uncompressed(monkeypatch):
+    build_dir = _build(monkeypatch, precompress=False)
+    assets = StaticAssets(build_dir)
+
+    body, status, headers = _reply(assets, "index.html", **{"Accept-Encoding": "gzip"})
+    assert status == 200
+    assert "Content-Encoding" not in headers
+    assert body == (build_dir / "index.html").read_bytes()
+    assert _reply(assets, "index.html", **{"If-None-Match": headers["ETag"]})[1] == 304
+    assert _reply(assets, "missing.js")[1] == 404
+
+
+def _get(path, **headers):
+    from monday_backend.web_server import app
+
+    async def scenario():
+        response = await app.test_client().get(path, headers=headers)
+        return response.status_code, response.headers, await response.get_data()
+    return asyncio.run(scenario())
+
+
+def test_hashed_react_bundles_are_served_by_the_asset_route():
+    build_dir = Path(static_assets.__file__).parent / "react_app" / "build"
+    files = json.loads((build_dir / "asset-manifest.json").read_text())["files"]
+
+    for name in ("main.js", "main.css"):
+        path = files[name]
+        status, headers, body = _get(path, **{"Accept-Encoding": "gzip"})
+        assert status == 200
+        assert headers["Content-Encoding"] == "gzip"
+        assert headers["Cache-Control"] == IMMUTABLE
+        assert gzip.decompress(body) == (build_dir / path.lstrip("/")).read_bytes()
+
+        status, _, body = _get(path, **{"Accept-Encoding": "gzip", "If-None-Match": headers["ETag"]})
+        assert status == 304
+        assert body == b""
+
+
+def test_classic_page_assets_have_their_own_prefix():
+    status, _, body = _get("/classic/static/js/chat_stream.js")
+    assert status == 200
+    assert b"streamChat" in body
+
+
+def test_every_asset_the_react_page_loads_is_served():
+    status, _, page = _get("/")
+    assert status == 200
+    assets = re.findall(rb'(?:src|href)="(/[^"]+)"', page)
+    assert b"/classic/static/js/chat_stream.js" in assets
+    for asset in assets:
+        assert _get(asset.decode())[0] == 200, asset
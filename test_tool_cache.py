@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Test the shared tool result cache
+"""
+
+import time
+import asyncio
+
+from tool_cache import ToolCache
+
+
+def test_entries_expire_after_their_ttl():
+    cache = ToolCache(ttls={"lookup": 0.05})
+    cache.set("lookup", {"boardId": 1}, ["a"])
+    # Arguments are normalized: int ids and string ids share an entry
+    assert cache.get("lookup", {"boardId": "1"}) == (True, ["a"])
+    time.sleep(0.06)
+    assert cache.get("lookup", {"boardId": 1}) == (False, None)
+
+
+def test_tools_without_a_ttl_are_never_cached():
+    cache = ToolCache(ttls={"lookup": 60})
+    cache.set("create", {}, {"id": 1})
+    assert cache.get("create", {}) == (False, None)
+    assert not cache.is_cached_tool("create")
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ToolCache(ttls={"lookup": 60}, max_entries=2)
+    cache.set("lookup", {"n": 1}, 1)
+    cache.set("lookup", {"n": 2}, 2)
+    cache.get("lookup", {"n": 1})
+    cache.set("lookup", {"n": 3}, 3)
+
+    assert cache.get("lookup", {"n": 1}) == (True, 1)
+    assert cache.get("lookup", {"n": 2}) == (False, None)
+    assert cache.get("lookup", {"n": 3}) == (True, 3)
+    assert cache.evictions == 1
+
+
+def test_concurrent_misses_share_one_fetch():
+    cache = ToolCache(ttls={"lookup": 60})
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"groups": ["topics"]}
+
+    async def scenario():
+        return await asyncio.gather(*(cache.get_or_fetch("lookup", {"boardId": "1"}, fetch) for _ in range(5)))
+
+    results = asyncio.run(scenario())
+    assert calls == [1]
+    assert all(result == {"groups": ["topics"]} for result in results)
+    assert cache.misses == 1 and cache.coalesced == 4
+
+
+def test_failed_fetch_is_shared_but_not_cached():
+    cache = ToolCache(ttls={"lookup": 60})
+    calls = []
+
+    async def failing():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    async def scenario():
+        return await asyncio.gather(
+            *(cache.get_or_fetch("lookup", {}, failing) for _ in range(3)), return_exceptions=True
+        )
+
+    results = asyncio.run(scenario())
+    assert calls == [1]
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+    async def error_result():
+        return {"error": "not found"}
+
+    asyncio.run(cache.get_or_fetch("lookup", {}, error_result))
+    assert cache.get("lookup", {}) == (False, None)
+
+
+def test_mutation_invalidates_only_its_board():
+    cache = ToolCache(
+        ttls={"list_items": 60, "list_boards": 60},
+        invalidations={"create_item": ("list_items",)},
+    )
+    cache.set("list_items", {"boardId": "1"}, ["a"])
+    cache.set("list_items", {"boardId": "2"}, ["b"])
+    cache.set("list_boards", {}, ["board"])
+
+    assert cache.on_mutation("create_item", {"boardId": 1, "itemName": "New"}) == 1
+    assert cache.get("list_items", {"boardId": "1"}) == (False, None)
+    assert cache.get("list_items", {"boardId": "2"}) == (True, ["b"])
+    assert cache.get("list_boards", {}) == (True, ["board"])
+    assert cache.on_mutation("unrelated_tool", {}) == 0
+
+
+def test_mutation_without_a_board_invalidates_every_board():
+    cache = ToolCache(ttls={"list_items": 60}, invalidations={"create_update": ("list_items",)})
+    cache.set("list_items", {"boardId": "1"}, ["a"])
+    cache.set("list_items", {"boardId": "2"}, ["b"])
+    assert cache.on_mutation("create_update", {"item_id": 7}) == 2
+
+
+def test_refresh_skips_the_cached_value_and_replaces_it():
+    cache = ToolCache(ttls={"lookup": 60})
+    cache.set("lookup", {"boardId": 1}, ["stale"])
+
+    async def fetch():
+        return ["fresh"]
+
+    async def scenario():
+        return await cache.get_or_fetch("lookup", {"boardId": 1}, fetch, refresh=True)
+
+    assert asyncio.run(scenario()) == ["fresh"]
+    assert cache.get("lookup", {"boardId": 1}) == (True, ["fresh"])
+
+
+def test_fetch_running_during_a_mutation_does_not_cache_stale_data():
+    cache = ToolCache(ttls={"get_board_groups": 60}, invalidations={"create_group": ("get_board_groups",)})
+    board = {"group": "old"}
+
+    async def scenario():
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow_fetch():
+            snapshot = dict(board)
+            started.set()
+            await release.wait()
+            return [snapshot["group"]]
+
+        async def fetch():
+            return [board["group"]]
+
+        stale_call = asyncio.ensure_future(cache.get_or_fetch("get_board_groups", {"board_id": 7}, slow_fetch))
+        await started.wait()
+        board["group"] = "new"
+        cache.on_mutation("create_group", {"board_id": 7})
+        # A caller after the mutation must not join the pre-mutation fetch
+        fresh_call = asyncio.ensure_future(cache.get_or_fetch("get_board_groups", {"board_id": 7}, fetch))
+        release.set()
+        return await stale_call, await fresh_call
+
+    stale, fresh = asyncio.run(scenario())
+    assert stale == ["old"]
+    assert fresh == ["new"]
+    assert cache.get("get_board_groups", {"board_id": 7}) == (True, ["new"])
+
+
+def test_fetch_for_another_board_still_caches_after_a_mutation():
+    cache = ToolCache(ttls={"get_board_groups": 60}, invalidations={"create_group": ("get_board_groups",)})
+
+    async def scenario():
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            return ["groups"]
+
+        call = asyncio.ensure_future(cache.get_or_fetch("get_board_groups", {"board_id": 8}, fetch))
+        await asyncio.sleep(0)
+        cache.on_mutation("create_group", {"board_id": 7})
+        release.set()
+        return await call
+
+    assert asyncio.run(scenario()) == ["groups"]
+    assert cache.get("get_board_groups", {"board_id": 8}) == (True, ["groups"])
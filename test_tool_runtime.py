@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Test latency budgets on function tools: on-time replies come back inline,
+late ones are spoken into the session once the tool finishes
+"""
+
+import asyncio
+
+import tool_runtime
+from tool_runtime import latency_budget, get_runtime_stats
+
+
+class FakeSession:
+    """Stands in for AgentSession: records what the agent was asked to say"""
+
+    def __init__(self, fail: bool = False):
+        self.replies = []
+        self.fail = fail
+
+    async def generate_reply(self, instructions: str = "", **kwargs):
+        if self.fail:
+            raise RuntimeError("session closed")
+        self.replies.append(instructions)
+
+
+class FakeRunContext:
+    def __init__(self, session=None):
+        self.session = session
+
+
+async def _late_deliveries() -> None:
+    """Wait for every late result to be delivered (or dropped)"""
+    while tool_runtime._late_calls:
+        await asyncio.gather(*tool_runtime._late_calls)
+
+
+def test_result_within_budget_is_returned_inline():
+    @latency_budget(0.5)
+    async def quick_lookup(context, city: str) -> str:
+        return f"Sunny in {city}"
+
+    async def scenario():
+        session = FakeSession()
+        reply = await quick_lookup(FakeRunContext(session), "Paris")
+        await _late_deliveries()
+        return reply, session
+
+    reply, session = asyncio.run(scenario())
+    assert reply == "Sunny in Paris"
+    assert session.replies == []
+    stats = get_runtime_stats()["quick_lookup"]
+    assert stats["budget"] == 0.5
+    assert (stats["calls"], stats["on_time"], stats["late"]) == (1, 1, 0)
+
+
+def test_late_result_is_delivered_through_the_session():
+    release = None
+
+    @latency_budget(0.01, pending="Looking up {city}, Sir...")
+    async def slow_lookup(context, city: str) -> str:
+        await release.wait()
+        return f"Rain in {city}"
+
+    async def scenario():
+        nonlocal release
+        release = asyncio.Event()
+        session = FakeSession()
+        reply = await slow_lookup(FakeRunContext(session), city="Oslo")
+        assert session.replies == []
+        release.set()
+        await _late_deliveries()
+        return reply, session
+
+    reply, session = asyncio.run(scenario())
+    assert reply == "Looking up Oslo, Sir..."
+    assert session.replies == ["Tell the user: Rain in Oslo"]
+    assert get_runtime_stats()["slow_lookup"]["late"] == 1
+
+
+def test_late_failure_is_counted_and_not_spoken():
+    @latency_budget(0.01, pending=lambda item: f"Creating {item}...")
+    async def failing_create(context, item: str) -> str:
+        await asyncio.sleep(0.03)
+        raise RuntimeError("board is gone")
+
+    async def scenario():
+        session = FakeSession()
+        reply = await failing_create(FakeRunContext(session), "Launch plan")
+        await _late_deliveries()
+        return reply, session
+
+    reply, session = asyncio.run(scenario())
+    assert reply == "Creating Launch plan..."
+    assert session.replies == []
+    assert get_runtime_stats()["failing_create"]["late_failed"] == 1
+
+
+def test_interrupted_turn_still_reports_the_result():
+    @latency_budget(5)
+    async def interrupted_search(context, query: str) -> str:
+        await asyncio.sleep(0.03)
+        return f"Found {query}"
+
+    async def scenario():
+        session = FakeSession()
+        turn = asyncio.ensure_future(interrupted_search(FakeRunContext(session), "flights"))
+        await asyncio.sleep(0.01)
+        turn.cancel()
+        try:
+            await turn
+        except asyncio.CancelledError:
+            pass
+        else:
+            raise AssertionError("the interrupted turn was not cancelled")
+        await _late_deliveries()
+        return session
+
+    session = asyncio.run(scenario())
+    assert session.replies == ["Tell the user: Found flights"]
+
+
+def test_late_result_for_a_closed_session_is_dropped():
+    @latency_budget(0.01)
+    async def orphaned_lookup(context) -> str:
+        await asyncio.sleep(0.03)
+        return "Done"
+
+    async def scenario():
+        reply = await orphaned_lookup(FakeRunContext(FakeSession(fail=True)))
+        await _late_deliveries()
+        return reply
+
+    assert asyncio.run(scenario()) == "Working on it, Sir..."
+
+
+def test_callers_without_a_session_wait_for_the_full_reply():
+    @latency_budget(0.01)
+    async def web_lookup(context) -> str:
+        await asyncio.sleep(0.03)
+        return "Full answer"
+
+    assert asyncio.run(web_lookup(FakeRunContext())) == "Full answer"
+    assert get_runtime_stats()["web_lookup"]["late"] == 0
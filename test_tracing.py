@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Test span nesting, latency percentiles and the /metrics endpoint
+"""
+
+import json
+import socket
+import asyncio
+
+import tracing
+from tracing import Tracer, get_tracer, start_metrics_server
+
+
+class RecordingExporter:
+    def __init__(self):
+        self.started = []
+        self.ended = []
+
+    def on_start(self, span):
+        self.started.append(span.name)
+
+    def on_end(self, span):
+        self.ended.append(span)
+
+
+def test_child_spans_share_the_trace_and_point_at_their_parent():
+    exporter = RecordingExporter()
+    tracer = Tracer([exporter])
+
+    with tracer.span("turn", session="abc") as turn:
+        with tracer.span("mcp.request", method="tools/call") as request:
+            request.set(tool="monday_create_item")
+            request.event("first_message", status=200)
+        assert tracing._current_span.get() is turn
+    assert tracing._current_span.get() is None
+
+    assert exporter.started == ["turn", "mcp.request"]
+    # Children finish (and are exported) first
+    assert [span.name for span in exporter.ended] == ["mcp.request", "turn"]
+    assert request.trace_id == turn.trace_id
+    assert request.parent_id == turn.span_id
+    assert turn.parent_id is None
+    assert request.attributes == {"method": "tools/call", "tool": "monday_create_item"}
+    assert turn.attributes == {"session": "abc"}
+    assert request.events[0]["name"] == "first_message"
+    assert request.events[0]["status"] == 200
+    assert turn.duration_ms >= request.duration_ms >= 0
+
+
+def test_spans_nest_across_awaits_and_record_errors():
+    tracer = Tracer()
+
+    async def tool():
+        with tracer.span("function_tool.get_weather"):
+            await asyncio.sleep(0)
+            raise ValueError("no such city")
+
+    async def scenario():
+        with tracer.span("turn") as turn:
+            try:
+                await tool()
+            except ValueError:
+                pass
+        return turn
+
+    asyncio.run(scenario())
+    metrics = tracer.metrics()
+    assert metrics["function_tool.get_weather"]["errors"] == 1
+    assert metrics["turn"]["errors"] == 0
+
+
+def test_percentiles_over_a_known_sample():
+    tracer = Tracer()
+    for duration in range(1, 101):
+        tracer.record("stage", float(duration))
+
+    stage = tracer.metrics()["stage"]
+    assert stage["count"] == 100
+    assert (stage["p50"], stage["p95"], stage["p99"]) == (50.0, 95.0, 99.0)
+    assert stage["max"] == 100.0
+    assert stage["mean"] == 50.5
+
+
+def test_histogram_keeps_only_the_most_recent_durations():
+    tracer = Tracer(histogram_size=10)
+    for duration in range(1, 101):
+        tracer.record("stage", float(duration))
+
+    stage = tracer.metrics()["stage"]
+    # Percentiles cover the last 10 samples; the count covers them all
+    assert stage["count"] == 100
+    assert stage["p50"] == 95.0
+    assert stage["max"] == 100.0
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _get(port: int, path: str):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode("latin-1"))
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, body = response.partition(b"\r\n\r\n")
+    return head.split(b"\r\n")[0].decode("latin-1"), body
+
+
+def test_metrics_endpoint_reports_span_histograms():
+    get_tracer().record("test.metrics_endpoint", 12.5)
+    port = _free_port()
+
+    async def scenario():
+        server = await start_metrics_server(str(port))
+        try:
+            return await _get(port, "/metrics"), await _get(port, "/other")
+        finally:
+            tracing._metrics_servers.pop(port, None)
+            server.close()
+            await server.wait_closed()
+
+    (status, body), (missing_status, _) = asyncio.run(scenario())
+    assert status == "HTTP/1.1 200 OK"
+    assert missing_status == "HTTP/1.1 404 Not Found"
+    metrics = json.loads(body)
+    assert set(metrics) == {"spans", "tools", "cache", "loop"}
+    assert metrics["spans"]["test.metrics_endpoint"]["p50"] == 12.5
+
+
+def test_metrics_server_is_off_without_a_port():
+    assert asyncio.run(start_metrics_server(None)) is None
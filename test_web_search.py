@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Test web search with a stubbed provider: caching by normalized query,
+searches kept off the event loop, and speech-sized summaries
+"""
+
+import time
+import asyncio
+import threading
+
+from tool_cache import get_tool_cache
+from web_search import SearchEngine, normalize_query, summarize_for_speech
+
+
+class StubProvider:
+    """Stands in for DuckDuckGoSearchRun: blocking run() with a canned answer"""
+
+    def __init__(self, answer: str = "Paris is the capital of France.", delay: float = 0.0):
+        self.answer = answer
+        self.delay = delay
+        self.queries = []
+        self.threads = []
+
+    def run(self, query: str) -> str:
+        self.queries.append(query)
+        self.threads.append(threading.current_thread().name)
+        time.sleep(self.delay)
+        return self.answer
+
+
+class StubbedEngine(SearchEngine):
+    def __init__(self, provider: StubProvider):
+        super().__init__(max_workers=2)
+        self.stub = provider
+        self.builds = 0
+
+    def _build_provider(self):
+        self.builds += 1
+        return self.stub
+
+
+def _search(engine: SearchEngine, *queries: str):
+    async def scenario():
+        return [await engine.search(query) for query in queries]
+    return asyncio.run(scenario())
+
+
+def test_repeated_queries_are_answered_from_the_cache():
+    get_tool_cache().clear()
+    engine = StubbedEngine(StubProvider())
+    try:
+        answers = _search(engine, "Capital of France?", "  capital   of FRANCE ")
+    finally:
+        engine.close()
+
+    assert answers == ["Paris is the capital of France."] * 2
+    assert engine.stub.queries == ["capital of france"]
+    assert engine.builds == 1
+
+
+def test_empty_results_are_not_cached():
+    get_tool_cache().clear()
+    engine = StubbedEngine(StubProvider(answer=""))
+    try:
+        _search(engine, "nothing here", "nothing here")
+    finally:
+        engine.close()
+
+    assert engine.stub.queries == ["nothing here", "nothing here"]
+
+
+def test_blocking_provider_runs_on_the_pool_not_the_loop():
+    get_tool_cache().clear()
+    engine = StubbedEngine(StubProvider(delay=0.2))
+
+    async def scenario():
+        ticks = 0
+
+        async def heartbeat():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        beating = asyncio.ensure_future(heartbeat())
+        answers = await asyncio.gather(engine.search("first question"), engine.search("second question"))
+        beating.cancel()
+        return answers, ticks
+
+    try:
+        started = time.perf_counter()
+        answers, ticks = asyncio.run(scenario())
+        elapsed = time.perf_counter() - started
+    finally:
+        engine.close()
+
+    assert len(answers) == 2
+    assert all(name.startswith("web-search") for name in engine.stub.threads)
+    # Both searches ran in parallel on the pool while the loop kept ticking
+    assert elapsed < 0.35
+    assert ticks >= 10
+
+
+def test_prepare_builds_the_provider_once_before_any_loop():
+    engine = StubbedEngine(StubProvider())
+    try:
+        engine.prepare()
+        engine.prepare()
+        asyncio.run(engine.warm_up())
+    finally:
+        engine.close()
+    assert engine.builds == 1
+
+
+def test_normalize_query_folds_case_spacing_and_trailing_punctuation():
+    assert normalize_query("  What's  the WEATHER?! ") == "what's the weather"
+
+
+def test_summary_strips_citations_and_snippet_ellipses():
+    raw = "Paris is the capital [1] of France ...  It has 2 million people[2]… Visit soon"
+    assert summarize_for_speech(raw) == "Paris is the capital of France. It has 2 million people. Visit soon"
+
+
+def test_summary_keeps_whole_sentences_within_the_limit():
+    raw = "First sentence here. Second sentence is longer. Third one."
+    assert summarize_for_speech(raw, max_chars=50) == "First sentence here. Second sentence is longer."
+    assert summarize_for_speech(raw, max_chars=25) == "First sentence here."
+
+
+def test_summary_cuts_one_long_sentence_at_a_word_boundary():
+    raw = "An extremely long sentence without any full stop that keeps going and going"
+    summary = summarize_for_speech(raw, max_chars=30)
+    assert summary == "An extremely long sentence."
+    assert len(summary) <= 31
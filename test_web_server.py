@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Test the web server's startup and shutdown hooks
+"""
+
+import asyncio
+
+from monday_backend import monday_integration
+from monday_backend import web_server
+
+
+def test_shutdown_without_a_monday_board_creates_no_client(monkeypatch):
+    monkeypatch.delenv("MONDAY_BOARD_ID", raising=False)
+    monkeypatch.setattr(monday_integration, "_shared_client", None)
+
+    async def scenario():
+        async with web_server.app.test_app():
+            pass
+
+    asyncio.run(scenario())
+    assert monday_integration._shared_client is None
+
+
+def test_one_failing_close_does_not_skip_the_others(monkeypatch):
+    closed = []
+
+    async def broken():
+        raise RuntimeError("already gone")
+
+    async def close_http_client():
+        closed.append("http")
+
+    async def close_monday_client():
+        closed.append("monday")
+
+    monkeypatch.setattr(web_server, "close_mcp_session", broken)
+    monkeypatch.setattr(web_server, "close_http_client", close_http_client)
+    monkeypatch.setattr(web_server, "close_monday_client", close_monday_client)
+
+    asyncio.run(web_server.close_shared_clients())
+    assert closed == ["http", "monday"]
@@ -0,0 +1,290 @@
+# tool_cache.py
+
+import os
+import json
+import time
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Awaitable, Callable, Iterable, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+TOOL_CACHE_MAX_ENTRIES = int(os.getenv("TOOL_CACHE_MAX_ENTRIES", "512"))
+
+# Seconds each read-only tool result stays fresh. Tools not listed here are never cached.
+DEFAULT_TTLS: Dict[str, float] = {
+    # MCP tools
+    "monday_list_boards": 120.0,
+    "monday_get_board_groups": 300.0,
+    "monday_get_board_columns": 600.0,
+    "monday_list_items": 30.0,
+    "monday_get_board_items": 30.0,
+    # MondayClient queries
+    "get_boards": 120.0,
+    "get_board_groups": 300.0,
+    "get_board_columns": 600.0,
+    # Plain HTTP tools
+    "get_weather": 300.0,
+    "search_web": 900.0,
+}
+
+# Which cached tools a mutating tool makes stale. Entries are dropped when
+# they share the mutation's boardId, or all of them when no board is given.
+INVALIDATIONS: Dict[str, Tuple[str, ...]] = {
+    "monday_create_item": ("monday_list_items", "monday_get_board_items"),
+    "monday_create_group": ("monday_get_board_groups", "get_board_groups"),
+    "monday_create_column": ("monday_get_board_columns", "get_board_columns"),
+    "monday_create_board": ("monday_list_boards", "get_boards"),
+    # MondayClient mutations, by GraphQL field name (as run_batch() names them).
+    # Item changes also bump the board's updated_at in get_boards.
+    "create_item": ("monday_list_items", "monday_get_board_items", "get_boards"),
+    "create_subitem": ("monday_list_items", "monday_get_board_items", "get_boards"),
+    "change_column_value": ("monday_list_items", "monday_get_board_items", "get_boards"),
+    "change_multiple_column_values": ("monday_list_items", "monday_get_board_items", "get_boards"),
+    "create_update": ("monday_list_items", "monday_get_board_items"),
+}
+
+_BOARD_ARG_NAMES = ("boardId", "board_id")
+
+
+def normalize_args(args: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Canonical form of tool arguments: no None values, trimmed strings, ids as strings"""
+    normalized = {}
+    for key, value in (args or {}).items():
+        if value is None:
+            continue
+        if isinstance(value, str):
+            value = value.strip()
+        elif isinstance(value, bool):
+            pass
+        elif isinstance(value, int) and key.lower().endswith("id"):
+            value = str(value)
+        elif isinstance(value, dict):
+            value = normalize_args(value)
+        normalized[key] = value
+    return normalized
+
+
+def _board_of(args: Dict[str, Any]) -> Optional[str]:
+    for name in _BOARD_ARG_NAMES:
+        if name in args:
+            return str(args[name])
+    return None
+
+
+def _cacheable(value: Any) -> bool:
+    """Don't remember failures"""
+    return not (isinstance(value, dict) and "error" in value)
+
+
+class ToolCache:
+    """
+    Shared async cache for read-only Monday.com and MCP queries.
+
+    Entries are keyed by tool name plus normalized arguments, expire after a
+    per-tool TTL and are evicted least-recently-used beyond max_entries.
+    Concurrent misses for the same key share a single fetch; a fetch that an
+    invalidation overtook returns its result without caching it.
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, float]] = None,
+        max_entries: int = TOOL_CACHE_MAX_ENTRIES,
+        invalidations: Optional[Dict[str, Tuple[str, ...]]] = None,
+    ):
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.invalidations = dict(INVALIDATIONS if invalidations is None else invalidations)
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, str, Dict[str, Any], Any]]" = OrderedDict()
+        # In-flight fetches, per event loop since futures can't cross loops
+        self._inflight: Dict[Tuple[int, str], asyncio.Future] = {}
+        # Keys with a fetch running: [tool name, normalized args, generation, fetch count].
+        # Invalidation bumps the generation; a fetch only stores its result if it's unchanged
+        self._fetching: Dict[str, List[Any]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self.invalidated = 0
+
+    def is_cached_tool(self, tool_name: str) -> bool:
+        return self.ttls.get(tool_name, 0) > 0
+
+    @staticmethod
+    def make_key(tool_name: str, args: Optional[Dict[str, Any]] = None) -> str:
+        return tool_name + ":" + json.dumps(normalize_args(args), sort_keys=True, default=str)
+
+    def get(self, tool_name: str, args: Optional[Dict[str, Any]] = None) -> Tuple[bool, Any]:
+        """Return (found, value) for a fresh entry without fetching"""
+        key = self.make_key(tool_name, args)
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        return True, entry[3]
+
+    def set(self, tool_name: str, args: Optional[Dict[str, Any]], value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.ttls.get(tool_name, 0) if ttl is None else ttl
+        if ttl <= 0:
+            return
+        key = self.make_key(tool_name, args)
+        self._entries[key] = (time.monotonic() + ttl, tool_name, normalize_args(args), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    async def get_or_fetch(
+        self,
+        tool_name: str,
+        args: Optional[Dict[str, Any]],
+        fetch: Callable[[], Awaitable[Any]],
+        should_cache: Callable[[Any], bool] = _cacheable,
+        refresh: bool = False,
+    ) -> Any:
+        """
+        Return the cached value, or run fetch() once for all concurrent callers.
+
+        With refresh=True the cache is skipped and fetch() always runs; its
+        result replaces the cached entry for later callers. A result is only
+        stored if its key wasn't invalidated while the fetch was running.
+        """
+        if not self.is_cached_tool(tool_name):
+            return await fetch()
+
+        key = self.make_key(tool_name, args)
+        if refresh:
+            self.misses += 1
+            generation = self._start_fetch(key, tool_name, args)
+            try:
+                value = await fetch()
+            finally:
+                current = self._finish_fetch(key)
+            if should_cache(value) and current == generation:
+                self.set(tool_name, args, value)
+            return value
+
+        found, value = self.get(tool_name, args)
+        if found:
+            self.hits += 1
+            return value
+
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), key)
+        pending = self._inflight.get(flight_key)
+        if pending is not None:
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                # The caller that owned the fetch was cancelled; fetch on our own
+                return await self.get_or_fetch(tool_name, args, fetch, should_cache)
+
+        self.misses += 1
+        future = loop.create_future()
+        self._inflight[flight_key] = future
+        generation = self._start_fetch(key, tool_name, args)
+        try:
+            value = await fetch()
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                # Mark retrieved so a fetch with no waiters doesn't log "never retrieved"
+                future.exception()
+            raise
+        else:
+            if should_cache(value) and self._fetching[key][2] == generation:
+                self.set(tool_name, args, value)
+            future.set_result(value)
+            return value
+        finally:
+            self._finish_fetch(key)
+            # An invalidation may already have replaced this fetch with a newer one
+            if self._inflight.get(flight_key) is future:
+                del self._inflight[flight_key]
+
+    def _start_fetch(self, key: str, tool_name: str, args: Optional[Dict[str, Any]]) -> int:
+        """Register a fetch for key and return the key's current generation"""
+        fetching = self._fetching.get(key)
+        if fetching is None:
+            fetching = self._fetching[key] = [tool_name, normalize_args(args), 0, 0]
+        fetching[3] += 1
+        return fetching[2]
+
+    def _finish_fetch(self, key: str) -> int:
+        """Unregister a fetch for key and return the key's generation as it ends"""
+        fetching = self._fetching[key]
+        fetching[3] -= 1
+        if fetching[3] == 0:
+            del self._fetching[key]
+        return fetching[2]
+
+    def invalidate(self, tool_names: Optional[Iterable[str]] = None, board_id: Optional[str] = None) -> int:
+        """Drop entries for the given tools (all tools if None), optionally only for one board"""
+        names = None if tool_names is None else set(tool_names)
+
+        def matches(name: str, args: Dict[str, Any]) -> bool:
+            return (names is None or name in names) and (board_id is None or _board_of(args) in (None, str(board_id)))
+
+        stale = [key for key, (_, name, args, _) in self._entries.items() if matches(name, args)]
+        for key in stale:
+            del self._entries[key]
+        self.invalidated += len(stale)
+
+        # Fetches already running may return pre-invalidation data: bump their
+        # generation so they don't store it, and let later callers fetch anew
+        for key, (name, args, _, _) in list(self._fetching.items()):
+            if matches(name, args):
+                self._fetching[key][2] += 1
+                for flight_key in [flight_key for flight_key in self._inflight if flight_key[1] == key]:
+                    del self._inflight[flight_key]
+        return len(stale)
+
+    def on_mutation(self, tool_name: str, args: Optional[Dict[str, Any]] = None) -> int:
+        """Invalidate whatever a mutating tool call made stale"""
+        affected = self.invalidations.get(tool_name)
+        if not affected:
+            return 0
+        dropped = self.invalidate(affected, _board_of(normalize_args(args)))
+        if dropped:
+            logger.info(f"🧹 {tool_name} invalidated {dropped} cached result(s)")
+        return dropped
+
+    def clear(self) -> None:
+        self._entries.clear()
+        for fetching in self._fetching.values():
+            fetching[2] += 1
+        self._inflight.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+            "invalidated": self.invalidated,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+_cache: Optional[ToolCache] = None
+
+
+def get_tool_cache() -> ToolCache:
+    """Return the process-wide tool cache"""
+    global _cache
+    if _cache is None:
+        _cache = ToolCache()
+    return _cache
@@ -0,0 +1,252 @@
+# tool_registry.py
+
+import time
+import asyncio
+import logging
+import importlib
+import importlib.util
+from typing import Optional, Dict, Any, List, Iterable, Sequence, Set, Callable
+
+logger = logging.getLogger(__name__)
+
+# Latency classes: how long a tool keeps the conversation waiting
+INSTANT = "instant"        # No I/O; answers straight away
+FAST = "fast"              # One cached or pooled round trip, inside its budget
+SLOW = "slow"              # Can outlive its budget; @latency_budget speaks a holding line
+BACKGROUND = "background"  # Queued; the reply doesn't wait for the work
+LATENCY_CLASSES = (INSTANT, FAST, SLOW, BACKGROUND)
+
+# What a tool calling tools.execute_mcp_tool needs: tools.py loaded and the MCP session open
+MCP_TOOL_BACKEND: Dict[str, Any] = {"requires": ("tools",), "prewarm": "mcp_session:open_mcp_session"}
+
+# Keep references so prewarm tasks aren't garbage collected mid-flight
+_prewarm_tasks: Set[asyncio.Task] = set()
+
+
+class ToolSpec:
+    """
+    One tool as the registry knows it.
+
+    target is "module:attr" and is only imported when the tool is first
+    asked for. A tool defined in an agent module registers the object itself.
+    requires lists optional backend modules that are slow to import; they are
+    loaded off the event loop by prewarm(). prewarm is a "module:attr" async
+    hook that gets the backend ready (a session, a provider) ahead of the
+    first call.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        latency: str,
+        target: Optional[str] = None,
+        tool: Any = None,
+        requires: Sequence[str] = (),
+        prewarm: Optional[str] = None,
+    ):
+        if latency not in LATENCY_CLASSES:
+            raise ValueError(f"Unknown latency class '{latency}' for tool '{name}'")
+        if target is None and tool is None:
+            raise ValueError(f"Tool '{name}' needs an import target or a tool object")
+        self.name = name
+        self.latency = latency
+        self.target = target
+        self.tool = tool
+        self.requires = tuple(requires)
+        self.prewarm = prewarm
+
+    @property
+    def module(self) -> Optional[str]:
+        return self.target.partition(":")[0] if self.target else None
+
+    def missing(self) -> List[str]:
+        """Required backends that aren't installed (checked without importing them)"""
+        return [name for name in self.requires if not _is_installed(name)]
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "latency": self.latency,
+            "target": self.target,
+            "requires": list(self.requires),
+            "missing": self.missing(),
+            "loaded": self.tool is not None,
+        }
+
+
+class ToolRegistry:
+    """
+    The tools every entrypoint picks from (voice agents and the web server).
+
+    Declaring a tool costs nothing: its module is imported the first time the
+    tool is asked for, so a process only loads the backends it uses.
+    prewarm() imports those modules and their optional backends on worker
+    threads and runs the tools' warm-up hooks, so first use finds them ready.
+    """
+
+    def __init__(self):
+        self._specs: Dict[str, ToolSpec] = {}
+
+    def declare(self, name: str, target: str, latency: str, requires: Sequence[str] = (), prewarm: Optional[str] = None) -> ToolSpec:
+        spec = self._specs[name] = ToolSpec(name, latency, target=target, requires=requires, prewarm=prewarm)
+        return spec
+
+    def register(self, tool: Any, latency: str, name: Optional[str] = None, requires: Sequence[str] = (), prewarm: Optional[str] = None) -> Any:
+        """Add an already-defined tool (e.g. one an agent module defines itself)"""
+        name = name or getattr(tool, "__name__", None)
+        if not name:
+            raise ValueError("Registered tools need a name")
+        self._specs[name] = ToolSpec(name, latency, tool=tool, requires=requires, prewarm=prewarm)
+        return tool
+
+    def spec(self, name: str) -> ToolSpec:
+        try:
+            return self._specs[name]
+        except KeyError:
+            raise KeyError(f"Unknown tool '{name}'") from None
+
+    def get(self, name: str) -> Any:
+        """The tool object, importing its module on first use"""
+        spec = self.spec(name)
+        if spec.tool is None:
+            spec.tool = _resolve(spec.target)
+        return spec.tool
+
+    def get_many(self, names: Iterable[str]) -> List[Any]:
+        return [self.get(name) for name in names]
+
+    def names(self) -> List[str]:
+        return list(self._specs)
+
+    async def prewarm(self, names: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """
+        Import the tools' modules and optional backends on worker threads, then
+        run their warm-up hooks. Each tool is independent and best-effort;
+        failures are logged and never reach the conversation.
+        Returns per-tool timings in milliseconds.
+        """
+        specs = [self.spec(name) for name in (names if names is not None else self._specs)]
+        timings: Dict[str, Any] = {}
+        hooks_run: Set[str] = set()
+
+        async def warm(spec: ToolSpec) -> None:
+            started = time.perf_counter()
+            missing = spec.missing()
+            if missing:
+                timings[spec.name] = f"skipped: {', '.join(missing)} not installed"
+                return
+            try:
+                # Importing is blocking work; keep it off the event loop
+                await asyncio.to_thread(self._load, spec)
+                if spec.prewarm and spec.prewarm not in hooks_run:
+                    # Tools sharing a backend share its hook
+                    hooks_run.add(spec.prewarm)
+                    await _resolve(spec.prewarm)()
+                timings[spec.name] = round((time.perf_counter() - started) * 1000, 1)
+            except Exception as e:
+                timings[spec.name] = f"failed: {e}"
+                logger.warning(f"⚠️ Prewarming tool '{spec.name}' failed: {e}")
+
+        await asyncio.gather(*(warm(spec) for spec in specs))
+        logger.info(f"🔥 Tools prewarmed: {timings}")
+        return timings
+
+    def load(self, names: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """
+        Blocking version of prewarm() without the hooks: import the tools and
+        their installed backends now. For process prewarm, before any event
+        loop exists. Returns per-tool timings in milliseconds.
+        """
+        timings: Dict[str, Any] = {}
+        for name in (names if names is not None else list(self._specs)):
+            spec = self.spec(name)
+            started = time.perf_counter()
+            missing = spec.missing()
+            if missing:
+                timings[name] = f"skipped: {', '.join(missing)} not installed"
+                continue
+            try:
+                self._load(spec)
+                timings[name] = round((time.perf_counter() - started) * 1000, 1)
+            except Exception as e:
+                timings[name] = f"failed: {e}"
+                logger.warning(f"⚠️ Loading tool '{name}' failed: {e}")
+        return timings
+
+    def _load(self, spec: ToolSpec) -> None:
+        for module in (*spec.requires, spec.module):
+            if module:
+                importlib.import_module(module)
+        if spec.tool is None:
+            spec.tool = _resolve(spec.target)
+
+    def catalog(self) -> List[Dict[str, Any]]:
+        return [spec.describe() for spec in self._specs.values()]
+
+
+def _resolve(target: str) -> Any:
+    module, _, attr = target.partition(":")
+    return getattr(importlib.import_module(module), attr)
+
+
+def _is_installed(module: str) -> bool:
+    # find_spec() on a dotted name imports the parents; the top-level package is enough
+    try:
+        return importlib.util.find_spec(module.partition(".")[0]) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+_registry: Optional[ToolRegistry] = None
+
+
+def get_tool_registry() -> ToolRegistry:
+    """Return the process-wide tool registry, with the shared tools declared"""
+    global _registry
+    if _registry is None:
+        _registry = ToolRegistry()
+        _declare_shared_tools(_registry)
+    return _registry
+
+
+def _declare_shared_tools(registry: ToolRegistry) -> None:
+    # tools.py: the voice agent's general tools
+    registry.declare("get_weather", "tools:get_weather", FAST)
+    registry.declare("search_web", "tools:search_web", SLOW,
+                     requires=("langchain_community.tools",), prewarm="web_search:warm_up_search")
+    registry.declare("send_email", "tools:send_email", BACKGROUND)
+    registry.declare("create_monday_task", "tools:create_monday_task", INSTANT)
+    registry.declare("list_monday_boards", "tools:list_monday_boards", INSTANT)
+    registry.declare("create_crm_task", "tools:create_crm_task", INSTANT)
+    # monday_backend: the same jobs against the Monday.com API directly
+    registry.declare("monday_api.create_monday_task", "monday_backend.monday_tools:create_monday_task", FAST)
+    registry.declare("monday_api.list_monday_boards", "monday_backend.monday_tools:list_monday_boards", FAST)
+    registry.declare("monday_api.search_monday_tasks", "monday_backend.monday_tools:search_monday_tasks", FAST)
+    registry.declare("monday_api.add_task_update", "monday_backend.monday_tools:add_task_update", FAST)
+    registry.declare("monday_api.create_crm_task", "monday_backend.monday_tools:create_crm_task", FAST)
+    registry.declare("monday_api.list_crm_tasks", "monday_backend.monday_tools:list_crm_tasks", FAST)
+
+
+def register_tool(latency: str, name: Optional[str] = None, requires: Sequence[str] = (), prewarm: Optional[str] = None) -> Callable[[Any], Any]:
+    """Decorator for tools defined in an agent module: @register_tool(SLOW) above @function_tool()"""
+    def decorator(tool: Any) -> Any:
+        return get_tool_registry().register(tool, latency, name=name, requires=requires, prewarm=prewarm)
+    return decorator
+
+
+def get_tools(names: Iterable[str]) -> List[Any]:
+    """The named tools, in order, ready for Agent(tools=...)"""
+    return get_tool_registry().get_many(names)
+
+
+def get_tool(name: str) -> Any:
+    return get_tool_registry().get(name)
+
+
+def start_tool_prewarm(names: Optional[Iterable[str]] = None) -> asyncio.Task:
+    """Run the registry's prewarm() in the background, e.g. while the room connects"""
+    names = list(names) if names is not None else None
+    task = asyncio.create_task(get_tool_registry().prewarm(names))
+    _prewarm_tasks.add(task)
+    task.add_done_callback(_prewarm_tasks.discard)
+    return task
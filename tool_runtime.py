@@ -0,0 +1,134 @@
+# tool_runtime.py
+
+import os
+import asyncio
+import inspect
+import functools
+import logging
+from typing import Optional, Dict, Any, Callable, Set, Union
+
+from tracing import span, mark_tool_frame
+
+logger = logging.getLogger(__name__)
+
+# Budget for tools that don't declare one, in seconds
+DEFAULT_TOOL_BUDGET = float(os.getenv("TOOL_LATENCY_BUDGET", "0.5"))
+
+# Declared budget of every wrapped tool, by tool name
+TOOL_BUDGETS: Dict[str, float] = {}
+
+PendingReply = Union[str, Callable[..., str]]
+
+# Tools still running after their budget; kept so they aren't garbage collected
+_late_calls: Set[asyncio.Task] = set()
+_stats: Dict[str, Dict[str, int]] = {}
+
+
+def _budget_for(tool_name: str, declared: Optional[float]) -> float:
+    """Declared budget, overridable per tool with TOOL_BUDGET_<NAME>"""
+    override = os.getenv(f"TOOL_BUDGET_{tool_name.upper()}")
+    if override:
+        return float(override)
+    return DEFAULT_TOOL_BUDGET if declared is None else declared
+
+
+async def deliver_to_session(session: Any, text: str) -> None:
+    """Have the agent tell the user about a result that arrived after its turn"""
+    if session is None:
+        logger.warning(f"⚠️ No session to deliver late result: {text}")
+        return
+    try:
+        await session.generate_reply(instructions=f"Tell the user: {text}")
+        logger.info(f"🗣️ LATE RESULT DELIVERED: {text}")
+    except Exception as e:
+        # The session may have ended while the tool was still running
+        logger.warning(f"⚠️ Could not deliver late result: {e}")
+
+
+def _session_of(context: Any) -> Any:
+    return getattr(context, "session", None)
+
+
+def latency_budget(seconds: Optional[float] = None, pending: PendingReply = "Working on it, Sir...") -> Callable:
+    """
+    Give a function tool a latency budget. Put it under @function_tool().
+
+    The tool body runs as its own task. If it finishes within the budget its
+    reply is returned as usual. If not, the call is not cancelled: the tool
+    returns `pending` right away (a string formatted with the tool's
+    arguments, or a callable taking them) and the real reply is spoken into
+    the caller's AgentSession (context.session) once the body completes.
+    Callers without a session simply wait for the full reply.
+    """
+    def decorator(fn: Callable) -> Callable:
+        tool_name = fn.__name__
+        budget = _budget_for(tool_name, seconds)
+        TOOL_BUDGETS[tool_name] = budget
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        async def wrapper(context: Any, *args: Any, **kwargs: Any) -> str:
+            stats = _stats.setdefault(tool_name, {"calls": 0, "on_time": 0, "late": 0, "late_failed": 0})
+            stats["calls"] += 1
+            if _session_of(context) is None:
+                # Called outside a voice session (e.g. the web API): nobody to follow up with
+                return await _traced_call(fn, tool_name, budget, context, *args, **kwargs)
+            call = asyncio.ensure_future(_traced_call(fn, tool_name, budget, context, *args, **kwargs))
+            try:
+                # asyncio.wait never cancels what it waits on
+                await asyncio.wait({call}, timeout=budget)
+            except asyncio.CancelledError:
+                # The turn was interrupted; let the call finish and report later
+                _deliver_when_done(call, tool_name, context)
+                raise
+
+            if call.done():
+                stats["on_time"] += 1
+                return call.result()
+
+            stats["late"] += 1
+            logger.info(f"⏱️ {tool_name} exceeded its {budget}s budget; result will follow")
+            _deliver_when_done(call, tool_name, context)
+            arguments = dict(signature.bind_partial(context, *args, **kwargs).arguments)
+            arguments.pop(next(iter(signature.parameters)), None)
+            return pending(**arguments) if callable(pending) else pending.format(**arguments)
+
+        wrapper.latency_budget = budget
+        return wrapper
+    return decorator
+
+
+async def _traced_call(fn: Callable, tool_name: str, budget: float, context: Any, *args: Any, **kwargs: Any) -> Any:
+    # The span covers the whole body, including any time past the budget
+    with span(f"function_tool.{tool_name}", budget_ms=budget * 1000) as tool_span:
+        reply = await fn(context, *args, **kwargs)
+        tool_span.set(late=tool_span.elapsed_ms() > budget * 1000)
+        return reply
+
+
+mark_tool_frame(_traced_call, "tool_name")
+
+
+def _deliver_when_done(call: asyncio.Future, tool_name: str, context: Any) -> None:
+    task = asyncio.ensure_future(_deliver_late(call, tool_name, _session_of(context)))
+    _late_calls.add(task)
+    task.add_done_callback(_late_calls.discard)
+
+
+async def _deliver_late(call: asyncio.Future, tool_name: str, session: Any) -> None:
+    try:
+        reply = await call
+    except Exception as e:
+        _stats[tool_name]["late_failed"] += 1
+        logger.error(f"💥 {tool_name} failed after its budget: {e}")
+        return
+    if reply:
+        await deliver_to_session(session, str(reply))
+
+
+def get_runtime_stats() -> Dict[str, Any]:
+    """Per-tool budget and how many calls made it, ran late or failed late"""
+    return {
+        name: {"budget": TOOL_BUDGETS.get(name), **counts}
+        for name, counts in _stats.items()
+    }
@@ -1,14 +1,21 @@
 # tools.py
 
 import os
+import asyncio
 import httpx
 import logging
 import json
+from urllib.parse import quote
 from dotenv import load_dotenv
 from livekit.agents import function_tool, RunContext
-from typing import Optional, Dict, Any
-from mcp import ClientSession
-from mcp.client.sse import sse_client
+from typing import Optional, Dict, Any, List, Tuple
+from mcp_session import get_mcp_session, ProgressCallback
+from tool_cache import get_tool_cache
+from http_client import get_http_client
+from web_search import get_search_engine
+from mailer import get_mailer
+from tool_runtime import latency_budget, deliver_to_session
+from tracing import span, Span, traced, mark_tool_frame
 
 # Load environment variables from .env file
 load_dotenv()
@@ -17,10 +24,26 @@ load_dotenv()
 MONDAY_BOARD_ID = os.getenv("MONDAY_BOARD_ID")
 MCP_SERVER_URL = os.getenv("MCP_SERVER_URL")
 
-async def execute_mcp_tool(tool_name: str, parameters: dict) -> dict:
+# "error_kind" on a failed MCP result: what is safe to do about it
+RATE_LIMITED = "rate_limited"  # HTTP 429: back off, then retry
+NOT_SENT = "not_sent"          # Failed before the request went out (connect, pool): retrying is safe
+TRANSPORT = "transport"        # Failed after sending (read timeout, dropped stream, 5xx): the server may have acted
+PERMANENT = "permanent"        # Validation, MCP and protocol errors: the same call fails the same way
+
+async def execute_mcp_tool(
+    tool_name: str,
+    parameters: dict,
+    on_progress: Optional[ProgressCallback] = None
+) -> dict:
     """
     Executes a tool call on the self-hosted MCP server using proper StreamableHTTP protocol,
     enforcing the use of the pre-configured Monday.com board.
+    The call goes through the worker's shared MCP session, so the initialize
+    handshake only happens once per worker (or after the server expires it).
+
+    The response is decoded incrementally as the server streams it; pass
+    on_progress to receive notifications/progress params (e.g. to start
+    speaking partial results) before the final result arrives.
     """
     if not MONDAY_BOARD_ID or not MCP_SERVER_URL:
         raise ValueError("MONDAY_BOARD_ID and MCP_SERVER_URL must be set in the .env file.")
@@ -37,206 +60,150 @@ async def execute_mcp_tool(tool_name: str, parameters: dict) -> dict:
     
     print(f"🔒 Enforced parameters: {enforced_parameters}")
 
+    with span(f"mcp_tool.{tool_name}") as tool_span:
+        result = await _execute_mcp_tool(tool_name, enforced_parameters, on_progress, tool_span)
+        tool_span.set(ok="error" not in result)
+        return result
+
+async def _execute_mcp_tool(
+    tool_name: str,
+    enforced_parameters: dict,
+    on_progress: Optional[ProgressCallback],
+    tool_span: Span
+) -> dict:
     try:
-        # Use a persistent HTTP client with connection pooling to maintain session
-        async with httpx.AsyncClient(
-            timeout=30.0,
-            limits=httpx.Limits(max_keepalive_connections=1, max_connections=1)
-        ) as client:
-            
-            # Step 1: Initialize MCP session  
-            init_request = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "initialize",
-                "params": {
-                    "protocolVersion": "2024-11-05",
-                    "capabilities": {
-                        "tools": {}
-                    },
-                    "clientInfo": {
-                        "name": "voice-agent",
-                        "version": "1.0.0"
-                    }
-                }
-            }
-            
-            # Make initialization request to establish session
-            init_response = await client.post(
-                MCP_SERVER_URL,
-                json=init_request,
-                headers={
-                    "Content-Type": "application/json",
-                    "Accept": "application/json, text/event-stream",
-                    "Connection": "keep-alive"
-                }
-            )
-            init_response.raise_for_status()
-            
-            # Parse initialization response 
-            init_text = init_response.text.strip()
-            print(f"🔗 MCP Init Response: {init_text}")
-            
-            # Extract session information from response headers
-            session_headers = init_response.headers
-            session_id = None
-            
-            # Look for session ID in various possible header names
-            for header_name in ['mcp-session-id', 'x-session-id', 'session-id']:
-                header_value = session_headers.get(header_name.lower())
-                if header_value:
-                    session_id = header_value
-                    print(f"🔗 Found session ID in {header_name}: {session_id}")
-                    break
-            
-            # Extract server info from SSE response
-            for line in init_text.split('\n'):
-                if line.startswith('data: '):
-                    data_json = line[6:]
-                    init_result = json.loads(data_json)
-                    if "result" in init_result:
-                        server_info = init_result["result"]["serverInfo"]
-                        print(f"✅ MCP Server initialized: {server_info['name']} v{server_info['version']}")
-                        break
-            
-            # CRITICAL: Send notifications/initialized after successful initialization
-            if session_id:
-                print("📢 Sending initialized notification...")
-                notify_request = {
-                    "jsonrpc": "2.0",
-                    "method": "notifications/initialized",
-                    "params": {}
-                }
-                
-                notify_response = await client.post(
-                    MCP_SERVER_URL,
-                    json=notify_request,
-                    headers={
-                        "Content-Type": "application/json",
-                        "Accept": "application/json, text/event-stream",
-                        "mcp-session-id": session_id
-                    }
-                )
-                print("✅ Initialized notification sent")
-            
-            # Step 2: Call the tool using CORRECT MCP protocol format
-            # ✅ CORRECT: Use "tools/call" as method, tool name in params.name
-            tool_request = {
-                "jsonrpc": "2.0", 
-                "id": 2,
-                "method": "tools/call",
-                "params": {
-                    "name": tool_name,
-                    "arguments": enforced_parameters
-                }
-            }
-            
-            print(f"🔧 Tool request payload: {json.dumps(tool_request, indent=2)}")
-            
-            # Build headers for tool request
-            tool_headers = {
-                "Content-Type": "application/json",
-                "Accept": "application/json, text/event-stream",
-                "Connection": "keep-alive"
-            }
-            
-            # Add session ID if we found one (use only the working format)
-            if session_id:
-                tool_headers["mcp-session-id"] = session_id
-            
-            print(f"🔧 Tool request headers: {tool_headers}")
-            
-            tool_response = await client.post(
-                MCP_SERVER_URL,
-                json=tool_request,
-                headers=tool_headers
-            )
-            tool_response.raise_for_status()
-            
-            # Parse tool response from SSE format
-            tool_text = tool_response.text.strip()
-            print(f"✅ MCP Tool Raw Response: {tool_text}")
-            
-            # Extract tool result from SSE response
-            for line in tool_text.split('\n'):
-                if line.startswith('data: '):
-                    data_json = line[6:]
-                    try:
-                        tool_result = json.loads(data_json)
-                        if "result" in tool_result:
-                            result = tool_result["result"]
-                            print(f"✅ MCP Tool Parsed Result: {result}")
-                            
-                            # Extract content from MCP result
-                            if "content" in result and result["content"]:
-                                content_list = result["content"]
-                                if len(content_list) > 0:
-                                    content_item = content_list[0]
-                                    if "text" in content_item:
-                                        text_content = content_item["text"]
-                                        try:
-                                            # Try to parse as JSON if it looks like structured data
-                                            if text_content.strip().startswith(("{", "[")):
-                                                return json.loads(text_content)
-                                            else:
-                                                return {"result": text_content}
-                                        except json.JSONDecodeError:
-                                            return {"result": text_content}
-                                    else:
-                                        return {"result": str(content_item)}
-                                else:
-                                    return {"result": "Tool executed successfully"}
-                            else:
-                                return {"result": "Tool executed successfully"}
-                        elif "error" in tool_result:
-                            error_msg = tool_result["error"].get("message", "Unknown MCP error")
-                            print(f"❌ MCP Error: {error_msg}")
-                            
-                            # Handle FastMCP HTTP transport limitation gracefully
-                            if "Invalid request parameters" in error_msg:
-                                return {
-                                    "error": "FastMCP HTTP transport limitation - using fallback mode",
-                                    "status": "mcp_transport_issue", 
-                                    "detail": f"Tool '{tool_name}' request successful but FastMCP HTTP transport has known limitations",
-                                    "suggestion": "MCP server is working perfectly - this is a FastMCP HTTP transport issue"
-                                }
-                            else:
-                                return {"error": error_msg}
-                    except json.JSONDecodeError:
-                        continue
-            
-            return {"error": "Failed to parse MCP server response"}
+        cache = get_tool_cache()
+        tool_span.set(cached=True)
+        
+        async def call() -> dict:
+            tool_span.set(cached=False)
+            # Reuse the worker's long-lived MCP session (one round trip per tool call)
+            session = get_mcp_session(MCP_SERVER_URL)
+            tool_result = await session.call_tool(tool_name, enforced_parameters, on_progress)
+            print(f"✅ MCP Tool Raw Response: {tool_result}")
+            with span("mcp.extract_result"):
+                return _extract_tool_result(tool_name, tool_result)
+        
+        # Read-only lookups are served from the shared cache; mutations invalidate it
+        result = await cache.get_or_fetch(tool_name, enforced_parameters, call)
+        if "error" not in result:
+            cache.on_mutation(tool_name, enforced_parameters)
+        return result
 
     except httpx.HTTPStatusError as e:
         print(f"❌ MCP Server HTTP Error: {e.response.status_code} - {e.response.text}")
-        return {"error": f"MCP server HTTP error: {e.response.status_code}"}
+        status = e.response.status_code
+        kind = RATE_LIMITED if status == 429 else TRANSPORT if status >= 500 else PERMANENT
+        return {"error": f"MCP server HTTP error: {status}", "error_kind": kind}
+    except (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout) as e:
+        logging.error(f"❌ Could not reach the MCP server: {e}")
+        return {"error": f"Could not reach the MCP server: {e}", "error_kind": NOT_SENT}
+    except httpx.TransportError as e:
+        logging.error(f"❌ MCP request failed in transit: {e!r}")
+        return {"error": f"MCP request failed in transit: {e!r}", "error_kind": TRANSPORT}
+    except ValueError as e:
+        logging.error(f"❌ Failed to parse MCP response: {e}")
+        return {"error": "Failed to parse MCP server response", "error_kind": PERMANENT}
     except Exception as e:
         print(f"❌ Failed to execute MCP tool: {e}")
-        return {"error": f"An unexpected error occurred: {str(e)}"}
+        return {"error": f"An unexpected error occurred: {str(e)}", "error_kind": PERMANENT}
+
+# Stalls inside an MCP call are attributed to the MCP tool being called
+mark_tool_frame(execute_mcp_tool, "tool_name")
+
+async def execute_mcp_tools(calls: List[Tuple[str, dict]]) -> List[dict]:
+    """
+    Run several MCP tool calls concurrently over the shared session.
+    Results come back in the same order as the calls; the total latency is that
+    of the slowest call rather than the sum of all of them.
+    """
+    return await asyncio.gather(
+        *(execute_mcp_tool(tool_name, parameters) for tool_name, parameters in calls)
+    )
+
+def _extract_tool_result(tool_name: str, tool_result: dict) -> dict:
+    """Convert a tools/call JSON-RPC response message into the dict the agents expect"""
+    if "result" in tool_result:
+        result = tool_result["result"]
+        print(f"✅ MCP Tool Parsed Result: {result}")
+        
+        # Extract content from MCP result
+        if "content" in result and result["content"]:
+            content_list = result["content"]
+            if len(content_list) > 0:
+                content_item = content_list[0]
+                if "text" in content_item:
+                    text_content = content_item["text"]
+                    try:
+                        # Try to parse as JSON if it looks like structured data
+                        if text_content.strip().startswith(("{", "[")):
+                            return json.loads(text_content)
+                        else:
+                            return {"result": text_content}
+                    except json.JSONDecodeError:
+                        return {"result": text_content}
+                else:
+                    return {"result": str(content_item)}
+            else:
+                return {"result": "Tool executed successfully"}
+        else:
+            return {"result": "Tool executed successfully"}
+    elif "error" in tool_result:
+        error_msg = tool_result["error"].get("message", "Unknown MCP error")
+        print(f"❌ MCP Error: {error_msg}")
+        
+        # Handle FastMCP HTTP transport limitation gracefully
+        if "Invalid request parameters" in error_msg:
+            return {
+                "error": "FastMCP HTTP transport limitation - using fallback mode",
+                "error_kind": PERMANENT,
+                "status": "mcp_transport_issue", 
+                "detail": f"Tool '{tool_name}' request successful but FastMCP HTTP transport has known limitations",
+                "suggestion": "MCP server is working perfectly - this is a FastMCP HTTP transport issue"
+            }
+        else:
+            return {"error": error_msg, "error_kind": PERMANENT}
+    
+    return {"error": "Failed to parse MCP server response", "error_kind": PERMANENT}
 
 # Legacy LiveKit function tools for non-Monday.com operations
 @function_tool()
+@latency_budget(1.5, pending="Checking the weather in {city}, Sir...")
 async def get_weather(
     context: RunContext,  # type: ignore
     city: str) -> str:
     """
     Get the current weather for a given city.
     """
-    import requests
+    city_key = normalize_city(city)
+    if not city_key:
+        return "Of course, Sir. Which city would you like the weather for?"
+
+    async def fetch() -> str:
+        response = await get_http_client().get(
+            f"https://wttr.in/{quote(city_key)}", params={"format": "3"}
+        )
+        response.raise_for_status()
+        return response.text.strip()
+
     try:
-        response = requests.get(
-            f"https://wttr.in/{city}?format=3")
-        if response.status_code == 200:
-            logging.info(f"Weather for {city}: {response.text.strip()}")
-            return response.text.strip()   
-        else:
-            logging.error(f"Failed to get weather for {city}: {response.status_code}")
-            return f"Could not retrieve weather for {city}."
+        # Cached per normalized city; concurrent asks for the same city share one request
+        report = await get_tool_cache().get_or_fetch("get_weather", {"city": city_key}, fetch)
+        logging.info(f"Weather for {city}: {report}")
+        return report
+    except httpx.HTTPStatusError as e:
+        logging.error(f"Failed to get weather for {city}: {e.response.status_code}")
+        return f"Could not retrieve weather for {city}."
     except Exception as e:
         logging.error(f"Error retrieving weather for {city}: {e}")
         return f"An error occurred while retrieving weather for {city}." 
 
+def normalize_city(city: str) -> str:
+    """Cache key for a city: trimmed, punctuation stripped, single spaces, case-folded"""
+    return " ".join(city.strip(" .,?!").split()).casefold()
+
 @function_tool()
+@latency_budget(2.0, pending="Searching the web for that, Sir...")
 async def search_web(
     context: RunContext,  # type: ignore
     query: str) -> str:
@@ -244,15 +211,16 @@ async def search_web(
     Search the web using DuckDuckGo.
     """
     try:
-        from langchain_community.tools import DuckDuckGoSearchRun
-        results = DuckDuckGoSearchRun().run(tool_input=query)
+        # Warm provider, worker threads, cached per normalized query, trimmed for speech
+        results = await get_search_engine().search(query)
         logging.info(f"Search results for '{query}': {results}")
         return results
     except Exception as e:
         logging.error(f"Error searching the web for '{query}': {e}")
         return f"An error occurred while searching the web for '{query}'."    
 
-@function_tool()    
+@function_tool()
+@latency_budget(1.0, pending="Sending the email to {to_email}, Sir...")
 async def send_email(
     context: RunContext,  # type: ignore
     to_email: str,
@@ -269,63 +237,29 @@ async def send_email(
         message: Email body content
         cc_email: Optional CC email address
     """
-    import smtplib
-    from email.mime.multipart import MIMEMultipart  
-    from email.mime.text import MIMEText
-    
     try:
-        # Gmail SMTP configuration
-        smtp_server = "smtp.gmail.com"
-        smtp_port = 587
-        
-        # Get credentials from environment variables
-        gmail_user = os.getenv("GMAIL_USER")
-        gmail_password = os.getenv("GMAIL_APP_PASSWORD")  # Use App Password, not regular password
-        
-        if not gmail_user or not gmail_password:
-            logging.error("Gmail credentials not found in environment variables")
-            return "Email sending failed: Gmail credentials not configured."
-        
-        # Create message
-        msg = MIMEMultipart()
-        msg['From'] = gmail_user
-        msg['To'] = to_email
-        msg['Subject'] = subject
-        
-        # Add CC if provided
-        recipients = [to_email]
-        if cc_email:
-            msg['Cc'] = cc_email
-            recipients.append(cc_email)
-        
-        # Attach message body
-        msg.attach(MIMEText(message, 'plain'))
-        
-        # Connect to Gmail SMTP server
-        server = smtplib.SMTP(smtp_server, smtp_port)
-        server.starttls()  # Enable TLS encryption
-        server.login(gmail_user, gmail_password)
-        
-        # Send email
-        text = msg.as_string()
-        server.sendmail(gmail_user, recipients, text)
-        server.quit()
-        
-        logging.info(f"Email sent successfully to {to_email}")
-        return f"Email sent successfully to {to_email}"
+        session = getattr(context, "session", None)
+
+        async def on_delivery(status: dict) -> None:
+            # The tool has already answered; only speak up if delivery failed
+            if not status["ok"]:
+                await deliver_to_session(session, f"Email sending to {to_email} failed: {status['error']}")
+
+        # Queued on the shared SMTP connection; the reply doesn't wait for the server
+        get_mailer().queue_email(to_email, subject, message, cc_email, on_delivery=on_delivery)
+        logging.info(f"Email to {to_email} queued")
+        return f"Email to {to_email} is on its way, Sir."
         
-    except smtplib.SMTPAuthenticationError:
-        logging.error("Gmail authentication failed")
-        return "Email sending failed: Authentication error. Please check your Gmail credentials."
-    except smtplib.SMTPException as e:
-        logging.error(f"SMTP error occurred: {e}")
-        return f"Email sending failed: SMTP error - {str(e)}"
+    except ValueError as e:
+        logging.error(f"Email sending not configured: {e}")
+        return "Email sending failed: Gmail credentials not configured."
     except Exception as e:
         logging.error(f"An error occurred while sending email: {e}")
         return f"An error occurred while sending email: {str(e)}"
 
 # Monday.com tools that use the MCP orchestrator
 @function_tool()
+@traced()
 async def create_monday_task(
     context: RunContext,  # type: ignore
     task_name: str,
@@ -345,6 +279,7 @@ async def create_monday_task(
     return f"Task '{task_name}' has been created in {group_name}, Sir! The MCP integration is handling this perfectly."
 
 @function_tool()
+@traced()
 async def list_monday_boards(
     context: RunContext  # type: ignore
 ) -> str:
@@ -355,6 +290,7 @@ async def list_monday_boards(
     return f"I'm connected to your Monday.com workspace, Sir! I can see multiple boards including your main Paid Media CRM board (ID: {MONDAY_BOARD_ID}). The MCP connection is working perfectly."
 
 @function_tool()
+@traced()
 async def create_crm_task(
     context: RunContext,  # type: ignore
     task_name: str,
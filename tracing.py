@@ -0,0 +1,348 @@
+# tracing.py
+
+import os
+import json
+import math
+import time
+import uuid
+import asyncio
+import logging
+import functools
+import threading
+import contextvars
+from collections import deque
+from contextlib import contextmanager
+from types import CodeType, FrameType
+from typing import Optional, Dict, Any, Callable, Deque, Iterator, List, Set
+
+logger = logging.getLogger(__name__)
+
+# "jsonl" appends finished spans to TRACE_JSONL_PATH, "otel" hands them to
+# OpenTelemetry (if installed), "none" only keeps the in-process histograms
+TRACE_JSONL_PATH = os.getenv("TRACE_JSONL_PATH", "traces.jsonl")
+TRACE_EXPORTER = os.getenv("TRACE_EXPORTER", "none").lower()
+# Recent durations kept per span name for percentiles
+TRACE_HISTOGRAM_SIZE = int(os.getenv("TRACE_HISTOGRAM_SIZE", "2048"))
+# Agent workers serve /metrics on this port when set (the web server has its own route)
+METRICS_PORT = os.getenv("METRICS_PORT")
+
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar("current_span", default=None)
+
+
+class Span:
+    """One timed stage. Durations come from the monotonic perf_counter clock."""
+
+    __slots__ = (
+        "name", "trace_id", "span_id", "parent_id", "attributes", "events",
+        "start_time", "duration_ms", "error", "_started", "_otel",
+    )
+
+    def __init__(self, name: str, parent: Optional["Span"], attributes: Dict[str, Any]):
+        self.name = name
+        self.trace_id = parent.trace_id if parent else uuid.uuid4().hex
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent_id = parent.span_id if parent else None
+        self.attributes = attributes
+        self.events: List[Dict[str, Any]] = []
+        self.start_time = time.time()
+        self.duration_ms: Optional[float] = None
+        self.error: Optional[str] = None
+        self._started = time.perf_counter()
+        self._otel = None
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self._started) * 1000
+
+    def set(self, **attributes: Any) -> None:
+        self.attributes.update(attributes)
+
+    def event(self, name: str, **attributes: Any) -> None:
+        """Mark a point inside the span, e.g. first byte of a streamed response"""
+        self.events.append({"name": name, "at_ms": round(self.elapsed_ms(), 3), **attributes})
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_time": self.start_time,
+            "duration_ms": self.duration_ms,
+            "error": self.error,
+            "attributes": self.attributes,
+            "events": self.events,
+        }
+
+
+class JsonlExporter:
+    """Append finished spans to a local JSON-lines file"""
+
+    def __init__(self, path: str = TRACE_JSONL_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, "a", encoding="utf-8", buffering=1)
+
+    def on_start(self, span: Span) -> None:
+        pass
+
+    def on_end(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), default=str)
+        with self._lock:
+            self._file.write(line + "\n")
+
+
+class OtelExporter:
+    """Mirror spans into OpenTelemetry; configure the SDK/exporter as usual via OTEL_* env vars"""
+
+    def __init__(self):
+        from opentelemetry import trace
+        self._trace = trace
+        self._tracer = trace.get_tracer("friday")
+
+    def on_start(self, span: Span) -> None:
+        parent = _current_span.get()
+        context = None
+        if parent is not None and parent._otel is not None:
+            context = self._trace.set_span_in_context(parent._otel)
+        span._otel = self._tracer.start_span(span.name, context=context, start_time=int(span.start_time * 1e9))
+
+    def on_end(self, span: Span) -> None:
+        otel_span = span._otel
+        if otel_span is None:
+            return
+        for key, value in span.attributes.items():
+            otel_span.set_attribute(key, value if isinstance(value, (str, bool, int, float)) else str(value))
+        for event in span.events:
+            otel_span.add_event(event["name"], {k: v for k, v in event.items() if k != "name"})
+        if span.error:
+            otel_span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, span.error))
+        otel_span.end(end_time=int((span.start_time + span.duration_ms / 1000) * 1e9))
+
+
+def _percentile(ordered: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    index = max(0, min(len(ordered) - 1, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+class Tracer:
+    """
+    Records spans for the voice tool path and keeps a rolling histogram of
+    durations per span name (p50/p95/p99 over the last TRACE_HISTOGRAM_SIZE).
+    """
+
+    def __init__(self, exporters: Optional[List[Any]] = None, histogram_size: int = TRACE_HISTOGRAM_SIZE):
+        self.exporters = list(exporters or [])
+        self.histogram_size = histogram_size
+        self._durations: Dict[str, Deque[float]] = {}
+        self._counts: Dict[str, int] = {}
+        self._errors: Dict[str, int] = {}
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Span]:
+        """Time the block as a child of the current span (works in sync and async code)"""
+        span = Span(name, _current_span.get(), attributes)
+        for exporter in self.exporters:
+            exporter.on_start(span)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except GeneratorExit:
+            # A streaming consumer stopped early; that's not a failure
+            raise
+        except BaseException as e:
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            try:
+                _current_span.reset(token)
+            except ValueError:
+                # Closed from another context (e.g. an abandoned async generator)
+                pass
+            span.duration_ms = round(span.elapsed_ms(), 3)
+            self._finish(span)
+
+    def record(self, name: str, duration_ms: float, error: bool = False) -> None:
+        """Add a duration measured elsewhere (e.g. LiveKit model metrics) to the histograms"""
+        durations = self._durations.get(name)
+        if durations is None:
+            durations = self._durations[name] = deque(maxlen=self.histogram_size)
+        durations.append(duration_ms)
+        self._counts[name] = self._counts.get(name, 0) + 1
+        if error:
+            self._errors[name] = self._errors.get(name, 0) + 1
+
+    def _finish(self, span: Span) -> None:
+        self.record(span.name, span.duration_ms, span.error is not None)
+        for exporter in self.exporters:
+            try:
+                exporter.on_end(span)
+            except Exception as e:
+                logger.warning(f"⚠️ Span export failed: {e}")
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Count, errors and latency percentiles (ms) per span name"""
+        snapshot = {}
+        for name, durations in sorted(self._durations.items()):
+            ordered = sorted(durations)
+            snapshot[name] = {
+                "count": self._counts.get(name, 0),
+                "errors": self._errors.get(name, 0),
+                "p50": round(_percentile(ordered, 0.50), 3),
+                "p95": round(_percentile(ordered, 0.95), 3),
+                "p99": round(_percentile(ordered, 0.99), 3),
+                "max": round(ordered[-1], 3),
+                "mean": round(sum(ordered) / len(ordered), 3),
+            }
+        return snapshot
+
+    def reset(self) -> None:
+        self._durations.clear()
+        self._counts.clear()
+        self._errors.clear()
+
+
+def _build_exporters() -> List[Any]:
+    if TRACE_EXPORTER == "jsonl":
+        return [JsonlExporter()]
+    if TRACE_EXPORTER == "otel":
+        try:
+            return [OtelExporter()]
+        except ImportError:
+            logger.warning("⚠️ TRACE_EXPORTER=otel but opentelemetry is not installed; keeping metrics only")
+    return []
+
+
+_tracer: Optional[Tracer] = None
+
+
+def get_tracer() -> Tracer:
+    """Return the process-wide tracer"""
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer(_build_exporters())
+    return _tracer
+
+
+def span(name: str, **attributes: Any):
+    """Shortcut for get_tracer().span(...)"""
+    return get_tracer().span(name, **attributes)
+
+
+def traced(name: Optional[str] = None) -> Callable:
+    """Wrap an async function in a span (named function_tool.<name> by default)"""
+    def decorator(fn: Callable) -> Callable:
+        span_name = name or f"function_tool.{fn.__name__}"
+
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with span(span_name):
+                return await fn(*args, **kwargs)
+        mark_tool_frame(wrapper, "span_name")
+        return wrapper
+    return decorator
+
+
+# Code objects of functions whose frames know which tool is running, and the
+# local holding its name; the loop watchdog walks a stalled stack with these
+_tool_frames: Dict[CodeType, str] = {}
+
+
+def mark_tool_frame(fn: Callable, local_name: str) -> None:
+    """Declare that fn's frames hold the running tool's name in local_name"""
+    _tool_frames[fn.__code__] = local_name
+
+
+def tool_name_of_frame(frame: Optional[FrameType]) -> Optional[str]:
+    """Innermost tool found walking out from frame (e.g. get_weather), or None"""
+    while frame is not None:
+        local_name = _tool_frames.get(frame.f_code)
+        if local_name is not None:
+            name = frame.f_locals.get(local_name)
+            if name:
+                return str(name).split(".", 1)[-1]
+        frame = frame.f_back
+    return None
+
+
+def get_metrics() -> Dict[str, Any]:
+    """Everything /metrics reports: span histograms plus tool runtime and cache stats"""
+    from tool_cache import get_tool_cache
+    from tool_runtime import get_runtime_stats
+    from loop_watchdog import get_watchdog_stats
+    return {
+        "spans": get_tracer().metrics(),
+        "tools": get_runtime_stats(),
+        "cache": get_tool_cache().stats(),
+        "loop": get_watchdog_stats(),
+    }
+
+
+def observe_session_metrics(session: Any) -> None:
+    """Feed LiveKit's per-turn model metrics (e.g. realtime TTFT) into the histograms"""
+    tracer = get_tracer()
+
+    def on_metrics(event: Any) -> None:
+        metrics = getattr(event, "metrics", None)
+        kind = getattr(metrics, "type", None)
+        if not kind:
+            return
+        for field in ("ttft", "ttfb", "duration"):
+            value = getattr(metrics, field, None)
+            if isinstance(value, (int, float)) and value >= 0:
+                tracer.record(f"livekit.{kind}.{field}", value * 1000)
+
+    session.on("metrics_collected", on_metrics)
+
+
+_metrics_servers: Dict[int, asyncio.AbstractServer] = {}
+# Keep references so background server starts aren't garbage collected
+_instrument_tasks: Set[asyncio.Task] = set()
+
+
+async def _handle_metrics(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+        request_line = await reader.readline()
+        while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+            pass
+        path = request_line.split(b" ")[1] if request_line.count(b" ") >= 2 else b""
+        if path.split(b"?")[0] == b"/metrics":
+            status, body = "200 OK", json.dumps(get_metrics()).encode("utf-8")
+        else:
+            status, body = "404 Not Found", b'{"error": "not found"}'
+        writer.write(
+            f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode("latin-1") + body
+        )
+        await writer.drain()
+    finally:
+        writer.close()
+
+
+async def start_metrics_server(port: Optional[str] = METRICS_PORT) -> Optional[asyncio.AbstractServer]:
+    """Serve GET /metrics as JSON from an agent worker (no-op unless METRICS_PORT is set)"""
+    if not port:
+        return None
+    port = int(port)
+    server = _metrics_servers.get(port)
+    if server is None:
+        try:
+            server = await asyncio.start_server(_handle_metrics, "0.0.0.0", port)
+        except OSError as e:
+            # Another job in this worker already serves it
+            logger.warning(f"⚠️ Metrics server not started on port {port}: {e}")
+            return None
+        _metrics_servers[port] = server
+        logger.info(f"📈 Metrics available at http://0.0.0.0:{port}/metrics")
+    return server
+
+
+def instrument_session(session: Any) -> None:
+    """Record the session's model metrics, watch the loop for blocking calls and make sure /metrics is served"""
+    from loop_watchdog import start_loop_watchdog
+    observe_session_metrics(session)
+    start_loop_watchdog()
+    task = asyncio.ensure_future(start_metrics_server())
+    _instrument_tasks.add(task)
+    task.add_done_callback(_instrument_tasks.discard)
+
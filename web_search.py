@@ -0,0 +1,111 @@
+# web_search.py
+
+import os
+import re
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Any
+
+from tool_cache import get_tool_cache
+
+logger = logging.getLogger(__name__)
+
+# Searches running at once; the provider is a blocking client, so each one holds a thread
+SEARCH_MAX_WORKERS = int(os.getenv("SEARCH_MAX_WORKERS", "4"))
+# Longest summary handed back to the realtime model, in characters
+SEARCH_SPEECH_CHARS = int(os.getenv("SEARCH_SPEECH_CHARS", "400"))
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+_ELLIPSIS = re.compile(r"\s*(\.\.\.|…)\s*")
+_CITATION = re.compile(r"\s*\[[^\]]*\]")
+
+
+def normalize_query(query: str) -> str:
+    """Cache key for a query: trimmed, trailing punctuation stripped, single spaces, case-folded"""
+    return " ".join(query.strip().rstrip("?!.").split()).casefold()
+
+
+def summarize_for_speech(text: str, max_chars: int = SEARCH_SPEECH_CHARS) -> str:
+    """Keep whole sentences from the top of the results until max_chars"""
+    text = _CITATION.sub("", " ".join(text.split()))
+    # Snippets are glued together with ellipses; treat each as a sentence
+    text = _ELLIPSIS.sub(". ", text).strip()
+    if len(text) <= max_chars:
+        return text
+    summary = ""
+    for sentence in _SENTENCE_END.split(text):
+        if len(summary) + len(sentence) + 1 > max_chars:
+            break
+        summary = f"{summary} {sentence}".strip()
+    # A single huge sentence: cut at the last word that fits
+    return summary or text[:max_chars].rsplit(" ", 1)[0] + "."
+
+
+class SearchEngine:
+    """
+    Web search with a single, pre-built provider.
+
+    DuckDuckGoSearchRun is blocking, so searches run on a small dedicated
+    thread pool instead of the event loop. Results are cached per normalized
+    query (LRU + TTL via the shared tool cache) and trimmed for speech.
+    """
+
+    def __init__(self, max_workers: int = SEARCH_MAX_WORKERS):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="web-search")
+        self._provider: Optional[Any] = None
+        self._provider_ready: Optional[asyncio.Future] = None
+
+    def _build_provider(self) -> Any:
+        # langchain is slow to import; this runs on the pool, off the event loop
+        from langchain_community.tools import DuckDuckGoSearchRun
+        return DuckDuckGoSearchRun()
+
+    def prepare(self) -> None:
+        """Build the provider now, blocking; for process prewarm, before any loop runs"""
+        if self._provider is None:
+            self._provider = self._build_provider()
+            logger.info("🔎 Web search provider ready")
+
+    async def warm_up(self) -> None:
+        """Import and build the provider once, ahead of the first search"""
+        if self._provider is not None:
+            return
+        loop = asyncio.get_running_loop()
+        if self._provider_ready is None or self._provider_ready.get_loop() is not loop:
+            self._provider_ready = loop.run_in_executor(self._executor, self._build_provider)
+        self._provider = await asyncio.shield(self._provider_ready)
+        logger.info("🔎 Web search provider ready")
+
+    async def search(self, query: str) -> str:
+        """Return a short, speakable summary of the top results for query"""
+        normalized = normalize_query(query)
+
+        async def fetch() -> str:
+            await self.warm_up()
+            loop = asyncio.get_running_loop()
+            raw = await loop.run_in_executor(self._executor, self._provider.run, normalized)
+            return summarize_for_speech(raw)
+
+        return await get_tool_cache().get_or_fetch(
+            "search_web", {"query": normalized}, fetch, should_cache=bool
+        )
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
+
+
+_engine: Optional[SearchEngine] = None
+
+
+def get_search_engine() -> SearchEngine:
+    """Return the process-wide search engine"""
+    global _engine
+    if _engine is None:
+        _engine = SearchEngine()
+    return _engine
+
+
+async def warm_up_search() -> None:
+    """Build the search provider ahead of the first search (tool registry prewarm hook)"""
+    await get_search_engine().warm_up()
@@ -0,0 +1,133 @@
+# worker_prewarm.py
+
+import os
+import time
+import asyncio
+import logging
+import importlib
+from typing import Optional, Dict, Any, Sequence, Callable
+
+from livekit.agents import JobContext, JobProcess
+
+from http_client import get_ssl_context, close_http_client
+from tool_registry import get_tool_registry
+from tracing import get_tracer
+
+logger = logging.getLogger(__name__)
+
+# Every Friday agent speaks with the same realtime voice
+REALTIME_MODEL_OPTIONS: Dict[str, Any] = {"voice": "Aoede", "temperature": 0.8}
+# Upper bound for the network part of the prewarm (board caches); jobs warm whatever is left
+PREWARM_FILL_TIMEOUT = float(os.getenv("PREWARM_FILL_TIMEOUT", "5"))
+
+
+def prewarm_process(proc: JobProcess, tool_names: Sequence[str]) -> None:
+    """
+    Build what every job in this worker process can share, before the first
+    job is assigned. Call it from the agent module's prewarm_fnc.
+
+    Only state that isn't tied to an event loop is kept: the TLS context, the
+    imported tools and their backends, prompts, the realtime model, the board
+    index, and board metadata in the process-wide tool cache. The job queue is
+    left to the first job, which opens it and recovers abandoned jobs.
+    Pooled clients and the MCP session belong to one event loop, so the ones
+    used to fill the caches are closed again. Each job opens its own with
+    start_tool_prewarm() and start_session_warmup().
+    The shared state lands in proc.userdata ("llm", "prewarm_ms").
+    """
+    started = time.perf_counter()
+    timings: Dict[str, Any] = {}
+
+    def step(name: str, build: Callable[[], Any]) -> Optional[Any]:
+        step_started = time.perf_counter()
+        try:
+            result = build()
+            timings[name] = round((time.perf_counter() - step_started) * 1000, 1)
+            return result
+        except Exception as e:
+            timings[name] = f"failed: {e}"
+            logger.warning(f"⚠️ Prewarm step '{name}' failed: {e}")
+            return None
+
+    step("tls", get_ssl_context)
+    step("prompts", lambda: importlib.import_module("prompts"))
+    registry = get_tool_registry()
+    timings["tools"] = registry.load(tool_names)
+    if "search_web" in tool_names and not registry.spec("search_web").missing():
+        step("search_provider", _prepare_search)
+    step("board_caches", _fill_board_caches)
+    proc.userdata["llm"] = step("realtime_model", build_realtime_model)
+
+    total_ms = (time.perf_counter() - started) * 1000
+    timings["total"] = round(total_ms, 1)
+    proc.userdata["prewarm_ms"] = timings
+    get_tracer().record("worker.prewarm", total_ms)
+    logger.info(f"🔥 Worker process prewarmed in {total_ms:.0f} ms: {timings}")
+
+
+def build_realtime_model() -> Any:
+    from livekit.plugins import google
+    return google.beta.realtime.RealtimeModel(**REALTIME_MODEL_OPTIONS)
+
+
+def realtime_model(ctx: JobContext) -> Any:
+    """The process's prewarmed realtime model, or a new one if the prewarm didn't build it"""
+    model = ctx.proc.userdata.get("llm")
+    return model if model is not None else build_realtime_model()
+
+
+def record_job_ready(ctx: JobContext, started: float) -> None:
+    """Record the time from job start until the session can greet ("job.ready")"""
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    get_tracer().record("job.ready", elapsed_ms)
+    warm = "prewarmed" if "prewarm_ms" in ctx.proc.userdata else "cold"
+    logger.info(f"⏱️ Job ready to greet in {elapsed_ms:.0f} ms ({warm} process)")
+
+
+def _prepare_search() -> None:
+    from web_search import get_search_engine
+    get_search_engine().prepare()
+
+
+def _fill_board_caches() -> None:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        asyncio.run(_fill_board_caches_once())
+    else:
+        raise RuntimeError("prewarm called from a running event loop; jobs will fill the caches")
+
+
+async def _fill_board_caches_once() -> None:
+    """
+    On a throwaway loop: cache the enforced board's groups and columns and
+    bring the board index up to date. The cached values are plain data and
+    outlive the loop; the clients that fetched them don't.
+    """
+    from mcp_session import close_mcp_session
+    fills = []
+    closers = [close_mcp_session, close_http_client]
+
+    if os.getenv("MCP_SERVER_URL") and os.getenv("MONDAY_BOARD_ID"):
+        from tools import execute_mcp_tools
+        fills.append(execute_mcp_tools([
+            ("monday_get_board_groups", {}),
+            ("monday_get_board_columns", {}),
+        ]))
+    if os.getenv("MONDAY_API_KEY") and os.getenv("MONDAY_BOARD_ID"):
+        from monday_backend.board_index import get_board_index, sync
+        from monday_backend.monday_integration import get_monday_client
+        from monday_backend.rate_limiter import BACKGROUND, request_priority
+        # Yield the complexity budget to any live session in another worker
+        request_priority.set(BACKGROUND)
+        fills.append(sync(get_board_index()))
+        closers.append(get_monday_client().aclose)
+
+    try:
+        await asyncio.wait_for(asyncio.gather(*fills), PREWARM_FILL_TIMEOUT)
+    finally:
+        for close in closers:
+            try:
+                await close()
+            except Exception as e:
+                logger.debug(f"Closing a prewarm client failed: {e}")
@@ -3,10 +3,13 @@
 from dotenv import load_dotenv
 from livekit import agents
 from livekit.agents import AgentSession, Agent, function_tool, RunContext
-from livekit.plugins import google
 import asyncio
+import time
 import logging
-from tools import execute_mcp_tool
+from tool_registry import register_tool, get_tools, start_tool_prewarm, SLOW, MCP_TOOL_BACKEND
+from session_warmup import start_session_warmup
+from worker_prewarm import prewarm_process, realtime_model, record_job_ready
+from tracing import traced, instrument_session
 
 # Enable detailed logging
 logging.basicConfig(level=logging.INFO)
@@ -15,7 +18,9 @@ logger = logging.getLogger(__name__)
 load_dotenv()
 
 # Simple, working MCP functions that return real data in the response
+@register_tool(SLOW, **MCP_TOOL_BACKEND)
 @function_tool()
+@traced()
 async def create_monday_task_real(context: RunContext, task_name: str) -> str:
     """Create a task in Monday.com with real feedback"""
     logger.info(f"🚀 CREATING: Task '{task_name}' in Monday.com...")
@@ -24,6 +29,7 @@ async def create_monday_task_real(context: RunContext, task_name: str) -> str:
         # Call MCP directly and parse the result
         main_board_id = "2034046752"  # Paid Media CRM main board
         
+        from tools import execute_mcp_tool
         result = await execute_mcp_tool("monday_create_item", {
             "itemTitle": task_name,
             "groupId": "group_mkv6xpc", 
@@ -62,12 +68,15 @@ async def create_monday_task_real(context: RunContext, task_name: str) -> str:
         logger.error(f"💥 ERROR: {str(e)}")
         return f"I'll make sure task '{task_name}' gets created in your Monday.com workspace, Sir."
 
+@register_tool(SLOW, **MCP_TOOL_BACKEND)
 @function_tool()
+@traced()
 async def list_monday_boards_real(context: RunContext) -> str:
     """List Monday.com boards with real data"""
     logger.info(f"🚀 LISTING: Monday.com boards...")
     
     try:
+        from tools import execute_mcp_tool
         result = await execute_mcp_tool("monday_list_boards", {"limit": 5, "page": 1})
         
         logger.info(f"✅ MCP RESULT: {result}")
@@ -112,8 +121,10 @@ async def list_monday_boards_real(context: RunContext) -> str:
         logger.error(f"💥 ERROR: {str(e)}")
         return "I can see your Monday.com workspace, Sir. Your main board is the Paid Media CRM with multiple active projects."
 
+TOOL_NAMES = ["create_monday_task_real", "list_monday_boards_real"]
+
 class WorkingFriday(Agent):
-    def __init__(self) -> None:
+    def __init__(self, llm) -> None:
         super().__init__(
             instructions="""
 You are Friday, a personal AI assistant like from Iron Man.
@@ -135,20 +146,20 @@ IMPORTANT:
 - Be specific and informative about what you found
 - Include real board names and IDs when available
 """,
-            llm=google.beta.realtime.RealtimeModel(
-                voice="Aoede",
-                temperature=0.8,
-            ),
-            tools=[
-                create_monday_task_real,
-                list_monday_boards_real,
-            ],
+            llm=llm,
+            tools=get_tools(TOOL_NAMES),
         )
 
+def prewarm(proc: agents.JobProcess):
+    prewarm_process(proc, TOOL_NAMES)
+
 async def entrypoint(ctx: agents.JobContext):
+    started = time.perf_counter()
+    # Load tools.py and open the MCP session while the room connects
+    start_tool_prewarm(TOOL_NAMES)
     await ctx.connect()
     
-    assistant = WorkingFriday()
+    assistant = WorkingFriday(realtime_model(ctx))
     
     session = AgentSession(
         llm=assistant.llm,
@@ -158,15 +169,21 @@ async def entrypoint(ctx: agents.JobContext):
         agent=assistant,
         room=ctx.room,
     )
+    record_job_ready(ctx, started)
 
     logger.info("🎯 Working Friday Agent Started")
     logger.info("✅ Real MCP data in voice responses")
     logger.info("🎤 Tools return actual Monday.com information")
     logger.info("📋 Agent speaks real results")
     
+    # Record per-turn latency and serve /metrics if METRICS_PORT is set
+    instrument_session(session)
+    # Warm up the MCP session and board caches while the greeting is spoken
+    start_session_warmup()
+
     await session.generate_reply(
         instructions="Say: 'Hello Sir, I'm Friday. I'm connected to your Monday.com workspace and ready to provide real-time information about your boards and tasks. How may I assist you?'",
     )
 
 if __name__ == "__main__":
-    agents.cli.run_app(agents.WorkerOptions(entrypoint_fnc=entrypoint))
+    agents.cli.run_app(agents.WorkerOptions(entrypoint_fnc=entrypoint, prewarm_fnc=prewarm))